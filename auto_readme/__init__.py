@@ -18,18 +18,40 @@ Example:
     >>> readme_content = generate_readme(config)
 """
 
+from typing import TYPE_CHECKING, Any
+
 __version__ = "1.0.0"
 __author__ = "Abdullah Ridwan"
 __email__ = "abdullah.ridwan@stratumresearch.com"
 
-# Public API
-from .generator import (
-    generate_citation,
-    generate_license,
-    generate_readme,
-    load_config,
-    write_output,
-)
+if TYPE_CHECKING:
+    from .generator import (
+        generate_citation,
+        generate_license,
+        generate_readme,
+        load_config,
+        write_output,
+    )
+
+# Public API, imported lazily so that lightweight entry points (such as the
+# pre-commit hook) do not pay for importing Jinja2 and PyYAML.
+_GENERATOR_API = {
+    "generate_citation",
+    "generate_license",
+    "generate_readme",
+    "load_config",
+    "write_output",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve public API names from the generator module on first access."""
+    if name in _GENERATOR_API:
+        from . import generator
+
+        return getattr(generator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "generate_citation",
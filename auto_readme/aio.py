@@ -0,0 +1,321 @@
+"""
+Asyncio API for rendering projects inside an event loop.
+
+The functions here mirror :mod:`auto_readme.generator`,
+:mod:`auto_readme.config` and :mod:`auto_readme.integration` without blocking
+the loop: config parsing, template loading, cache lookups and file writes run
+in worker threads, and the README is rendered with Jinja's async rendering.
+Nothing is printed; every outcome is returned as a result object.
+
+Example:
+    >>> from auto_readme import aio
+    >>> config = await aio.load_config("config.yaml", root)
+    >>> outputs = await aio.render_all(config, root)
+    >>> results = await aio.render_projects(roots, concurrency=8, write=True)
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from jinja2 import Environment
+
+from . import config as config_module
+from .assets import readme_assets
+from .badges import badge_files, readme_badges, write_badges
+from .cache import RenderCache, render_cache
+from .generator import (
+    generate_citation,
+    generate_license,
+    output_is_current,
+    write_output,
+)
+from .sinks import OutputSink
+from .template_loader import get_environment, template_digest, template_search_path
+
+ConfigDict = Dict[str, Any]
+PathLike = Union[str, Path]
+
+# Projects processed at once by render_projects
+DEFAULT_CONCURRENCY = 8
+
+
+@dataclass
+class IntegrationResult:
+    """Outcome of setting up one integration."""
+
+    name: str
+    ok: bool
+    message: Optional[str] = None
+    requirements: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+@dataclass
+class ProjectResult:
+    """Outcome of rendering one project."""
+
+    root: Path
+    outputs: Dict[str, str] = field(default_factory=dict)
+    written: List[str] = field(default_factory=list)
+    integrations: List[IntegrationResult] = field(default_factory=list)
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the project and all of its integrations succeeded."""
+        return self.error is None and all(i.ok for i in self.integrations)
+
+
+async def load_config(
+    config_path: str = "config.yaml", root: PathLike = "."
+) -> ConfigDict:
+    """
+    Load a project's configuration in a worker thread.
+
+    Args:
+        config_path: Config file, relative to the root.
+        root: Project root directory.
+
+    Returns:
+        The merged configuration.
+
+    Raises:
+        FileNotFoundError: If no config file can be found.
+        ValueError: If the config is invalid.
+    """
+    return await asyncio.to_thread(config_module.load_config, config_path, root)
+
+
+async def render_template(
+    env: Environment,
+    name: str,
+    context: Dict[str, Any],
+    cache: Optional[RenderCache] = None,
+) -> str:
+    """
+    Render a template asynchronously, reusing an identical cached render.
+
+    Args:
+        env: Environment created with ``enable_async=True``.
+        name: Template name.
+        context: Template variables; they form part of the cache key.
+        cache: Render cache to use; defaults to the user-level cache.
+
+    Returns:
+        Rendered text.
+
+    Raises:
+        jinja2.TemplateNotFound: If the template cannot be found.
+    """
+    cache = cache or render_cache()
+    digest = None
+    if cache is not None:
+        digest = await asyncio.to_thread(template_digest, env, name)
+    if cache is None or digest is None:
+        template = await asyncio.to_thread(env.get_template, name)
+        return await template.render_async(**context)
+
+    key = cache.key(name, digest, context)
+    cached = await asyncio.to_thread(cache.get, key)
+    if cached is not None:
+        return cached.decode("utf-8")
+
+    template = await asyncio.to_thread(env.get_template, name)
+    content = await template.render_async(**context)
+    await asyncio.to_thread(cache.put, key, content.encode("utf-8"))
+    return content
+
+
+async def render_readme(config: ConfigDict, root: PathLike = ".") -> str:
+    """
+    Render a project's README.
+
+    Args:
+        config: Configuration dictionary containing project metadata.
+        root: Project root directory used to find template overrides and assets.
+
+    Returns:
+        Generated README content.
+    """
+    env = get_environment(template_search_path(config, root), enable_async=True)
+    badge_paths = {name: badge.path for name, badge in readme_badges(config).items()}
+    context = {
+        **config,
+        "badge_paths": badge_paths,
+        "image_variants": await asyncio.to_thread(readme_assets, config, root),
+    }
+    return await render_template(env, "readme.md.j2", context)
+
+
+async def render_all(config: ConfigDict, root: PathLike = ".") -> Dict[str, str]:
+    """
+    Render every generated repository file for a project.
+
+    Args:
+        config: Configuration dictionary containing project metadata.
+        root: Project root directory used to find template overrides and assets.
+
+    Returns:
+        Mapping of filename (relative to the project root) to content, the
+        same files as :func:`auto_readme.generator.render_outputs`.
+    """
+    return {
+        "README.md": await render_readme(config, root),
+        "LICENSE": generate_license(config),
+        "citation.bib": generate_citation(config),
+    }
+
+
+async def write_outputs(
+    outputs: Dict[str, str],
+    root: PathLike = ".",
+    sink: Optional[OutputSink] = None,
+) -> List[str]:
+    """
+    Write rendered files in a worker thread.
+
+    Args:
+        outputs: Mapping of filename to content.
+        root: Project root; only files whose content changed are written.
+        sink: Write every file here instead of into the project.
+
+    Returns:
+        Filenames that were written.
+    """
+
+    def write() -> List[str]:
+        written = []
+        for filename, content in outputs.items():
+            if sink is None and output_is_current(filename, content, root):
+                continue
+            write_output(filename, content, root, sink=sink)
+            written.append(filename)
+        return written
+
+    return await asyncio.to_thread(write)
+
+
+async def setup_integrations(
+    config: ConfigDict,
+    root: PathLike = ".",
+    sink: Optional[OutputSink] = None,
+) -> List[IntegrationResult]:
+    """
+    Set up the applicable integrations for a project without printing.
+
+    A failing integration is reported in its result and does not stop the
+    others.
+
+    Args:
+        config: Configuration dictionary containing project metadata.
+        root: Project root directory.
+        sink: Where to write integration files; defaults to the project root.
+
+    Returns:
+        One result per applicable integration.
+    """
+    from .integration import INTEGRATIONS, project_context
+
+    project = await asyncio.to_thread(project_context, config, root, sink)
+
+    def setup(integration_class: Any) -> Optional[IntegrationResult]:
+        integration = integration_class()
+        if not integration.is_applicable(project):
+            return None
+        try:
+            message = integration.setup(project)
+        except Exception as e:
+            return IntegrationResult(integration.name, False, error=str(e))
+        return IntegrationResult(
+            integration.name, True, message, integration.get_requirements()
+        )
+
+    results = await asyncio.gather(
+        *(asyncio.to_thread(setup, cls) for cls in INTEGRATIONS)
+    )
+    return [result for result in results if result is not None]
+
+
+async def render_project(
+    root: PathLike,
+    config_path: str = "config.yaml",
+    write: bool = False,
+    integrations: bool = False,
+    sink: Optional[OutputSink] = None,
+) -> ProjectResult:
+    """
+    Load, render and optionally write one project, capturing any error.
+
+    Args:
+        root: Project root directory.
+        config_path: Config file, relative to the root.
+        write: Write the rendered files (only those that changed) and the
+               badge files the README references.
+        integrations: Also set up the applicable integrations.
+        sink: Write files, including badges, here instead of into the project.
+
+    Returns:
+        The project's result.
+    """
+    start = time.perf_counter()
+    result = ProjectResult(Path(root))
+    try:
+        config = await load_config(config_path, root)
+        result.outputs = await render_all(config, root)
+        if sink is not None:
+            outputs = {**result.outputs, **badge_files(config)}
+            result.written = await write_outputs(outputs, root, sink)
+        elif write:
+            result.written = await write_outputs(result.outputs, root)
+            result.written += await asyncio.to_thread(write_badges, config, root)
+        if integrations:
+            result.integrations = await setup_integrations(config, root, sink)
+    except Exception as e:
+        result.error = str(e)
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+async def render_projects(
+    roots: Sequence[PathLike],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    config_path: str = "config.yaml",
+    write: bool = False,
+    integrations: bool = False,
+    sink: Optional[OutputSink] = None,
+) -> List[ProjectResult]:
+    """
+    Render many projects concurrently in the running event loop.
+
+    Args:
+        roots: Project root directories.
+        concurrency: Maximum projects processed at once.
+        config_path: Config file, relative to each root.
+        write: Write each project's rendered files.
+        integrations: Also set up each project's integrations.
+        sink: Shared output destination; each project's files go under its
+              path relative to the roots' common parent directory.
+
+    Returns:
+        One result per project, in the order the roots were given.
+
+    Raises:
+        ValueError: If two projects would write to the same directory of the
+                    sink.
+    """
+    from .batch import sink_prefixes
+
+    semaphore = asyncio.Semaphore(concurrency)
+    sinks: List[Optional[OutputSink]] = [None] * len(roots)
+    if sink is not None:
+        sinks = [sink.scoped(prefix) for prefix in sink_prefixes(roots)]
+
+    async def run(root: PathLike, scoped: Optional[OutputSink]) -> ProjectResult:
+        async with semaphore:
+            return await render_project(root, config_path, write, integrations, scoped)
+
+    return list(await asyncio.gather(*map(run, roots, sinks)))
@@ -0,0 +1,261 @@
+"""
+Responsive image variants for the README logo and banner.
+
+The README shows the logo at 150px height and the banner at up to 800px
+width, but ``logo_path`` and ``banner_path`` often point at full-resolution
+originals. This stage writes resized, recompressed variants (1x/2x for the
+logo, 400/800/1600px wide for the banner) under ``config/assets/generated/``
+and a manifest the README template uses to emit ``srcset`` attributes.
+
+Variants are keyed by the SHA-256 of their source, so an unchanged image is
+never reprocessed; sources are processed in parallel. Resizing needs Pillow
+(``pip install auto-research-readme[images]``), but rendering the README from
+an existing manifest does not.
+"""
+
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+ConfigDict = Dict[str, Any]
+
+ASSET_DIR = "config/assets/generated"
+MANIFEST_FILE = "manifest.json"
+
+# Bump when resizing or encoding settings change, to force reprocessing
+PIPELINE_VERSION = 1
+
+_SAVE_OPTIONS: Dict[str, Dict[str, Any]] = {
+    "PNG": {"optimize": True},
+    "JPEG": {"quality": 85, "optimize": True, "progressive": True},
+    "WEBP": {"quality": 85, "method": 6},
+}
+
+
+@dataclass(frozen=True)
+class AssetSpec:
+    """How an image referenced by the config is displayed in the README."""
+
+    key: str
+    config_field: str
+    dimension: str  # "width" or "height"
+    size: int  # displayed size along that dimension, in CSS pixels
+    densities: Tuple[float, ...]
+    descriptor: str  # srcset descriptor: "x" (density) or "w" (width)
+
+
+ASSET_SPECS = (
+    AssetSpec("logo", "logo_path", "height", 150, (1, 2), "x"),
+    AssetSpec("banner", "banner_path", "width", 800, (0.5, 1, 2), "w"),
+)
+
+
+def file_sha256(path: Union[str, Path]) -> str:
+    """Hash a file's content."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def variant_sizes(spec: AssetSpec, width: int, height: int) -> List[Tuple[int, int]]:
+    """
+    Compute variant dimensions for a source image, never upscaling.
+
+    Args:
+        spec: Asset display settings.
+        width: Source width in pixels.
+        height: Source height in pixels.
+
+    Returns:
+        Distinct (width, height) pairs, smallest first.
+    """
+    source = width if spec.dimension == "width" else height
+    sizes = set()
+    for density in spec.densities:
+        target = min(round(spec.size * density), source)
+        scale = target / source
+        sizes.add((max(1, round(width * scale)), max(1, round(height * scale))))
+    return sorted(sizes)
+
+
+def load_manifest(root: Union[str, Path] = ".") -> Dict[str, Any]:
+    """Read the asset manifest, or return an empty one."""
+    try:
+        path = Path(root) / ASSET_DIR / MANIFEST_FILE
+        return dict(json.loads(path.read_text(encoding="utf-8")))
+    except (OSError, ValueError):
+        return {}
+
+
+def build_assets(
+    config: ConfigDict, root: Union[str, Path] = ".", jobs: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Produce image variants for the config's logo and banner.
+
+    Sources whose hash matches the manifest (and whose variants exist) are
+    skipped. Variant files no longer referenced are removed.
+
+    Args:
+        config: Project configuration dictionary.
+        root: Project root directory.
+        jobs: Maximum images processed in parallel.
+
+    Returns:
+        The updated manifest.
+
+    Raises:
+        ImportError: If an image needs processing and Pillow is not installed.
+    """
+    root_path = Path(root)
+    manifest = load_manifest(root)
+    updated: Dict[str, Any] = {}
+    pending = []
+
+    for spec in ASSET_SPECS:
+        source = config.get(spec.config_field)
+        if not source or not (root_path / source).is_file():
+            continue
+        digest = file_sha256(root_path / source)
+        entry = manifest.get(spec.key)
+        if _entry_is_current(entry, source, digest, root_path):
+            updated[spec.key] = entry
+        else:
+            pending.append((spec, source, digest))
+
+    if pending:
+        _require_pillow()
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                spec.key: executor.submit(_process, spec, source, digest, root_path)
+                for spec, source, digest in pending
+            }
+            updated.update({key: future.result() for key, future in futures.items()})
+
+    _prune(updated, root_path)
+    if updated != manifest:
+        path = root_path / ASSET_DIR / MANIFEST_FILE
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps(updated, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+        )
+    return updated
+
+
+def readme_assets(config: ConfigDict, root: Union[str, Path] = ".") -> Dict[str, Any]:
+    """
+    Get the ``<img>`` attributes for processed assets.
+
+    Only assets whose manifest entry matches the current source file are
+    returned, so stale variants are never referenced.
+
+    Args:
+        config: Project configuration dictionary.
+        root: Project root directory.
+
+    Returns:
+        Mapping of asset key to ``src``, ``srcset`` and ``sizes`` values.
+    """
+    root_path = Path(root)
+    manifest = load_manifest(root)
+    assets = {}
+    for spec in ASSET_SPECS:
+        entry = manifest.get(spec.key)
+        source = config.get(spec.config_field)
+        if not entry or entry.get("source") != source:
+            continue
+        if not (root_path / source).is_file():
+            continue
+        if entry.get("sha256") != file_sha256(root_path / source):
+            continue
+
+        # Fallback src: the largest variant not exceeding the displayed size
+        variants = entry["variants"]
+        displayed = [v for v in variants if v[spec.dimension] <= spec.size]
+        src = displayed[-1]["path"] if displayed else variants[0]["path"]
+        if spec.descriptor == "w":
+            srcset = ", ".join(f"{v['path']} {v['width']}w" for v in variants)
+            sizes = f"(max-width: {spec.size}px) 100vw, {spec.size}px"
+        else:
+            srcset = ", ".join(
+                f"{v['path']} {v[spec.dimension] / spec.size:g}x" for v in variants
+            )
+            sizes = ""
+        assets[spec.key] = {"src": src, "srcset": srcset, "sizes": sizes}
+    return assets
+
+
+def _entry_is_current(
+    entry: Optional[Dict[str, Any]], source: str, digest: str, root: Path
+) -> bool:
+    """Check whether a manifest entry was produced from this exact source."""
+    return bool(
+        entry
+        and entry.get("source") == source
+        and entry.get("sha256") == digest
+        and entry.get("version") == PIPELINE_VERSION
+        and all((root / v["path"]).is_file() for v in entry.get("variants", []))
+    )
+
+
+def _process(spec: AssetSpec, source: str, digest: str, root: Path) -> Dict[str, Any]:
+    """Resize and recompress one source image."""
+    from PIL import Image, ImageOps
+
+    with Image.open(root / source) as original:
+        image_format = original.format or "PNG"
+        image = ImageOps.exif_transpose(original)
+        image.load()
+
+    if image_format not in _SAVE_OPTIONS:
+        image_format = "PNG"
+    if image_format == "JPEG" and image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    extension = ".jpg" if image_format == "JPEG" else f".{image_format.lower()}"
+
+    variants = []
+    for width, height in reversed(variant_sizes(spec, *image.size)):
+        relative = f"{ASSET_DIR}/{spec.key}-{digest[:12]}-{width}w{extension}"
+        path = root / relative
+        if not path.is_file():
+            if image.size != (width, height):
+                image = image.resize((width, height), Image.Resampling.LANCZOS)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            image.save(path, image_format, **_SAVE_OPTIONS[image_format])
+        variants.append({"path": relative, "width": width, "height": height})
+
+    return {
+        "source": source,
+        "sha256": digest,
+        "version": PIPELINE_VERSION,
+        "variants": variants[::-1],
+    }
+
+
+def _prune(manifest: Dict[str, Any], root: Path) -> None:
+    """Remove generated files the manifest no longer references."""
+    directory = root / ASSET_DIR
+    if not directory.is_dir():
+        return
+    keep = {MANIFEST_FILE}
+    for entry in manifest.values():
+        keep.update(Path(v["path"]).name for v in entry["variants"])
+    for path in directory.iterdir():
+        if path.is_file() and path.name not in keep:
+            path.unlink()
+
+
+def _require_pillow() -> None:
+    """Fail with an installation hint when Pillow is missing."""
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "Resizing images requires Pillow. "
+            "Install it with: pip install 'auto-research-readme[images]'"
+        )
@@ -0,0 +1,201 @@
+"""
+Local SVG badge rendering.
+
+README badges are rendered here instead of being hotlinked from shields.io,
+so generated READMEs load without any external request. Badge widths come
+from a precomputed advance-width table for Verdana at 11px (the font
+shields.io badges use), so no font needs to be loaded at render time.
+
+Badge files are content-addressed (``config/assets/badges/<hash>.svg``): a
+badge is written only when its text changes, and badges no longer referenced
+are removed.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Union
+from xml.sax.saxutils import escape
+
+ConfigDict = Dict[str, Any]
+
+BADGE_DIR = "config/assets/badges"
+
+FONT_FAMILY = "Verdana,Geneva,DejaVu Sans,sans-serif"
+FONT_SIZE = 11
+HORIZONTAL_PADDING = 10
+
+COLORS = {
+    "blue": "#007ec6",
+    "green": "#97ca00",
+    "brightgreen": "#4c1",
+    "yellow": "#dfb317",
+    "orange": "#fe7d37",
+    "red": "#e05d44",
+    "grey": "#555",
+}
+
+# Verdana advance widths in font units (2048 per em) for printable ASCII
+_UNITS_PER_EM = 2048
+_VERDANA_CHARS = "".join(chr(code) for code in range(32, 127))
+_VERDANA_UNITS = (
+    "720 823 1030 1790 1302 2224 1484 604 930 930 1302 1790 745 862 745 1200 "
+    "1302 1302 1302 1302 1302 1302 1302 1302 1302 1302 873 873 1790 1790 1790 "
+    "1117 2048 1401 1405 1435 1577 1294 1178 1587 1540 861 929 1416 1147 1741 "
+    "1540 1616 1238 1616 1431 1400 1237 1503 1401 2025 1403 1237 1403 930 1200 "
+    "930 1790 1302 1302 1229 1276 1064 1276 1219 720 1276 1296 562 705 1198 562 "
+    "1992 1296 1233 1276 1276 874 1064 807 1296 1198 1667 1198 1198 1055 1300 "
+    "930 1300 1790"
+)
+_VERDANA_WIDTHS = dict(zip(_VERDANA_CHARS, map(int, _VERDANA_UNITS.split())))
+# Fallbacks: other Latin-like characters, and wide glyphs (CJK, emoji)
+_DEFAULT_WIDTH = 1302
+_WIDE_WIDTH = 2048
+
+
+@dataclass(frozen=True)
+class Badge:
+    """A two-part badge: a grey label and a coloured message."""
+
+    label: str
+    message: str
+    color: str = "blue"
+
+    @property
+    def svg(self) -> str:
+        """Render the badge as an SVG document."""
+        return render_badge(self.label, self.message, self.color)
+
+    @property
+    def path(self) -> str:
+        """Content-addressed path of the badge file, relative to the root."""
+        digest = hashlib.sha256(self.svg.encode("utf-8")).hexdigest()[:16]
+        return f"{BADGE_DIR}/{digest}.svg"
+
+
+def text_width(text: str) -> float:
+    """
+    Compute the rendered width of text in Verdana 11px.
+
+    Args:
+        text: Text to measure.
+
+    Returns:
+        Width in pixels.
+    """
+    units = 0
+    for char in text:
+        width = _VERDANA_WIDTHS.get(char)
+        if width is None:
+            width = _WIDE_WIDTH if ord(char) >= 0x2E80 else _DEFAULT_WIDTH
+        units += width
+    return units * FONT_SIZE / _UNITS_PER_EM
+
+
+def render_badge(label: str, message: str, color: str = "blue") -> str:
+    """
+    Render a flat-style badge.
+
+    Args:
+        label: Left-hand text.
+        message: Right-hand text.
+        color: Message background, a name from ``COLORS`` or a CSS colour.
+
+    Returns:
+        SVG document.
+    """
+    label_width = round(text_width(label)) + HORIZONTAL_PADDING
+    message_width = round(text_width(message)) + HORIZONTAL_PADDING
+    width = label_width + message_width
+    fill = COLORS.get(color, color)
+
+    label_x = label_width / 2
+    message_x = label_width + message_width / 2
+    aria_label = escape(f"{label}: {message}", {'"': "&quot;"})
+    title = escape(f"{label}: {message}")
+    label, message = escape(label), escape(message)
+
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="20" '
+        f'role="img" aria-label="{aria_label}">'
+        f"<title>{title}</title>"
+        '<linearGradient id="s" x2="0" y2="100%">'
+        '<stop offset="0" stop-color="#bbb" stop-opacity=".1"/>'
+        '<stop offset="1" stop-opacity=".1"/></linearGradient>'
+        f'<clipPath id="r"><rect width="{width}" height="20" rx="3" fill="#fff"/>'
+        "</clipPath>"
+        '<g clip-path="url(#r)">'
+        f'<rect width="{label_width}" height="20" fill="#555"/>'
+        f'<rect x="{label_width}" width="{message_width}" height="20" fill="{fill}"/>'
+        f'<rect width="{width}" height="20" fill="url(#s)"/></g>'
+        f'<g fill="#fff" text-anchor="middle" font-family="{FONT_FAMILY}" '
+        f'font-size="{FONT_SIZE}">'
+        f'<text x="{label_x:g}" y="15" fill="#010101" fill-opacity=".3">{label}</text>'
+        f'<text x="{label_x:g}" y="14">{label}</text>'
+        f'<text x="{message_x:g}" y="15" fill="#010101" fill-opacity=".3">'
+        f"{message}</text>"
+        f'<text x="{message_x:g}" y="14">{message}</text></g></svg>\n'
+    )
+
+
+def readme_badges(config: ConfigDict) -> Dict[str, Badge]:
+    """
+    Get the badges shown in the README header.
+
+    Args:
+        config: Project configuration dictionary.
+
+    Returns:
+        Mapping of badge name to badge, for the values the config has.
+    """
+    badges = {"license": Badge("license", "MIT", "blue")}
+    if config.get("version"):
+        badges["version"] = Badge("release", str(config["version"]), "green")
+    if config.get("doi"):
+        badges["doi"] = Badge("DOI", str(config["doi"]), "yellow")
+    if config.get("huggingface_link"):
+        badges["huggingface"] = Badge("🤗 Hugging Face", "Datasets", "orange")
+    return badges
+
+
+def badge_files(config: ConfigDict) -> Dict[str, str]:
+    """
+    Get the badge files the README references.
+
+    Args:
+        config: Project configuration dictionary.
+
+    Returns:
+        Mapping of file path (relative to the project root) to SVG content.
+    """
+    return {badge.path: badge.svg for badge in readme_badges(config).values()}
+
+
+def write_badges(config: ConfigDict, root: Union[str, Path] = ".") -> List[str]:
+    """
+    Write missing badge files and remove unreferenced ones.
+
+    Args:
+        config: Project configuration dictionary.
+        root: Project root directory.
+
+    Returns:
+        Paths (relative to the root) of files written or removed.
+    """
+    files = badge_files(config)
+    changed = []
+    for relative, svg in files.items():
+        path = Path(root) / relative
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(svg, encoding="utf-8")
+            changed.append(relative)
+
+    badge_dir = Path(root) / BADGE_DIR
+    if badge_dir.is_dir():
+        for path in sorted(badge_dir.glob("*.svg")):
+            relative = f"{BADGE_DIR}/{path.name}"
+            if relative not in files:
+                path.unlink()
+                changed.append(relative)
+    return changed
@@ -0,0 +1,580 @@
+"""
+Process many project checkouts concurrently in one process.
+
+Every step takes an explicit project root, so no step calls ``os.chdir``
+and projects can be handled on a thread pool. Config parsing, template
+compilation and directory listings are cached per process and shared by all
+projects in the batch.
+
+Each project gets a ``BatchResult``; a failing project is reported and does
+not stop the others.
+
+A large fleet can be split across CI runners with shards: ``select_shard``
+assigns each project to one of N shards by a stable hash of its path, so
+every runner given the same project list picks a disjoint subset without any
+coordination. Each runner writes a result manifest, and ``merge_manifests``
+combines them into one report.
+
+A ``BatchJournal`` records each project as it finishes, one JSON line at a
+time, so a run killed by a timeout or preemption can be resumed without
+redoing the projects that completed.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from .config import load_config
+from .sinks import OutputSink
+
+ConfigDict = Dict[str, Any]
+PathLike = Union[str, Path]
+
+MANIFEST_VERSION = 1
+
+# (root, config path, sink, enrich) -> paths written, integrations applied or
+# stale files
+BatchAction = Callable[[PathLike, str, Optional[OutputSink], bool], List[str]]
+
+JOURNAL_VERSION = 1
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one action on one project."""
+
+    root: Path
+    ok: bool
+    seconds: float
+    outputs: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-compatible dictionary."""
+        return {
+            "root": self.root.as_posix(),
+            "ok": self.ok,
+            "seconds": round(self.seconds, 3),
+            "outputs": self.outputs,
+            "error": self.error,
+        }
+
+
+def generate_project(
+    root: PathLike,
+    config_path: str = "config.yaml",
+    sink: Optional[OutputSink] = None,
+    enrich: bool = False,
+) -> List[str]:
+    """
+    Regenerate a project's files, writing only those whose content changed.
+
+    Image variants are refreshed when Pillow is installed and skipped
+    otherwise.
+
+    Args:
+        root: Project root directory.
+        config_path: Config file, relative to the root.
+        sink: Write every rendered file (including badges) here instead of
+              updating the project.
+        enrich: Fill in contributors from ORCID and the DOI first.
+
+    Returns:
+        Paths (relative to the root) that were written or removed.
+    """
+    from .assets import build_assets
+    from .badges import badge_files, write_badges
+    from .generator import output_is_current, render_outputs, write_output
+
+    config = _load_project_config(root, config_path, enrich)
+    if sink is not None:
+        outputs = {**render_outputs(config, root), **badge_files(config)}
+        for filename, content in outputs.items():
+            write_output(filename, content, sink=sink)
+        return list(outputs)
+
+    try:
+        build_assets(config, root)
+    except ImportError:
+        pass
+
+    changed = []
+    for filename, content in render_outputs(config, root).items():
+        if not output_is_current(filename, content, root):
+            write_output(filename, content, root)
+            changed.append(filename)
+    return changed + write_badges(config, root)
+
+
+def automate_project(
+    root: PathLike,
+    config_path: str = "config.yaml",
+    sink: Optional[OutputSink] = None,
+    enrich: bool = False,
+) -> List[str]:
+    """
+    Set up the applicable integrations for a project.
+
+    Args:
+        root: Project root directory.
+        config_path: Config file, relative to the root.
+        sink: Write integration files here instead of into the project.
+        enrich: Fill in contributors from ORCID and the DOI first, so that
+                e.g. ``.zenodo.json`` lists their ORCID iDs.
+
+    Returns:
+        Names of the integrations that were set up.
+    """
+    from .integration import setup_all_integrations
+
+    config = _load_project_config(root, config_path, enrich)
+    return setup_all_integrations(config, root, verbose=False, sink=sink)
+
+
+def check_project(
+    root: PathLike,
+    config_path: str = "config.yaml",
+    sink: Optional[OutputSink] = None,
+    enrich: bool = False,
+) -> List[str]:
+    """
+    Find a project's generated files that are missing or out of date.
+
+    Args:
+        root: Project root directory.
+        config_path: Config file, relative to the root.
+        sink: Unused; checking never writes.
+        enrich: Check against the output of an enriched config.
+
+    Returns:
+        Stale paths, relative to the root.
+    """
+    from .badges import badge_files
+    from .generator import output_is_current, render_outputs
+
+    config = _load_project_config(root, config_path, enrich)
+    outputs = {**render_outputs(config, root), **badge_files(config)}
+    return [
+        filename
+        for filename, content in outputs.items()
+        if not output_is_current(filename, content, root)
+    ]
+
+
+def _load_project_config(root: PathLike, config_path: str, enrich: bool) -> ConfigDict:
+    """Load a project's config, enriched from the registries if asked."""
+    config = load_config(config_path, root)
+    if enrich:
+        from .enrich import run_enrichment
+
+        config = run_enrichment([config])[0]
+    return config
+
+
+BATCH_ACTIONS: Dict[str, BatchAction] = {
+    "generate": generate_project,
+    "integrations": automate_project,
+    "check": check_project,
+}
+
+# Actions whose outputs are problems (stale files) rather than work done
+_FAILS_ON_OUTPUT = {"check"}
+
+
+def run_project(
+    root: PathLike,
+    action: str,
+    config_path: str = "config.yaml",
+    sink: Optional[OutputSink] = None,
+    enrich: bool = False,
+) -> BatchResult:
+    """
+    Run one batch action on one project, capturing any error.
+
+    Args:
+        root: Project root directory.
+        action: Name of an action in ``BATCH_ACTIONS``.
+        config_path: Config file, relative to the root.
+        sink: Output destination for this project's files, e.g. a shared sink
+              scoped to one of ``sink_prefixes``.
+        enrich: Enrich the config from ORCID and the DOI before acting.
+
+    Returns:
+        The project's result.
+    """
+    start = time.perf_counter()
+    try:
+        outputs = BATCH_ACTIONS[action](root, config_path, sink, enrich)
+    except Exception as e:
+        return BatchResult(Path(root), False, time.perf_counter() - start, error=str(e))
+
+    ok = not (action in _FAILS_ON_OUTPUT and outputs)
+    return BatchResult(Path(root), ok, time.perf_counter() - start, outputs)
+
+
+def sink_base(roots: Sequence[PathLike]) -> Path:
+    """
+    Find the directory that project paths in a shared sink are relative to.
+
+    Args:
+        roots: Project root directories.
+
+    Returns:
+        The deepest directory containing every root's parent directory.
+    """
+    parents = [os.path.dirname(os.path.abspath(root)) for root in roots]
+    return Path(os.path.commonpath(parents)) if parents else Path.cwd()
+
+
+def sink_prefixes(
+    roots: Sequence[PathLike], base: Optional[PathLike] = None
+) -> List[str]:
+    """
+    Choose the directory each project's files go under in a shared sink.
+
+    Projects are named by their path relative to ``base``, so ``a/docs`` and
+    ``b/docs`` stay apart instead of both becoming ``docs``.
+
+    Args:
+        roots: Project root directories.
+        base: Directory the names are relative to; defaults to
+              ``sink_base(roots)``. Pass the base of the full project list
+              when processing a subset, e.g. one shard, to keep names stable.
+
+    Returns:
+        One prefix per root, in the order given.
+
+    Raises:
+        ValueError: If two roots would share a prefix, or a root is not
+                    inside the base.
+    """
+    base_path = Path(os.path.abspath(base if base is not None else sink_base(roots)))
+    prefixes: List[str] = []
+    owners: Dict[str, PathLike] = {}
+    for root in roots:
+        path = Path(os.path.abspath(root))
+        try:
+            prefix = path.relative_to(base_path).as_posix()
+        except ValueError:
+            raise ValueError(f"Project {root} is not inside {base_path}")
+        if prefix in owners or prefix == ".":
+            raise ValueError(
+                f"Projects {owners.get(prefix, root)} and {root} would write "
+                f"to the same output directory"
+            )
+        owners[prefix] = root
+        prefixes.append(prefix)
+    return prefixes
+
+
+def run_batch(
+    roots: Sequence[PathLike],
+    action: str,
+    jobs: Optional[int] = None,
+    config_path: str = "config.yaml",
+    sink: Optional[OutputSink] = None,
+    on_result: Optional[Callable[[BatchResult], None]] = None,
+    base: Optional[PathLike] = None,
+    enrich: bool = False,
+) -> List[BatchResult]:
+    """
+    Run a batch action on many projects concurrently.
+
+    Args:
+        roots: Project root directories.
+        action: Name of an action in ``BATCH_ACTIONS``.
+        jobs: Maximum projects processed at once; defaults to the
+              ``ThreadPoolExecutor`` default.
+        config_path: Config file, relative to each root.
+        sink: Shared output destination, such as an archive; each project's
+              files go under its path relative to ``base`` (see
+              ``sink_prefixes``). Defaults to updating each project in place.
+        on_result: Called from the worker thread as each project finishes,
+                   e.g. to journal it or report progress; must be
+                   thread-safe.
+        base: Directory project paths in the sink are relative to.
+        enrich: Enrich each config from ORCID and the DOI before acting.
+
+    Returns:
+        One result per project, in the order the roots were given.
+
+    Raises:
+        ValueError: If the action does not exist, or two projects would
+                    write to the same directory of the sink.
+    """
+    if action not in BATCH_ACTIONS:
+        raise ValueError(
+            f"Unknown batch action: {action} (available: {', '.join(BATCH_ACTIONS)})"
+        )
+
+    sinks: List[Optional[OutputSink]] = [None] * len(roots)
+    if sink is not None:
+        sinks = [sink.scoped(prefix) for prefix in sink_prefixes(roots, base)]
+
+    def run(root: PathLike, project_sink: Optional[OutputSink]) -> BatchResult:
+        result = run_project(root, action, config_path, project_sink, enrich)
+        if on_result is not None:
+            on_result(result)
+        return result
+
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        return list(executor.map(run, roots, sinks))
+
+
+class BatchJournal:
+    """
+    Append-only record of the projects a batch run has finished.
+
+    Each finished project is appended as one JSON line with its status,
+    outputs and the SHA-256 of every output file written, and flushed to
+    disk before the next. A line cut short by the process being killed is
+    ignored when the journal is read back.
+    """
+
+    def __init__(self, path: PathLike, action: str, resume: bool = False) -> None:
+        """
+        Open the journal.
+
+        Args:
+            path: Journal file.
+            action: Batch action being run.
+            resume: Keep the existing entries; otherwise the journal is
+                    started afresh.
+        """
+        self.path = Path(path)
+        self.action = action
+        self._lock = threading.Lock()
+        self._entries = self._read() if resume else []
+        self._file = open(self.path, "a" if resume else "w", encoding="utf-8")
+
+    def completed(self, roots: Sequence[PathLike]) -> List[BatchResult]:
+        """
+        Find the projects a previous run already finished successfully.
+
+        A project only counts as finished if the files it wrote still have
+        the recorded content.
+
+        Args:
+            roots: Project root directories.
+
+        Returns:
+            The recorded results of the finished projects, in the order given.
+        """
+        latest: Dict[str, Dict[str, Any]] = {}
+        for recorded in self._entries:
+            if recorded.get("action") == self.action:
+                latest[recorded.get("root", "")] = recorded
+
+        done: List[BatchResult] = []
+        for root in roots:
+            entry = latest.get(_project_key(root))
+            if entry and entry.get("ok") and _hashes_match(root, entry["hashes"]):
+                done.append(
+                    BatchResult(Path(root), True, entry["seconds"], entry["outputs"])
+                )
+        return done
+
+    def record(self, result: BatchResult) -> None:
+        """
+        Append a finished project.
+
+        Args:
+            result: The project's result.
+        """
+        entry = {
+            "version": JOURNAL_VERSION,
+            "action": self.action,
+            **result.to_dict(),
+            "root": _project_key(result.root),
+            "hashes": _output_hashes(result.root, result.outputs),
+            "finished": round(time.time(), 3),
+        }
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Close the journal file."""
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> "BatchJournal":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _read(self) -> List[Dict[str, Any]]:
+        """Read the existing entries, skipping a torn last line."""
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return []
+
+        entries = []
+        for line in lines:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue
+        return entries
+
+
+def _project_key(root: PathLike) -> str:
+    """Identify a project by its normalized path, as given."""
+    return Path(os.path.normpath(root)).as_posix()
+
+
+def _output_hashes(root: PathLike, outputs: Sequence[str]) -> Dict[str, str]:
+    """Hash the output files that exist under a project root."""
+    hashes = {}
+    for output in outputs:
+        try:
+            data = (Path(root) / output).read_bytes()
+        except OSError:
+            continue  # Not a file, e.g. an integration name or a removed file
+        hashes[output] = hashlib.sha256(data).hexdigest()
+    return hashes
+
+
+def _hashes_match(root: PathLike, hashes: Dict[str, str]) -> bool:
+    """Check that recorded output files still have their recorded content."""
+    return _output_hashes(root, list(hashes)) == hashes
+
+
+def parse_shard(spec: str) -> Tuple[int, int]:
+    """
+    Parse a shard spec such as ``3/8``.
+
+    Args:
+        spec: ``INDEX/COUNT`` with a 1-based index.
+
+    Returns:
+        Tuple of index and count.
+
+    Raises:
+        ValueError: If the spec is malformed or the index is out of range.
+    """
+    index, sep, count = spec.partition("/")
+    try:
+        shard = (int(index), int(count))
+    except ValueError:
+        shard = (0, 0)
+    if not sep or not 1 <= shard[0] <= shard[1]:
+        raise ValueError(f"Invalid shard: {spec} (expected INDEX/COUNT, e.g. 1/8)")
+    return shard
+
+
+def shard_of(root: PathLike, count: int) -> int:
+    """
+    Get the shard a project belongs to.
+
+    The project path is normalized but not resolved, so runners that check
+    out the repository in different places agree as long as they are given
+    the same relative paths.
+
+    Args:
+        root: Project root directory, as given on the command line.
+        count: Number of shards.
+
+    Returns:
+        1-based shard index.
+    """
+    digest = hashlib.sha256(_project_key(root).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % count + 1
+
+
+def select_shard(roots: Sequence[PathLike], index: int, count: int) -> List[PathLike]:
+    """
+    Select the projects belonging to one shard, keeping their order.
+
+    Args:
+        roots: Every project root.
+        index: 1-based shard index.
+        count: Number of shards.
+
+    Returns:
+        The roots assigned to the shard.
+    """
+    return [root for root in roots if shard_of(root, count) == index]
+
+
+def write_manifest(
+    path: PathLike,
+    action: str,
+    results: Sequence[BatchResult],
+    shard: Optional[Tuple[int, int]] = None,
+) -> None:
+    """
+    Write the results of a batch run as a JSON manifest.
+
+    Args:
+        path: Manifest file to write.
+        action: Batch action that was run.
+        results: Results of the run.
+        shard: Index and count of the shard that was run, if any.
+    """
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "action": action,
+        "shard": {"index": shard[0], "count": shard[1]} if shard else None,
+        "projects": [result.to_dict() for result in results],
+    }
+    Path(path).write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+
+
+def merge_manifests(paths: Sequence[PathLike]) -> Dict[str, Any]:
+    """
+    Combine the manifests written by the shards of one batch run.
+
+    Args:
+        paths: Manifest files, one per shard.
+
+    Returns:
+        Report with the action, shard count, every project's result sorted
+        by root, the number of failed projects and any shards that are
+        missing.
+
+    Raises:
+        ValueError: If the manifests are from different actions or shard
+                    counts, a shard appears twice, or a project appears in
+                    more than one shard.
+        OSError: If a manifest cannot be read.
+    """
+    action: Optional[str] = None
+    count: Optional[int] = None
+    seen_shards: Set[int] = set()
+    projects: Dict[str, Dict[str, Any]] = {}
+    for path in paths:
+        manifest = json.loads(Path(path).read_text(encoding="utf-8"))
+        shard = manifest.get("shard") or {"index": 1, "count": 1}
+        if action is None:
+            action, count = manifest["action"], shard["count"]
+        if manifest["action"] != action or shard["count"] != count:
+            raise ValueError(f"{path} is from a different batch run")
+        if shard["index"] in seen_shards:
+            raise ValueError(f"Shard {shard['index']}/{count} appears twice")
+        seen_shards.add(shard["index"])
+
+        for project in manifest["projects"]:
+            if project["root"] in projects:
+                raise ValueError(f"{project['root']} appears in more than one shard")
+            projects[project["root"]] = project
+
+    results = [projects[root] for root in sorted(projects)]
+    return {
+        "version": MANIFEST_VERSION,
+        "action": action,
+        "shards": count or 0,
+        "missing_shards": sorted(set(range(1, (count or 0) + 1)) - seen_shards),
+        "failed": sum(not result["ok"] for result in results),
+        "projects": results,
+    }
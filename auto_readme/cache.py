@@ -0,0 +1,297 @@
+"""
+User-level cache location for auto-research-readme.
+
+Caches that outlive a single run (release manifests, rendered outputs) live
+under one directory so CI can persist them with a single cache step. The
+location is ``$AUTO_README_CACHE_DIR`` if set, otherwise
+``$XDG_CACHE_HOME/auto-research-readme`` (``~/.cache/auto-research-readme``).
+
+``RenderCache`` stores rendered files under ``renders/``, keyed by a hash of
+the template source, the values the template was rendered with and the
+package version, so an identical render in another checkout, another worker
+or a fresh CI clone with a restored cache is read back instead of re-rendered.
+Set ``AUTO_README_RENDER_CACHE=0`` to disable it.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+CACHE_DIR_ENV = "AUTO_README_CACHE_DIR"
+RENDER_CACHE_ENV = "AUTO_README_RENDER_CACHE"
+
+# Rendered files kept before the least recently used are evicted
+DEFAULT_RENDER_CACHE_BYTES = 64 * 1024 * 1024
+
+# Eviction trims the cache to this fraction of its limit, so that a full
+# cache is not rescanned on every write
+_EVICTION_TARGET = 0.9
+
+# Directory -> shared RenderCache
+_RENDER_CACHES: Dict[Path, "RenderCache"] = {}
+_RENDER_CACHES_LOCK = threading.Lock()
+
+
+def user_cache_dir() -> Path:
+    """
+    Get the user-level cache directory.
+
+    Returns:
+        Path to the cache directory (not created).
+    """
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override).expanduser()
+
+    xdg_cache = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg_cache).expanduser() if xdg_cache else Path.home() / ".cache"
+    return base / "auto-research-readme"
+
+
+@dataclass
+class CacheStats:
+    """Counters for one process's use of a render cache."""
+
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that were hits (0.0 before any lookup)."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class RenderCache:
+    """
+    On-disk cache of rendered files, shared by every project of a user.
+
+    Entries are written atomically, so parallel workers (threads or
+    processes) can share the directory. Each hit refreshes the entry's
+    modification time; when the cache grows past its size limit the entries
+    used least recently are removed. The limit is approximate when several
+    processes write at once, since each one tracks its own writes between
+    scans.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_bytes: int = DEFAULT_RENDER_CACHE_BYTES,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Cache directory; created on first write.
+            max_bytes: Total size of entries to keep.
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+
+    @staticmethod
+    def key(namespace: str, template_digest: str, values: Any) -> str:
+        """
+        Build the key for one render.
+
+        Args:
+            namespace: Name of what is rendered, e.g. a template name.
+            template_digest: Digest of the template source (including any
+                             templates it extends or includes).
+            values: JSON-compatible values the template is rendered with;
+                    only what affects the output should be passed.
+
+        Returns:
+            Hex digest combining the inputs with the package version.
+        """
+        from . import __version__
+
+        payload = json.dumps(
+            [__version__, namespace, template_digest, values],
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Look up a rendered file.
+
+        Args:
+            key: Key from ``key()``.
+
+        Returns:
+            The rendered bytes, or None if there is no entry.
+        """
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            self._count("misses")
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._count("hits")
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """
+        Store a rendered file, evicting old entries if the cache is full.
+
+        Failing to write (e.g. a read-only cache directory) is not an error;
+        the render is simply not cached.
+
+        Args:
+            key: Key from ``key()``.
+            data: Rendered bytes.
+        """
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            self.stats.writes += 1
+            if self._size is None:
+                self._size = sum(size for _, _, size in self._entries())
+            else:
+                self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def get_or_render(self, key: str, render: Callable[[], str]) -> str:
+        """
+        Read a rendered file from the cache, rendering and storing it on a miss.
+
+        Args:
+            key: Key from ``key()``.
+            render: Produces the content when it is not cached.
+
+        Returns:
+            The rendered text.
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached.decode("utf-8")
+        content = render()
+        self.put(key, content.encode("utf-8"))
+        return content
+
+    def size(self) -> Tuple[int, int]:
+        """
+        Measure the cache.
+
+        Returns:
+            Number of entries and their total size in bytes.
+        """
+        entries = self._entries()
+        return len(entries), sum(size for _, _, size in entries)
+
+    def clear(self) -> int:
+        """
+        Remove every entry.
+
+        Returns:
+            Number of entries removed.
+        """
+        removed = 0
+        for path, _, _ in self._entries():
+            try:
+                path.unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+        with self._lock:
+            self._size = 0
+        return removed
+
+    def _evict(self) -> None:
+        """Remove least recently used entries; the caller holds the lock."""
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        total = sum(size for _, _, size in entries)
+        target = self.max_bytes * _EVICTION_TARGET
+        for path, _, size in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+                self.stats.evictions += 1
+            except FileNotFoundError:
+                pass  # Evicted by another worker
+            total -= size
+        self._size = total
+
+    def _entries(self) -> List[Tuple[Path, int, int]]:
+        """List entries as (path, mtime in nanoseconds, size)."""
+        entries: List[Tuple[Path, int, int]] = []
+        try:
+            shards = list(os.scandir(self.directory))
+        except OSError:
+            return entries
+        for shard in shards:
+            if not shard.is_dir():
+                continue
+            try:
+                files = list(os.scandir(shard.path))
+            except OSError:
+                continue
+            for entry in files:
+                if entry.name.endswith(".tmp"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((Path(entry.path), stat.st_mtime_ns, stat.st_size))
+        return entries
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self.stats, counter, getattr(self.stats, counter) + 1)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+
+def render_cache() -> Optional[RenderCache]:
+    """
+    Get the process-wide render cache for the current cache directory.
+
+    Returns:
+        The shared cache, or None if ``AUTO_README_RENDER_CACHE`` disables it.
+    """
+    if os.environ.get(RENDER_CACHE_ENV, "").lower() in ("0", "false", "off", "no"):
+        return None
+
+    directory = user_cache_dir() / "renders"
+    cache = _RENDER_CACHES.get(directory)
+    if cache is None:
+        with _RENDER_CACHES_LOCK:
+            cache = _RENDER_CACHES.setdefault(directory, RenderCache(directory))
+    return cache
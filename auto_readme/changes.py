@@ -0,0 +1,132 @@
+"""
+Find the projects affected by changes since a git ref.
+
+``git diff --name-only`` is run once for the whole repository, and each
+project's inputs are matched against the changed paths. A project's inputs
+are its config folder and config file, every base config it ``extends`` or
+``include``s, its template search path (project and organisation template
+folders), its local logo and banner, and its generated files. A change to a
+shared base config or organisation template therefore affects every project
+built on it, while a pull request touching one project only selects that
+project.
+"""
+
+import os
+import subprocess
+from pathlib import Path
+from typing import FrozenSet, List, Sequence, TypeVar, Union
+
+from .config import load_config_with_sources
+from .template_loader import PACKAGE_TEMPLATE_DIR, template_search_path
+
+PathLike = Union[str, Path]
+RootT = TypeVar("RootT", str, Path)
+
+# Files the generator writes at the project root
+GENERATED_FILES = ("README.md", "LICENSE", "citation.bib")
+
+
+def changed_paths(since: str, root: PathLike = ".") -> FrozenSet[Path]:
+    """
+    List the files changed between a git ref and the working tree.
+
+    Untracked files are not included; commit or stage new files first.
+
+    Args:
+        since: Git ref to compare against, e.g. ``origin/main`` or a SHA.
+        root: Any directory inside the repository.
+
+    Returns:
+        Absolute paths of added, modified and deleted files; a renamed file
+        is listed under both its old and its new path.
+
+    Raises:
+        RuntimeError: If git fails, e.g. because the ref does not exist.
+    """
+    try:
+        toplevel = _git(root, "rev-parse", "--show-toplevel").strip()
+        output = _git(root, "diff", "--name-only", "--no-renames", "-z", since, "--")
+    except (OSError, subprocess.CalledProcessError) as e:
+        detail = getattr(e, "stderr", None) or str(e)
+        raise RuntimeError(f"Could not list changes since {since}: {detail.strip()}")
+
+    base = Path(toplevel).resolve()
+    return frozenset(base / name for name in output.split("\0") if name)
+
+
+def project_inputs(root: PathLike, config_path: str = "config.yaml") -> List[Path]:
+    """
+    List the files and directories a project's generated files depend on.
+
+    Args:
+        root: Project root directory.
+        config_path: Config file, relative to the root.
+
+    Returns:
+        Absolute paths; a directory stands for everything beneath it. If the
+        config cannot be loaded the whole project directory is returned, so
+        that the failure is reported rather than skipped.
+    """
+    root_path = Path(root).resolve()
+    try:
+        config, sources = load_config_with_sources(config_path, root)
+    except Exception:
+        return [root_path]
+
+    inputs = [root_path / "config", *(path.resolve() for path in sources)]
+    inputs += [
+        directory.resolve()
+        for directory in template_search_path(config, root)
+        if directory != PACKAGE_TEMPLATE_DIR
+    ]
+    for field in ("logo_path", "banner_path"):
+        value = config.get(field)
+        if isinstance(value, str) and value and "://" not in value:
+            inputs.append((root_path / value).resolve())
+    inputs += [root_path / name for name in GENERATED_FILES]
+    return inputs
+
+
+def affected_projects(
+    roots: Sequence[RootT],
+    since: str,
+    config_path: str = "config.yaml",
+    repo: PathLike = ".",
+) -> List[RootT]:
+    """
+    Select the projects whose inputs changed since a git ref.
+
+    Args:
+        roots: Project root directories.
+        since: Git ref to compare against.
+        config_path: Config file, relative to each root.
+        repo: Directory inside the repository to run git in.
+
+    Returns:
+        The affected roots, in the order given.
+
+    Raises:
+        RuntimeError: If git fails.
+    """
+    changed = changed_paths(since, repo)
+    # Every changed file and every directory containing one
+    touched = set(changed)
+    for path in changed:
+        touched.update(path.parents)
+
+    return [
+        root
+        for root in roots
+        if any(path in touched for path in project_inputs(root, config_path))
+    ]
+
+
+def _git(cwd: PathLike, *args: str) -> str:
+    """Run a git command and return its output."""
+    return subprocess.run(
+        ["git", *args],
+        cwd=os.fspath(cwd),
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
@@ -7,41 +7,84 @@ including initialization, README generation, and automation setup.
 """
 
 import argparse
+import contextlib
+import json
+import os
 import sys
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Iterator, List, Optional
 
+from .assets import build_assets
+from .badges import badge_files, write_badges
+from .cache import render_cache
 from .generator import (
+    diff_output,
     generate_citation,
     generate_license,
     generate_readme,
     load_config,
+    output_is_current,
     write_output,
 )
+from .sinks import OutputSink, open_sink, writes_to_stdout
 
 ConfigDict = Dict[str, Any]
 
 
+def check_outputs(outputs: Dict[str, str], show_diff: bool = False) -> List[str]:
+    """
+    Compare rendered outputs against the files on disk without writing them.
+
+    Args:
+        outputs: Mapping of filename to freshly rendered content.
+        show_diff: Print a unified diff for each stale file.
+
+    Returns:
+        List of filenames that are missing or out of date.
+    """
+    stale_files = []
+    for filename, content in outputs.items():
+        if output_is_current(filename, content):
+            print(f"✓ {filename} is up to date")
+            continue
+
+        stale_files.append(filename)
+        print(f"✗ {filename} is out of date", file=sys.stderr)
+        if show_diff:
+            sys.stdout.write(diff_output(filename, content))
+
+    return stale_files
+
+
 def cmd_make_readme(args: argparse.Namespace) -> None:
     """
     Generate README.md and LICENSE in the top level directory.
 
     Args:
-        args: Command line arguments containing config path.
+        args: Command line arguments containing config path and check flags.
 
     Raises:
-        SystemExit: If generation fails.
+        SystemExit: If generation fails or, in check mode, if outputs are stale.
     """
+    if _unchanged_since(args):
+        return
     try:
-        config = load_config(args.config)
+        config = _enrich(load_config(args.config), args)
+
+        outputs = {
+            "README.md": generate_readme(config),
+            "LICENSE": generate_license(config),
+        }
 
-        # Generate README.md in current directory
-        readme_content = generate_readme(config)
-        write_output("README.md", readme_content)
+        if getattr(args, "check", False) or getattr(args, "diff", False):
+            outputs.update(badge_files(config))
+            if check_outputs(outputs, show_diff=args.diff):
+                sys.exit(1)
+            return
 
-        # Generate LICENSE in current directory
-        license_content = generate_license(config)
-        write_output("LICENSE", license_content)
+        for filename, content in outputs.items():
+            write_output(filename, content)
+        write_badges(config)
 
         print("✓ Generated README.md")
         print("✓ Generated LICENSE")
@@ -56,14 +99,26 @@ def cmd_make_all(args: argparse.Namespace) -> None:
     """
     Generate all repository files from config.
 
+    With ``--check`` (or ``--diff``) the files are rendered in memory and
+    compared against the working tree instead of being written. With
+    ``--output`` they are written to an archive, a directory or stdout.
+
     Args:
-        args: Command line arguments containing config path.
+        args: Command line arguments containing config path and check flags.
 
     Raises:
-        SystemExit: If generation fails.
+        SystemExit: If generation fails or, in check mode, if outputs are stale.
     """
+    if _unchanged_since(args):
+        return
+    with _output_sink(args) as sink:
+        _make_all(args, sink)
+
+
+def _make_all(args: argparse.Namespace, sink: Optional[OutputSink]) -> None:
+    """Generate all repository files, optionally into an output sink."""
     try:
-        config = load_config(args.config)
+        config = _enrich(load_config(args.config), args)
 
         generators = {
             "README.md": generate_readme,
@@ -71,15 +126,44 @@ def cmd_make_all(args: argparse.Namespace) -> None:
             "citation.bib": generate_citation,
         }
 
+        check_mode = getattr(args, "check", False) or getattr(args, "diff", False)
+        if not check_mode and sink is None:
+            _build_assets(config)
+
+        rendered = {}
         generated_files = []
         for filename, generator in generators.items():
             try:
                 content = generator(config)
-                write_output(filename, content)
+                if check_mode:
+                    rendered[filename] = content
+                    continue
+                write_output(filename, content, sink=sink)
                 generated_files.append(filename)
             except Exception as e:
                 print(f"❌ Error generating {filename}: {e}", file=sys.stderr)
 
+        if check_mode:
+            stale_files = check_outputs(
+                {**rendered, **badge_files(config)}, show_diff=args.diff
+            )
+            if stale_files or len(rendered) != len(generators):
+                print(
+                    "❌ Repository files are out of date. "
+                    "Run 'auto-research-readme make all' to update them.",
+                    file=sys.stderr,
+                )
+                sys.exit(1)
+            print("🎉 All repository files are up to date!")
+            return
+
+        if "README.md" in generated_files:
+            if sink is None:
+                write_badges(config)
+            else:
+                for path, svg in badge_files(config).items():
+                    sink.write(path, svg)
+
         if generated_files:
             for filename in generated_files:
                 print(f"✓ Generated {filename}")
@@ -93,6 +177,68 @@ def cmd_make_all(args: argparse.Namespace) -> None:
         sys.exit(1)
 
 
+def cmd_make_assets(args: argparse.Namespace) -> None:
+    """
+    Generate resized logo and banner variants for the README.
+
+    Args:
+        args: Command line arguments containing config path and job count.
+
+    Raises:
+        SystemExit: If the config cannot be loaded or an image cannot be processed.
+    """
+    try:
+        config = load_config(args.config)
+        manifest = build_assets(config, jobs=args.jobs)
+    except Exception as e:
+        print(f"❌ Error generating image variants: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if not manifest:
+        print("No logo_path or banner_path images found; nothing to do")
+        return
+    for key, entry in manifest.items():
+        sizes = ", ".join(f"{v['width']}x{v['height']}" for v in entry["variants"])
+        print(f"✓ {key}: {sizes}")
+    print("🎉 Image variants are up to date!")
+
+
+def _build_assets(config: ConfigDict) -> None:
+    """Refresh image variants before rendering, skipping them without Pillow."""
+    try:
+        build_assets(config)
+    except ImportError as e:
+        print(f"⚠️  Skipping image variants: {e}", file=sys.stderr)
+
+
+def cmd_config(args: argparse.Namespace) -> None:
+    """
+    Print the fully resolved configuration, including inherited bases.
+
+    Args:
+        args: Command line arguments containing config path and output format.
+
+    Raises:
+        SystemExit: If the configuration cannot be loaded.
+    """
+    try:
+        from .config import dump_config, load_config_with_sources
+
+        config, sources = load_config_with_sources(args.config)
+        config = _enrich(config, args)
+
+        if args.format == "json":
+            print(json.dumps(config, indent=2, ensure_ascii=False, default=str))
+        else:
+            for source in sources:
+                print(f"# source: {source}")
+            print(dump_config(config), end="")
+
+    except Exception as e:
+        print(f"❌ Error loading config: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
 def cmd_init(args: argparse.Namespace) -> None:
     """
     Initialize a new project with sample config.
@@ -176,16 +322,605 @@ def cmd_automate(args: argparse.Namespace) -> None:
     Raises:
         SystemExit: If automation setup fails.
     """
+    if _unchanged_since(args):
+        return
+    with _output_sink(args) as sink:
+        try:
+            from .integration import setup_all_integrations
+
+            config = _enrich(load_config(args.config), args)
+            setup_all_integrations(config, sink=sink)
+
+        except Exception as e:
+            print(f"❌ Error setting up automation: {e}", file=sys.stderr)
+            sys.exit(1)
+
+
+@contextlib.contextmanager
+def _output_sink(args: argparse.Namespace) -> Iterator[Optional[OutputSink]]:
+    """
+    Open the ``--output`` sink for a command, if one was given.
+
+    When the sink streams to stdout, progress messages go to stderr instead
+    so they cannot corrupt the stream.
+
+    Args:
+        args: Command line arguments, optionally containing ``output``.
+
+    Yields:
+        The sink, or None to write files in place.
+    """
+    spec = getattr(args, "output", None)
+    if not spec:
+        yield None
+        return
+
+    with contextlib.ExitStack() as stack:
+        try:
+            sink = stack.enter_context(open_sink(spec))
+        except (OSError, ValueError) as e:
+            print(f"❌ Error opening output {spec}: {e}", file=sys.stderr)
+            sys.exit(1)
+        if writes_to_stdout(spec):
+            stack.enter_context(contextlib.redirect_stdout(sys.stderr))
+        yield sink
+
+
+def _add_output_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the shared ``--output`` option for commands that write files."""
+    parser.add_argument(
+        "--output",
+        help="Write files to a directory, an archive (.zip, .tar, .tar.gz), "
+        "'zip:-'/'tar:-'/'tar.gz:-' for an archive on stdout, "
+        "or '-' for JSON Lines on stdout",
+    )
+
+
+def _add_check_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the shared ``--check``/``--diff`` flags to a make subcommand."""
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Verify files are up to date without writing; exit 1 if stale",
+    )
+    parser.add_argument(
+        "--diff",
+        action="store_true",
+        help="Like --check, but also print a unified diff for stale files",
+    )
+
+
+def _add_enrich_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the ``--enrich`` flag to a command that loads a config."""
+    parser.add_argument(
+        "--enrich",
+        action="store_true",
+        help="Fill in contributor names and affiliations from ORCID and the DOI",
+    )
+
+
+def _add_since_argument(parser: argparse.ArgumentParser) -> None:
+    """Add the ``--since`` option to a command that acts on projects."""
+    parser.add_argument(
+        "--since",
+        metavar="REF",
+        help="Only act on projects whose config, base configs, templates or "
+        "assets changed since this git ref",
+    )
+
+
+def _unchanged_since(args: argparse.Namespace) -> bool:
+    """
+    Check whether ``--since`` rules out the project in the current directory.
+
+    Args:
+        args: Command line arguments, optionally containing ``since``.
+
+    Returns:
+        True if the command can be skipped.
+
+    Raises:
+        SystemExit: If the changes cannot be listed.
+    """
+    since = getattr(args, "since", None)
+    if not since:
+        return False
+
+    from .changes import affected_projects
+
     try:
-        from .integrations import setup_all_integrations
+        affected = affected_projects(["."], since, config_path=args.config)
+    except RuntimeError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    if affected:
+        return False
+    print(f"✓ No changes since {since} affect this project")
+    return True
 
-        config = load_config(args.config)
-        setup_all_integrations(config)
 
+def _enrich(config: ConfigDict, args: argparse.Namespace) -> ConfigDict:
+    """Apply registry enrichment if ``--enrich`` was given."""
+    if not getattr(args, "enrich", False):
+        return config
+
+    from .enrich import run_enrichment
+
+    return run_enrichment([config])[0]
+
+
+def cmd_zenodo_upload(args: argparse.Namespace) -> None:
+    """
+    Upload files to a Zenodo deposition.
+
+    The target is an existing draft (``--deposition``), a new version of a
+    published record (``--new-version``, defaulting to the record referenced
+    by the config's ``zenodo_link`` or DOI), or otherwise a new deposition.
+    A directory uploads every file beneath it, each under its base name.
+
+    Args:
+        args: Command line arguments containing files and deposition options.
+
+    Raises:
+        SystemExit: If the token is missing or any upload fails.
+    """
+    token = os.environ.get("ZENODO_TOKEN")
+    if not token:
+        print("❌ ZENODO_TOKEN environment variable is not set", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        from .integration.platforms.zenodo.uploader import (
+            ZENODO_API_URL,
+            ZENODO_SANDBOX_API_URL,
+            ZenodoUploader,
+            zenodo_record_id,
+        )
+
+        uploader = ZenodoUploader(
+            token,
+            ZENODO_SANDBOX_API_URL if args.sandbox else ZENODO_API_URL,
+            max_workers=args.jobs,
+        )
+
+        record_id = args.new_version
+        if not args.deposition and not record_id:
+            try:
+                record_id = zenodo_record_id(load_config(args.config))
+            except FileNotFoundError:
+                record_id = None
+
+        if args.deposition:
+            deposition = uploader.get_deposition(args.deposition)
+        elif record_id:
+            deposition = uploader.new_version(record_id)
+            print(f"✓ Created new version draft {deposition['id']} of {record_id}")
+        else:
+            deposition = uploader.create_deposition()
+            print(f"✓ Created deposition {deposition['id']}")
+
+        results = uploader.upload_files(deposition, _expand_files(args.files))
+
+        failed = [r for r in results if r.status == "failed"]
+        for result in results:
+            if result.status == "failed":
+                print(f"❌ {result.filename}: {result.error}", file=sys.stderr)
+            else:
+                print(f"✓ {result.status.capitalize()} {result.filename}")
+
+        if failed:
+            print(f"❌ {len(failed)} file(s) failed to upload", file=sys.stderr)
+            sys.exit(1)
+
+        if args.publish:
+            uploader.publish(deposition)
+            print(f"🎉 Published deposition {deposition['id']}")
+
+    except Exception as e:
+        print(f"❌ Error uploading to Zenodo: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _expand_files(paths: List[str]) -> List[Path]:
+    """Replace each directory in a list of paths by the files beneath it."""
+    files = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            files.extend(sorted(p for p in path.rglob("*") if p.is_file()))
+        else:
+            files.append(path)
+    return files
+
+
+def cmd_release_delta(args: argparse.Namespace) -> None:
+    """
+    Stage a content-addressed delta release.
+
+    Builds the manifest of ``--tag`` and writes only the blobs that the
+    previous release tag did not already contain, plus the manifest and a
+    delta summary, into the output directory. Every blob is staged instead
+    with ``--full``, for the first release, or when the previous release was
+    not published with a blob store.
+
+    Args:
+        args: Command line arguments containing tag, previous and output.
+
+    Raises:
+        SystemExit: If git fails or the tag does not exist.
+    """
+    from .integration.release.manifest import (
+        build_manifest,
+        compute_delta,
+        has_delta_store,
+        previous_release_tag,
+        stage_release,
+    )
+
+    try:
+        previous_tag = args.previous or previous_release_tag(args.tag)
+        previous = build_manifest(previous_tag) if previous_tag else None
+        full = args.full
+        if previous_tag and not full and not has_delta_store(previous_tag):
+            print(f"⚠️  {previous_tag} has no blob store; staging every blob")
+            full = True
+        current = build_manifest(args.tag, previous=previous)
+        delta = compute_delta(current, previous, full=full)
+        written = stage_release(current, delta, args.output)
     except Exception as e:
-        print(f"❌ Error setting up automation: {e}", file=sys.stderr)
+        print(f"❌ Error building delta release: {e}", file=sys.stderr)
         sys.exit(1)
 
+    since = f" since {previous_tag}" if previous_tag else ""
+    print(
+        f"✓ {args.tag}{since}: {len(delta['added'])} added, "
+        f"{len(delta['changed'])} changed, {len(delta['removed'])} removed"
+    )
+    print(
+        f"✓ Staged {len(delta['blobs'])} new blob(s) ({delta['bytes']} bytes) "
+        f"and {len(written) - len(delta['blobs'])} manifest file(s) in {args.output}"
+    )
+
+
+def cmd_package(args: argparse.Namespace) -> None:
+    """
+    Build reproducible release archives and a checksum file.
+
+    The archive name defaults to ``<slugified title>-<version>`` from the
+    config, falling back to the current directory name.
+
+    Args:
+        args: Command line arguments containing ref, output and format options.
+
+    Raises:
+        SystemExit: If the archives cannot be built.
+    """
+    from .integration.release.package import build_archives
+    from .template_loader import slugify
+
+    name = args.name
+    if not name:
+        try:
+            config = load_config(args.config)
+        except FileNotFoundError:
+            config = {}
+        title = slugify(str(config.get("title", ""))) or Path.cwd().name
+        version = config.get("version")
+        name = f"{title}-{version}" if version else title
+
+    try:
+        checksums = build_archives(
+            args.ref,
+            args.output,
+            name,
+            formats=args.format or ["tar.gz", "zip"],
+            jobs=args.jobs,
+            level=args.level,
+        )
+    except Exception as e:
+        print(f"❌ Error building release archives: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    for filename, digest in checksums.items():
+        print(f"✓ Built {Path(args.output) / filename} ({digest[:12]})")
+
+
+def cmd_check_links(args: argparse.Namespace) -> None:
+    """
+    Check the links and identifiers of one or more project configs.
+
+    Args:
+        args: Command line arguments containing config paths and client options.
+
+    Raises:
+        SystemExit: If a config cannot be loaded or any link is broken.
+    """
+    from .links import run_link_check
+
+    paths = args.configs or ["config.yaml"]
+    try:
+        configs = [load_config(path) for path in paths]
+    except Exception as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    reports = run_link_check(
+        configs,
+        max_per_host=args.jobs,
+        rate_limit=args.rate,
+        ttl=args.ttl,
+        use_cache=not args.no_cache,
+    )
+
+    broken = 0
+    for path, results in zip(paths, reports):
+        if len(paths) > 1:
+            print(f"{path}:")
+        for result in results:
+            if result.ok:
+                print(f"✓ {result.field}: {result.url} ({result.status})")
+            else:
+                broken += 1
+                print(
+                    f"❌ {result.field}: {result.value} ({result.error})",
+                    file=sys.stderr,
+                )
+
+    if broken:
+        print(f"❌ {broken} broken link(s)", file=sys.stderr)
+        sys.exit(1)
+
+
+def cmd_batch(args: argparse.Namespace) -> None:
+    """
+    Run generate, integrations or check across many project checkouts.
+
+    With ``--shard INDEX/COUNT`` only the projects assigned to that shard are
+    processed, and the results are written to a manifest for
+    ``batch-merge``. With ``--journal`` each finished project is recorded as
+    it completes, and ``--resume`` skips the projects a killed run finished.
+    Progress is reported at a limited rate rather than once per project;
+    only failures are listed individually.
+
+    Args:
+        args: Command line arguments containing the action, roots and job count.
+
+    Raises:
+        SystemExit: If any project fails (or, for check, has stale files).
+    """
+    if args.resume and (not args.journal or args.output):
+        print("❌ Error: --resume needs --journal and no --output", file=sys.stderr)
+        sys.exit(1)
+
+    # Open the sink first, so that when it streams to stdout every message
+    # of the command goes to stderr
+    with _output_sink(args) as sink:
+        _batch(args, sink)
+
+
+def _batch(args: argparse.Namespace, sink: Optional[OutputSink]) -> None:
+    """Run a batch command, optionally writing into an output sink."""
+    from .batch import (
+        BatchJournal,
+        parse_shard,
+        run_batch,
+        select_shard,
+        sink_base,
+        write_manifest,
+    )
+    from .progress import ProgressReporter
+
+    roots = args.roots
+    if args.since:
+        from .changes import affected_projects
+
+        try:
+            roots = affected_projects(roots, args.since, config_path=args.config)
+        except RuntimeError as e:
+            print(f"❌ Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        print(
+            f"✓ {len(roots)} of {len(args.roots)} project(s) changed "
+            f"since {args.since}"
+        )
+
+    shard = None
+    if args.shard:
+        try:
+            shard = parse_shard(args.shard)
+        except ValueError as e:
+            print(f"❌ Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        selected = select_shard(roots, *shard)
+        print(f"✓ Shard {args.shard}: {len(selected)} of {len(roots)} project(s)")
+        roots = selected
+
+    with contextlib.ExitStack() as stack:
+        journal, resumed = None, []
+        if args.journal:
+            journal = stack.enter_context(
+                BatchJournal(args.journal, args.action, resume=args.resume)
+            )
+            resumed = journal.completed(roots) if args.resume else []
+            if resumed:
+                print(f"✓ Resuming: {len(resumed)} project(s) already done")
+
+        done = {result.root for result in resumed}
+        pending = [root for root in roots if Path(root) not in done]
+        progress = stack.enter_context(
+            ProgressReporter(len(roots), style=args.progress, label=args.action)
+        )
+        progress.skip(len(resumed))
+
+        def finished(result: Any) -> None:
+            if journal is not None:
+                journal.record(result)
+            progress.update(result.ok)
+
+        try:
+            results = run_batch(
+                pending,
+                args.action,
+                jobs=args.jobs,
+                config_path=args.config,
+                sink=sink,
+                on_result=finished,
+                base=sink_base(args.roots),
+                enrich=args.enrich,
+            )
+        except ValueError as e:
+            print(f"❌ Error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    order = {Path(root): index for index, root in enumerate(roots)}
+    results = sorted(resumed + results, key=lambda result: order[result.root])
+
+    manifest = args.manifest
+    if manifest is None and shard is not None:
+        manifest = f"batch-{args.action}-{shard[0]}-of-{shard[1]}.json"
+    if manifest:
+        write_manifest(manifest, args.action, results, shard)
+        print(f"✓ Wrote results to {manifest}")
+
+    failed = 0
+    for result in results:
+        if result.error:
+            failed += 1
+            print(f"❌ {result.root}: {result.error}", file=sys.stderr)
+        elif not result.ok:
+            failed += 1
+            outputs = ", ".join(result.outputs)
+            print(f"✗ {result.root}: out of date ({outputs})", file=sys.stderr)
+
+    cache = render_cache()
+    if cache is not None and (cache.stats.hits or cache.stats.misses):
+        stats = cache.stats
+        print(
+            f"✓ Render cache: {stats.hits} hit(s), {stats.misses} miss(es) "
+            f"({stats.hit_rate:.0%})"
+        )
+
+    if failed:
+        print(f"❌ {failed} of {len(results)} project(s) failed", file=sys.stderr)
+        sys.exit(1)
+    print(f"🎉 Processed {len(results)} project(s)")
+
+
+def cmd_changed(args: argparse.Namespace) -> None:
+    """
+    Print the projects affected by changes since a git ref.
+
+    Args:
+        args: Command line arguments containing roots, ref and output format.
+
+    Raises:
+        SystemExit: If the changes cannot be listed.
+    """
+    from .changes import affected_projects
+
+    try:
+        roots = affected_projects(args.roots, args.since, config_path=args.config)
+    except RuntimeError as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    names = [os.path.normpath(root) for root in roots]
+    if args.json:
+        print(json.dumps(names))
+    elif names:
+        print("\n".join(names))
+
+
+def cmd_batch_merge(args: argparse.Namespace) -> None:
+    """
+    Combine the manifests written by the shards of a batch run.
+
+    Args:
+        args: Command line arguments containing manifest paths and output.
+
+    Raises:
+        SystemExit: If the manifests conflict, a shard is missing or any
+                    project failed.
+    """
+    from .batch import merge_manifests
+
+    try:
+        report = merge_manifests(args.manifests)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+        print(f"✓ Wrote report to {args.output}")
+
+    for project in report["projects"]:
+        if not project["ok"]:
+            outputs = ", ".join(project["outputs"])
+            problem = project["error"] or f"out of date ({outputs})"
+            print(f"❌ {project['root']}: {problem}", file=sys.stderr)
+
+    problems = []
+    if report["missing_shards"]:
+        missing = ", ".join(str(index) for index in report["missing_shards"])
+        problems.append(f"missing shard(s) {missing} of {report['shards']}")
+    if report["failed"]:
+        problems.append(f"{report['failed']} project(s) failed")
+    if problems:
+        print(f"❌ {'; '.join(problems)}", file=sys.stderr)
+        sys.exit(1)
+    print(
+        f"🎉 {report['action']}: {len(report['projects'])} project(s) "
+        f"across {report['shards']} shard(s)"
+    )
+
+
+def cmd_cache(args: argparse.Namespace) -> None:
+    """
+    Show or clear the user-level render cache.
+
+    Args:
+        args: Command line arguments containing the cache action.
+    """
+    from .cache import CACHE_DIR_ENV, RENDER_CACHE_ENV, RenderCache, user_cache_dir
+
+    cache = render_cache() or RenderCache(user_cache_dir() / "renders")
+    if args.action == "clear":
+        print(f"✓ Removed {cache.clear()} cached render(s) from {cache.directory}")
+        return
+
+    entries, size = cache.size()
+    print(f"Directory: {cache.directory} (set {CACHE_DIR_ENV} to move it)")
+    print(f"Entries:   {entries}")
+    print(f"Size:      {size / 1024:.1f} KiB of {cache.max_bytes / 1024 ** 2:.0f} MiB")
+    if render_cache() is None:
+        print(f"⚠️  Disabled by {RENDER_CACHE_ENV}")
+
+
+def cmd_pipeline(args: argparse.Namespace) -> None:
+    """
+    Run the configured release stages in one process.
+
+    Args:
+        args: Command line arguments containing config path and stage override.
+
+    Raises:
+        SystemExit: If the config cannot be loaded or a stage fails.
+    """
+    from .pipeline import run_pipeline
+
+    stages = [name for name in (args.stages or "").split(",") if name]
+    with _output_sink(args) as sink:
+        try:
+            results = run_pipeline(
+                args.config, stages=stages or None, sink=sink, enrich=args.enrich
+            )
+        except Exception as e:
+            print(f"❌ Pipeline failed: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        total = sum(result.seconds for result in results)
+        print(f"🎉 Ran {len(results)} stage(s) in {total:.2f}s")
+
 
 def main() -> None:
     """Main CLI entry point."""
@@ -211,13 +946,45 @@ def main() -> None:
     readme_parser.add_argument(
         "--config", default="config.yaml", help="Config file path"
     )
+    _add_check_arguments(readme_parser)
+    _add_enrich_argument(readme_parser)
+    _add_since_argument(readme_parser)
     readme_parser.set_defaults(func=cmd_make_readme)
 
     # Make all
     all_parser = make_subparsers.add_parser("all", help="Generate all repository files")
     all_parser.add_argument("--config", default="config.yaml", help="Config file path")
+    _add_check_arguments(all_parser)
+    _add_enrich_argument(all_parser)
+    _add_since_argument(all_parser)
+    _add_output_argument(all_parser)
     all_parser.set_defaults(func=cmd_make_all)
 
+    # Make assets
+    assets_parser = make_subparsers.add_parser(
+        "assets", help="Generate resized logo and banner variants"
+    )
+    assets_parser.add_argument(
+        "--config", default="config.yaml", help="Config file path"
+    )
+    assets_parser.add_argument(
+        "--jobs", type=int, default=None, help="Images processed in parallel"
+    )
+    assets_parser.set_defaults(func=cmd_make_assets)
+
+    # Config command
+    config_parser = subparsers.add_parser(
+        "config", help="Show the fully resolved config (after extends/include)"
+    )
+    config_parser.add_argument(
+        "--config", default="config.yaml", help="Config file path"
+    )
+    config_parser.add_argument(
+        "--format", choices=["yaml", "json"], default="yaml", help="Output format"
+    )
+    _add_enrich_argument(config_parser)
+    config_parser.set_defaults(func=cmd_config)
+
     # Init command
     init_parser = subparsers.add_parser(
         "init", help="Initialize new project with sample config"
@@ -231,8 +998,198 @@ def main() -> None:
     automate_parser.add_argument(
         "--config", default="config.yaml", help="Config file path"
     )
+    _add_enrich_argument(automate_parser)
+    _add_since_argument(automate_parser)
+    _add_output_argument(automate_parser)
     automate_parser.set_defaults(func=cmd_automate)
 
+    # Zenodo upload command
+    zenodo_parser = subparsers.add_parser(
+        "zenodo-upload", help="Upload files to a Zenodo deposition"
+    )
+    zenodo_parser.add_argument(
+        "files", nargs="+", help="Files, or directories whose files, to upload"
+    )
+    zenodo_parser.add_argument(
+        "--config", default="config.yaml", help="Config file path"
+    )
+    target_group = zenodo_parser.add_mutually_exclusive_group()
+    target_group.add_argument("--deposition", help="Existing draft deposition ID")
+    target_group.add_argument(
+        "--new-version", help="Create a new version of this published record ID"
+    )
+    zenodo_parser.add_argument(
+        "--jobs", type=int, default=4, help="Maximum concurrent uploads"
+    )
+    zenodo_parser.add_argument(
+        "--sandbox", action="store_true", help="Use sandbox.zenodo.org"
+    )
+    zenodo_parser.add_argument(
+        "--publish", action="store_true", help="Publish the deposition afterwards"
+    )
+    zenodo_parser.set_defaults(func=cmd_zenodo_upload)
+
+    # Release delta command
+    delta_parser = subparsers.add_parser(
+        "release-delta", help="Stage only the files changed since the last release"
+    )
+    delta_parser.add_argument("--tag", default="HEAD", help="Release tag or commit")
+    delta_parser.add_argument(
+        "--previous", help="Previous release tag (default: latest v* tag before it)"
+    )
+    delta_parser.add_argument(
+        "--output", default="release-delta", help="Directory to stage files in"
+    )
+    delta_parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Stage every blob, not only those new since the previous release",
+    )
+    delta_parser.set_defaults(func=cmd_release_delta)
+
+    # Package command
+    package_parser = subparsers.add_parser(
+        "package", help="Build reproducible release archives with checksums"
+    )
+    package_parser.add_argument("--ref", default="HEAD", help="Tag or commit")
+    package_parser.add_argument(
+        "--config", default="config.yaml", help="Config file path"
+    )
+    package_parser.add_argument("--name", help="Archive name and entry prefix")
+    package_parser.add_argument(
+        "--output", default="dist", help="Directory to write archives to"
+    )
+    package_parser.add_argument(
+        "--format",
+        action="append",
+        choices=["tar.gz", "zip"],
+        help="Archive format (repeatable; default: both)",
+    )
+    package_parser.add_argument(
+        "--jobs", type=int, help="Compression threads (default: CPU count)"
+    )
+    package_parser.add_argument(
+        "--level", type=int, default=6, help="Compression level (0-9)"
+    )
+    package_parser.set_defaults(func=cmd_package)
+
+    # Check links command
+    links_parser = subparsers.add_parser(
+        "check-links", help="Check config links, DOIs and ORCID iDs"
+    )
+    links_parser.add_argument(
+        "configs", nargs="*", help="Config file paths (default: config.yaml)"
+    )
+    links_parser.add_argument(
+        "--jobs", type=int, default=4, help="Maximum connections per host"
+    )
+    links_parser.add_argument(
+        "--rate", type=float, help="Maximum requests per second per host"
+    )
+    links_parser.add_argument(
+        "--ttl",
+        type=float,
+        default=24 * 60 * 60,
+        help="Seconds cached responses stay fresh",
+    )
+    links_parser.add_argument(
+        "--no-cache", action="store_true", help="Ignore the response cache"
+    )
+    links_parser.set_defaults(func=cmd_check_links)
+
+    # Pipeline command
+    pipeline_parser = subparsers.add_parser(
+        "pipeline", help="Run the stages listed under 'pipeline' in the config"
+    )
+    pipeline_parser.add_argument(
+        "--config", default="config.yaml", help="Config file path"
+    )
+    pipeline_parser.add_argument(
+        "--stages",
+        help="Comma-separated stages to run instead "
+        "(generate, integrations, changelog, tag)",
+    )
+    _add_enrich_argument(pipeline_parser)
+    _add_output_argument(pipeline_parser)
+    pipeline_parser.set_defaults(func=cmd_pipeline)
+
+    # Batch command
+    batch_parser = subparsers.add_parser(
+        "batch", help="Run an action across many project checkouts concurrently"
+    )
+    batch_parser.add_argument(
+        "action", choices=["generate", "integrations", "check"], help="What to run"
+    )
+    batch_parser.add_argument("roots", nargs="+", help="Project root directories")
+    batch_parser.add_argument(
+        "--config", default="config.yaml", help="Config file path within each root"
+    )
+    batch_parser.add_argument(
+        "--jobs", type=int, default=None, help="Projects processed concurrently"
+    )
+    batch_parser.add_argument(
+        "--shard",
+        metavar="INDEX/COUNT",
+        help="Process only the projects assigned to this shard, e.g. 1/8",
+    )
+    batch_parser.add_argument(
+        "--manifest",
+        help="Write results as JSON here "
+        "(default with --shard: batch-ACTION-INDEX-of-COUNT.json)",
+    )
+    batch_parser.add_argument(
+        "--journal",
+        help="Append each finished project to this file, for --resume",
+    )
+    batch_parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip the projects the journal records as finished",
+    )
+    batch_parser.add_argument(
+        "--progress",
+        choices=["auto", "bar", "json", "none"],
+        default="auto",
+        help="Progress on stderr: a bar on a terminal, JSON lines otherwise",
+    )
+    _add_enrich_argument(batch_parser)
+    _add_since_argument(batch_parser)
+    _add_output_argument(batch_parser)
+    batch_parser.set_defaults(func=cmd_batch)
+
+    # Changed command
+    changed_parser = subparsers.add_parser(
+        "changed", help="List the projects affected by changes since a git ref"
+    )
+    changed_parser.add_argument("roots", nargs="+", help="Project root directories")
+    changed_parser.add_argument(
+        "--since", required=True, metavar="REF", help="Git ref to compare against"
+    )
+    changed_parser.add_argument(
+        "--config", default="config.yaml", help="Config file path within each root"
+    )
+    changed_parser.add_argument(
+        "--json", action="store_true", help="Print a JSON list instead of lines"
+    )
+    changed_parser.set_defaults(func=cmd_changed)
+
+    # Batch merge command
+    merge_parser = subparsers.add_parser(
+        "batch-merge", help="Combine the result manifests of sharded batch runs"
+    )
+    merge_parser.add_argument("manifests", nargs="+", help="Shard manifest files")
+    merge_parser.add_argument("--output", help="Write the combined report here")
+    merge_parser.set_defaults(func=cmd_batch_merge)
+
+    # Cache command
+    cache_parser = subparsers.add_parser(
+        "cache", help="Show or clear the user-level render cache"
+    )
+    cache_parser.add_argument(
+        "action", nargs="?", choices=["info", "clear"], default="info"
+    )
+    cache_parser.set_defaults(func=cmd_cache)
+
     args = parser.parse_args()
 
     if not args.command:
@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""
+Configuration loading with layered inheritance.
+
+A project config may build on shared organisation-level configs through the
+``extends`` and ``include`` keys. Each entry is a path (or list of paths),
+relative to the file that references it. Bases are deep-merged in order
+(``extends`` first, then ``include``) and the project's own keys are merged
+last, so they always win. Mappings merge recursively; lists and scalars are
+replaced.
+
+Besides YAML, configs may be written as JSON or TOML, or live in the
+``[tool.auto-research-readme]`` table of a ``pyproject.toml``, in which case
+missing fields are filled in from the standard ``[project]`` metadata. JSON and
+TOML are parsed with the standard library, so PyYAML is only imported when a
+YAML file is actually read.
+
+Parsed files are memoized by content hash and resolved base configs by file
+identity, so a batch run over many projects that share one org base only
+reads, parses and merges that base once per process.
+"""
+
+import copy
+import hashlib
+import json
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+ConfigDict = Dict[str, Any]
+
+INHERITANCE_KEYS = ("extends", "include")
+
+PYPROJECT_TOOL = "auto-research-readme"
+
+# Searched in order when no explicit config path is given
+DEFAULT_CONFIG_PATHS = (
+    "config/config.yaml",
+    "config.yaml",
+    "config/config.yml",
+    "config.yml",
+    "config/config.toml",
+    "config.toml",
+    "config/config.json",
+    "config.json",
+    "pyproject.toml",
+)
+
+# Parsed config files kept per process before the least recently used are
+# dropped; shared bases stay in use, so they are rarely parsed twice
+PARSE_CACHE_SIZE = 256
+
+# (parser, content digest) -> parsed (unresolved) config, in LRU order
+_PARSE_CACHE: "OrderedDict[Tuple[str, str], ConfigDict]" = OrderedDict()
+_PARSE_CACHE_LOCK = threading.Lock()
+
+FileIdentity = Optional[Tuple[int, int]]
+
+# Resolved base path -> (identities of every file in its chain, resolved config,
+# contributing source files)
+_BASE_CACHE: Dict[
+    Path, Tuple[List[Tuple[Path, FileIdentity]], ConfigDict, List[Path]]
+] = {}
+
+
+def deep_merge(base: ConfigDict, override: ConfigDict) -> ConfigDict:
+    """
+    Deep-merge two config mappings without modifying either.
+
+    Args:
+        base: Mapping providing default values.
+        override: Mapping whose values take precedence.
+
+    Returns:
+        New merged mapping.
+    """
+    merged = dict(base)
+    for key, value in override.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = deep_merge(merged[key], value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def find_config_file(
+    config_path: str = "config.yaml", root: Union[str, Path] = "."
+) -> Path:
+    """
+    Locate the configuration file to load.
+
+    Args:
+        config_path: Path to the configuration file. If the default is used,
+                    the locations in DEFAULT_CONFIG_PATHS are searched in order;
+                    pyproject.toml only counts if it has a
+                    [tool.auto-research-readme] table.
+        root: Project root directory; relative paths are resolved against it.
+
+    Returns:
+        Path to the configuration file.
+
+    Raises:
+        FileNotFoundError: If the configuration file cannot be found.
+    """
+    # If a specific path is provided, try it first
+    if config_path != "config.yaml":
+        specific_path = Path(root) / config_path
+        if specific_path.exists():
+            return specific_path
+        raise FileNotFoundError(f"Could not find config file: {config_path}")
+
+    # Default search order: YAML first, then TOML/JSON, then pyproject.toml
+    for candidate in DEFAULT_CONFIG_PATHS:
+        path = Path(root) / candidate
+        if path.exists():
+            if path.name == "pyproject.toml" and not _has_tool_table(path):
+                continue
+            return path
+
+    raise FileNotFoundError(
+        "Could not find config.yaml (or config.toml, config.json, or a "
+        "pyproject.toml with [tool.auto-research-readme]) in "
+        f"{'current directory' if str(root) == '.' else root} or config/ folder"
+    )
+
+
+def load_config(
+    config_path: str = "config.yaml", root: Union[str, Path] = "."
+) -> ConfigDict:
+    """
+    Load a configuration file, resolving ``extends``/``include`` bases.
+
+    YAML, JSON, TOML and pyproject.toml files are supported; the format is
+    chosen from the file name.
+
+    Args:
+        config_path: Path to the configuration file. Defaults to "config.yaml".
+                    If default is used, searches in config/config.yaml first.
+        root: Project root directory; relative paths are resolved against it.
+
+    Returns:
+        Dictionary containing the fully resolved configuration.
+
+    Raises:
+        FileNotFoundError: If the configuration file or a base cannot be found.
+        ValueError: If config inheritance is circular.
+        ValueError: If a JSON or TOML file is malformed.
+        yaml.YAMLError: If a YAML file is malformed.
+    """
+    config, _ = load_config_with_sources(config_path, root)
+    return config
+
+
+def load_config_with_sources(
+    config_path: str = "config.yaml", root: Union[str, Path] = "."
+) -> Tuple[ConfigDict, List[Path]]:
+    """
+    Load a configuration and report every file that contributed to it.
+
+    Args:
+        config_path: Path to the configuration file.
+        root: Project root directory; relative paths are resolved against it.
+
+    Returns:
+        Tuple of the resolved configuration and the list of source files,
+        starting with the project config itself.
+
+    Raises:
+        FileNotFoundError: If the configuration file or a base cannot be found.
+        ValueError: If config inheritance is circular or a file is malformed.
+        yaml.YAMLError: If a YAML file is malformed.
+    """
+    path = find_config_file(config_path, root)
+    raw = _parse_file(path)
+    config, sources = _resolve(raw, path, [])
+    return copy.deepcopy(config), [path, *sources]
+
+
+def dump_config(config: ConfigDict) -> str:
+    """
+    Serialize a resolved configuration for debugging.
+
+    Args:
+        config: Configuration dictionary.
+
+    Returns:
+        YAML representation preserving key order.
+    """
+    import yaml
+
+    return yaml.safe_dump(config, sort_keys=False, allow_unicode=True)
+
+
+def clear_config_cache() -> None:
+    """Forget all memoized config files and resolved bases."""
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE.clear()
+    _BASE_CACHE.clear()
+
+
+def _parse_file(path: Path) -> ConfigDict:
+    """
+    Read and parse a config file, memoized by content hash.
+
+    The ``PARSE_CACHE_SIZE`` most recently used files are kept, so a batch
+    over thousands of projects does not hold every config in memory.
+
+    Args:
+        path: Config file path.
+
+    Returns:
+        Parsed mapping. Callers must not modify it.
+
+    Raises:
+        ValueError: If the file does not contain a mapping.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+
+    parser = _parser_for(path)
+    key = (parser, hashlib.sha256(text.encode("utf-8")).hexdigest())
+    with _PARSE_CACHE_LOCK:
+        parsed = _PARSE_CACHE.get(key)
+        if parsed is not None:
+            _PARSE_CACHE.move_to_end(key)
+            return parsed
+
+    parsed = _PARSERS[parser](text) or {}
+    if not isinstance(parsed, dict):
+        raise ValueError(f"Config file {path} must contain a mapping")
+    with _PARSE_CACHE_LOCK:
+        _PARSE_CACHE[key] = parsed
+        while len(_PARSE_CACHE) > PARSE_CACHE_SIZE:
+            _PARSE_CACHE.popitem(last=False)
+    return parsed
+
+
+def _parser_for(path: Path) -> str:
+    """Choose a parser name from a config file name."""
+    if path.name == "pyproject.toml":
+        return "pyproject"
+    suffix = path.suffix.lower()
+    if suffix == ".json":
+        return "json"
+    if suffix == ".toml":
+        return "toml"
+    return "yaml"
+
+
+def _parse_yaml(text: str) -> Any:
+    """Parse YAML text, importing PyYAML only when needed."""
+    import yaml
+
+    return yaml.safe_load(text)
+
+
+def _parse_toml(text: str) -> Any:
+    """Parse TOML text with tomllib (or tomli before Python 3.11)."""
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            raise ImportError(
+                "tomli is required to read TOML configs on Python < 3.11. "
+                "Please install with 'pip install tomli'."
+            )
+
+    return tomllib.loads(text)
+
+
+def _parse_pyproject(text: str) -> ConfigDict:
+    """
+    Build a config from a pyproject.toml.
+
+    Fields from the ``[project]`` table provide defaults; the
+    ``[tool.auto-research-readme]`` table overrides them.
+
+    Args:
+        text: pyproject.toml content.
+
+    Returns:
+        Config mapping.
+    """
+    pyproject = _parse_toml(text)
+    project = pyproject.get("project", {})
+    tool = pyproject.get("tool", {}).get(PYPROJECT_TOOL, {})
+
+    metadata: ConfigDict = {"type": "python-package"}
+    if project.get("name"):
+        metadata["title"] = project["name"]
+        metadata["package_name"] = project["name"]
+    for field in ("version", "description"):
+        if project.get(field):
+            metadata[field] = project[field]
+    if project.get("keywords"):
+        metadata["tags"] = list(project["keywords"])
+
+    authors = [a for a in project.get("authors", []) if a.get("name")]
+    if authors:
+        metadata["contributors"] = [
+            {k: v for k, v in a.items() if k in ("name", "email")} for a in authors
+        ]
+    maintainers = project.get("maintainers") or project.get("authors") or []
+    emails = [m["email"] for m in maintainers if m.get("email")]
+    if emails:
+        metadata["maintainer"] = emails[0]
+
+    for label, url in project.get("urls", {}).items():
+        if "github.com" in url and "github_link" not in metadata:
+            metadata["github_link"] = url
+        elif label.lower() == "homepage":
+            metadata.setdefault("homepage", url)
+
+    return deep_merge(metadata, tool)
+
+
+def _has_tool_table(path: Path) -> bool:
+    """Cheaply check whether a pyproject.toml configures this tool."""
+    try:
+        text = path.read_text(encoding="utf-8")
+    except OSError:
+        return False
+    return f"[tool.{PYPROJECT_TOOL}" in text or f'[tool."{PYPROJECT_TOOL}"' in text
+
+
+_PARSERS: Dict[str, Callable[[str], Any]] = {
+    "yaml": _parse_yaml,
+    "json": json.loads,
+    "toml": _parse_toml,
+    "pyproject": _parse_pyproject,
+}
+
+
+def _base_paths(raw: ConfigDict, path: Path) -> List[Path]:
+    """
+    List the base configs referenced by a config, in merge order.
+
+    Args:
+        raw: Parsed config mapping.
+        path: Path of the file the mapping was read from.
+
+    Returns:
+        Base config paths resolved relative to the referencing file.
+    """
+    bases: List[Path] = []
+    for key in INHERITANCE_KEYS:
+        entries = raw.get(key) or []
+        if isinstance(entries, str):
+            entries = [entries]
+        bases.extend((path.parent / entry).resolve() for entry in entries)
+    return bases
+
+
+def _resolve(
+    raw: ConfigDict, path: Path, stack: List[Path]
+) -> Tuple[ConfigDict, List[Path]]:
+    """
+    Merge a parsed config over its bases.
+
+    Args:
+        raw: Parsed config mapping.
+        path: Path of the file the mapping was read from.
+        stack: Files currently being resolved, for cycle detection.
+
+    Returns:
+        Tuple of the merged config and the base files it depends on.
+    """
+    bases = _base_paths(raw, path)
+    if not bases:
+        return raw, []
+
+    merged: ConfigDict = {}
+    sources: List[Path] = []
+    for base_path in bases:
+        base_config, base_sources = _load_base(base_path, [*stack, path.resolve()])
+        merged = deep_merge(merged, base_config)
+        sources.extend(base_sources)
+
+    own = {k: v for k, v in raw.items() if k not in INHERITANCE_KEYS}
+    return deep_merge(merged, own), sources
+
+
+def _load_base(path: Path, stack: List[Path]) -> Tuple[ConfigDict, List[Path]]:
+    """
+    Load a fully resolved base config, memoized per process.
+
+    A cached entry stays valid while none of the files in its inheritance
+    chain have changed size or modification time.
+
+    Args:
+        path: Resolved path of the base config.
+        stack: Files currently being resolved, for cycle detection.
+
+    Returns:
+        Tuple of the resolved base config and its source files.
+
+    Raises:
+        FileNotFoundError: If the base config does not exist.
+        ValueError: If config inheritance is circular.
+    """
+    if path in stack:
+        chain = " -> ".join(str(p) for p in [*stack, path])
+        raise ValueError(f"Circular config inheritance: {chain}")
+
+    cached = _BASE_CACHE.get(path)
+    if cached is not None:
+        identities, config, sources = cached
+        if all(_file_identity(p) == identity for p, identity in identities):
+            return config, sources
+
+    if not path.exists():
+        raise FileNotFoundError(f"Could not find base config file: {path}")
+
+    raw = _parse_file(path)
+    config, base_sources = _resolve(raw, path, stack)
+    sources = [path, *base_sources]
+    identities = [(p, _file_identity(p)) for p in sources]
+    _BASE_CACHE[path] = (identities, config, sources)
+    return config, sources
+
+
+def _file_identity(path: Path) -> FileIdentity:
+    """Return (mtime_ns, size) for a file, or None if it is missing."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
@@ -0,0 +1,456 @@
+"""
+Contributor metadata enrichment from ORCID and DOI registries.
+
+Configs usually carry hand-maintained contributor names and affiliations.
+This optional stage resolves each contributor's ORCID iD (and the project
+DOI, to discover ORCID iDs that are missing) and fills in the canonical name
+and current affiliation from the registries.
+
+Lookups go through one bounded ``AsyncHTTPClient`` and a ``MetadataResolver``
+shared by the whole batch, so an identifier shared by many projects is
+resolved once. Parsed records are cached on disk per identifier with an
+expiry, so later runs only hit the network for new or expired identifiers.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+import unicodedata
+from pathlib import Path
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Union,
+    cast,
+)
+
+from auto_readme.cache import user_cache_dir
+from auto_readme.links import (
+    DOI_RESOLVER,
+    PEOPLE_FIELDS,
+    normalize_doi,
+    normalize_orcid,
+    valid_doi,
+    valid_orcid,
+)
+from auto_readme.net import REQUEST_ERRORS, AsyncHTTPClient
+
+ConfigDict = Dict[str, Any]
+Record = Dict[str, Any]
+
+ORCID_API = "https://pub.orcid.org/v3.0/"
+CSL_JSON = "application/vnd.citationstyles.csl+json"
+DEFAULT_TTL = 7 * 24 * 60 * 60
+
+# Titles and post-nominals ignored when comparing names
+_NAME_AFFIXES = {"dr", "prof", "mr", "mrs", "ms", "phd", "md", "msc", "jr", "sr"}
+
+
+class IdentifierCache:
+    """
+    On-disk cache of resolved records, keyed by identifier.
+
+    Lookups that found nothing are cached too, so unknown identifiers are not
+    requested again until they expire. Entries are written atomically, so
+    concurrent batches can share the directory.
+    """
+
+    def __init__(self, directory: Union[str, Path], ttl: float = DEFAULT_TTL) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Cache directory; created on first write.
+            ttl: Seconds an entry stays valid.
+        """
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    def get(self, identifier: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up an identifier.
+
+        Returns:
+            ``{"record": ...}`` for an unexpired entry (the record may be
+            None), or None if there is no usable entry.
+        """
+        try:
+            entry = json.loads(self._path(identifier).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if float(entry.get("expires", 0)) <= time.time():
+            return None
+        record = entry.get("record")
+        if record is not None and not isinstance(record, dict):
+            return None
+        return {"record": record}
+
+    def put(self, identifier: str, record: Optional[Record]) -> None:
+        """Store the record resolved for an identifier."""
+        path = self._path(identifier)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "identifier": identifier,
+            "record": record,
+            "expires": time.time() + self.ttl,
+        }
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f)
+        os.replace(tmp, path)
+
+    def _path(self, identifier: str) -> Path:
+        kind = identifier.split(":", 1)[0]
+        digest = hashlib.sha256(identifier.encode("utf-8")).hexdigest()
+        return self.directory / kind / f"{digest}.json"
+
+
+class MetadataResolver:
+    """
+    Resolve ORCID iDs and DOIs to normalized records.
+
+    Concurrent lookups of the same identifier share one request, and the
+    number of lookups in flight is bounded.
+    """
+
+    def __init__(
+        self,
+        client: AsyncHTTPClient,
+        cache: Optional[IdentifierCache] = None,
+        concurrency: int = 16,
+        orcid_api: str = ORCID_API,
+        doi_resolver: str = DOI_RESOLVER,
+    ) -> None:
+        """
+        Initialize the resolver.
+
+        Args:
+            client: HTTP client shared by the batch.
+            cache: Optional on-disk record cache.
+            concurrency: Maximum lookups in flight.
+            orcid_api: Base URL of the ORCID public API.
+            doi_resolver: Base URL DOIs are resolved against.
+        """
+        self.client = client
+        self.cache = cache
+        self.orcid_api = orcid_api
+        self.doi_resolver = doi_resolver
+        self._concurrency = concurrency
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._lookups: Dict[str, "asyncio.Future[Optional[Record]]"] = {}
+
+    async def orcid(self, orcid: str) -> Optional[Record]:
+        """
+        Resolve an ORCID iD.
+
+        Returns:
+            ``{"orcid", "name", "affiliation"}``, or None if unresolved.
+        """
+        url = f"{self.orcid_api}{orcid}/record"
+
+        async def fetch() -> Optional[Record]:
+            data = await self._get_document(url, "application/json")
+            return parse_orcid_record(orcid, data) if data else None
+
+        return await self._resolve(f"orcid:{orcid}", fetch)
+
+    async def doi(self, doi: str) -> Optional[Record]:
+        """
+        Resolve a DOI via content negotiation.
+
+        Returns:
+            ``{"doi", "title", "authors"}`` where each author has ``name``,
+            ``family``, ``orcid`` and ``affiliation``; or None if unresolved.
+        """
+        url = self.doi_resolver + doi
+
+        async def fetch() -> Optional[Record]:
+            data = await self._get_document(url, CSL_JSON)
+            return parse_csl_record(doi, data) if data else None
+
+        return await self._resolve(f"doi:{doi.lower()}", fetch)
+
+    async def _get_document(self, url: str, accept: str) -> Optional[Dict[str, Any]]:
+        """
+        GET a JSON document.
+
+        Returns:
+            The decoded document, or None if the registry does not know it.
+
+        Raises:
+            ValueError: On other error statuses or invalid JSON.
+        """
+        response = await self.client.request("GET", url, {"Accept": accept})
+        if response.status in (404, 410):
+            return None
+        if not 200 <= response.status < 300:
+            raise ValueError(f"HTTP {response.status} for {url}")
+        return dict(response.json())
+
+    async def _resolve(
+        self, identifier: str, fetch: Callable[[], Awaitable[Optional[Record]]]
+    ) -> Optional[Record]:
+        """Look up an identifier once: in flight, in the cache, or remotely."""
+        future = self._lookups.get(identifier)
+        if future is None:
+            future = asyncio.ensure_future(self._lookup(identifier, fetch))
+            self._lookups[identifier] = future
+        return await asyncio.shield(future)
+
+    async def _lookup(
+        self, identifier: str, fetch: Callable[[], Awaitable[Optional[Record]]]
+    ) -> Optional[Record]:
+        cached = self.cache.get(identifier) if self.cache else None
+        if cached is not None:
+            return cast(Optional[Record], cached["record"])
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+        async with self._semaphore:
+            try:
+                record: Optional[Record] = await fetch()
+            except (KeyError, TypeError, AttributeError):
+                record = None  # unexpected document shape
+            except REQUEST_ERRORS:
+                return None  # transient failure; retry on the next run
+
+        if self.cache:
+            self.cache.put(identifier, record)
+        return record
+
+
+def parse_orcid_record(orcid: str, data: Dict[str, Any]) -> Record:
+    """
+    Extract the canonical name and current affiliation from an ORCID record.
+
+    Args:
+        orcid: ORCID iD the record belongs to.
+        data: ORCID v3.0 ``/record`` JSON document.
+
+    Returns:
+        ``{"orcid", "name", "affiliation"}``; missing values are None.
+    """
+    name = (data.get("person") or {}).get("name") or {}
+    credit = _value(name.get("credit-name"))
+    given = _value(name.get("given-names"))
+    family = _value(name.get("family-name"))
+    full_name = credit or " ".join(p for p in (given, family) if p) or None
+
+    affiliation = None
+    activities = data.get("activities-summary") or {}
+    groups = (activities.get("employments") or {}).get("affiliation-group") or []
+    for group in groups:
+        for summary in group.get("summaries") or []:
+            employment = summary.get("employment-summary") or {}
+            if employment.get("end-date") is None:
+                affiliation = (employment.get("organization") or {}).get("name")
+                break
+        if affiliation:
+            break
+
+    return {"orcid": orcid, "name": full_name, "affiliation": affiliation}
+
+
+def parse_csl_record(doi: str, data: Dict[str, Any]) -> Record:
+    """
+    Extract the author list from CSL JSON returned by a DOI resolver.
+
+    Args:
+        doi: DOI the record belongs to.
+        data: CSL JSON document.
+
+    Returns:
+        ``{"doi", "title", "authors"}``.
+    """
+    authors = []
+    for author in data.get("author") or []:
+        name = author.get("literal") or " ".join(
+            p for p in (author.get("given"), author.get("family")) if p
+        )
+        orcid = normalize_orcid(str(author.get("ORCID") or ""))
+        affiliations = [
+            a["name"] for a in author.get("affiliation") or [] if a.get("name")
+        ]
+        authors.append(
+            {
+                "name": name or None,
+                "family": author.get("family"),
+                "orcid": orcid if valid_orcid(orcid) else None,
+                "affiliation": affiliations[0] if affiliations else None,
+            }
+        )
+    return {"doi": doi, "title": data.get("title"), "authors": authors}
+
+
+async def enrich_config(
+    config: ConfigDict, resolver: MetadataResolver, overwrite: bool = True
+) -> ConfigDict:
+    """
+    Fill in contributor names, affiliations and ORCID iDs from registries.
+
+    Contributors without an ORCID iD are matched by full name against the
+    authors of the project DOI; ambiguous matches are skipped. Contributors
+    with an ORCID iD then get the registry's name and current affiliation.
+    The name of a contributor whose ORCID iD was inferred from the DOI is
+    never replaced, since the match itself was made on that name.
+
+    Args:
+        config: Project configuration dictionary (not modified).
+        resolver: Resolver shared by the batch.
+        overwrite: Replace existing names and affiliations; if False, only
+                   fill in missing values.
+
+    Returns:
+        Enriched copy of the config.
+    """
+    config = copy.deepcopy(config)
+    people = [
+        person
+        for field in PEOPLE_FIELDS
+        for person in config.get(field) or []
+        if isinstance(person, dict)
+    ]
+
+    inferred = set()
+    doi = normalize_doi(str(config.get("doi") or ""))
+    if valid_doi(doi) and any(not person.get("orcid") for person in people):
+        record = await resolver.doi(doi)
+        matches = {}
+        for index, person in enumerate(people):
+            match = _match_author(person, record["authors"]) if record else None
+            if match and not person.get("orcid"):
+                matches[index] = match
+
+        # An author matched by two contributors identifies neither
+        claimed = [match["orcid"] for match in matches.values()]
+        for index, match in matches.items():
+            if claimed.count(match["orcid"]) > 1:
+                continue
+            person = people[index]
+            person["orcid"] = match["orcid"]
+            inferred.add(index)
+            if match["affiliation"]:
+                _set(person, "affiliation", match["affiliation"], overwrite)
+
+    orcids = sorted({normalize_orcid(str(p.get("orcid") or "")) for p in people} - {""})
+    orcids = [orcid for orcid in orcids if valid_orcid(orcid)]
+    records = dict(zip(orcids, await asyncio.gather(*map(resolver.orcid, orcids))))
+
+    for index, person in enumerate(people):
+        person_record = records.get(normalize_orcid(str(person.get("orcid") or "")))
+        if person_record:
+            for key in ("name", "affiliation"):
+                if person_record[key]:
+                    replace = overwrite and not (key == "name" and index in inferred)
+                    _set(person, key, person_record[key], replace)
+    return config
+
+
+async def enrich_configs(
+    configs: Sequence[ConfigDict], resolver: MetadataResolver, overwrite: bool = True
+) -> List[ConfigDict]:
+    """Enrich many configs concurrently with one shared resolver."""
+    return list(
+        await asyncio.gather(*(enrich_config(c, resolver, overwrite) for c in configs))
+    )
+
+
+def run_enrichment(
+    configs: Sequence[ConfigDict],
+    overwrite: bool = True,
+    max_per_host: int = 8,
+    ttl: float = DEFAULT_TTL,
+    cache_dir: Optional[Union[str, Path]] = None,
+    use_cache: bool = True,
+) -> List[ConfigDict]:
+    """
+    Synchronous entry point for ``enrich_configs``.
+
+    Args:
+        configs: Project configuration dictionaries.
+        overwrite: Replace existing names and affiliations.
+        max_per_host: Maximum concurrent connections per registry.
+        ttl: Seconds resolved records stay cached.
+        cache_dir: Record cache directory. Defaults to the user cache.
+        use_cache: Whether to use the record cache at all.
+
+    Returns:
+        Enriched copies of the configs, in input order.
+    """
+    cache = None
+    if use_cache:
+        cache = IdentifierCache(cache_dir or user_cache_dir() / "identifiers", ttl)
+
+    async def run() -> List[ConfigDict]:
+        async with AsyncHTTPClient(max_per_host) as client:
+            resolver = MetadataResolver(client, cache)
+            return await enrich_configs(configs, resolver, overwrite)
+
+    return asyncio.run(run())
+
+
+def _match_author(person: Dict[str, Any], authors: List[Record]) -> Optional[Record]:
+    """
+    Find the one DOI author with a person's full name and an ORCID iD.
+
+    Names are compared in full (given and family names), ignoring case,
+    accents, punctuation, titles and suffixes such as "PhD". If several
+    authors fit, none is returned rather than guessing.
+    """
+    name = normalize_name(str(person.get("name") or ""))
+    if not name:
+        return None
+    matches = [
+        author
+        for author in authors
+        if author["orcid"] and normalize_name(author["name"] or "") == name
+    ]
+    return matches[0] if len(matches) == 1 else None
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a personal name for comparison.
+
+    ``"Dr. José García-López, PhD"`` and ``"García-López, José"`` both
+    become ``"jose garcia lopez"``.
+
+    Args:
+        name: Name as written in a config or registry record.
+
+    Returns:
+        Lowercase given and family name words, or an empty string.
+    """
+    text = unicodedata.normalize("NFKD", name)
+    text = "".join(c for c in text if not unicodedata.combining(c)).lower()
+
+    # "Family, Given" unless everything after the comma is a suffix
+    head, _, tail = text.partition(",")
+    tail_words = re.findall(r"[a-z]+", tail)
+    if tail_words and not set(tail_words) <= _NAME_AFFIXES:
+        text = f"{tail} {head}"
+    elif tail_words:
+        text = head
+
+    words = re.findall(r"[a-z]+", text)
+    return " ".join(word for word in words if word not in _NAME_AFFIXES)
+
+
+def _set(person: Dict[str, Any], key: str, value: str, overwrite: bool) -> None:
+    if overwrite or not person.get(key):
+        person[key] = value
+
+
+def _value(field: Any) -> Optional[str]:
+    """Read the ``value`` of an ORCID name field."""
+    return field.get("value") if isinstance(field, dict) else None
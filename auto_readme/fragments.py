@@ -0,0 +1,207 @@
+"""
+Fragment caching for templates.
+
+``{% cache key %}...{% endcache %}`` memoizes the rendered body of a block by
+the value of ``key``, so a large section (a contributor table, a file
+inventory, a citation block) that depends on a few values is spliced in
+unchanged instead of being re-rendered whenever anything else in the config
+changes::
+
+    {% cache contributors %}
+    | Name | Affiliation |
+    |------|-------------|
+    {%- for c in contributors %}
+    | {{ c.name }} | {{ c.affiliation }} |
+    {%- endfor %}
+    {% endcache %}
+
+The key must cover every value the body uses. The body's source, and the
+digest of every template it includes or imports, are part of the cache key,
+so editing either invalidates the fragment. A body that names a template with
+an expression (``{% include name %}``) is rendered every time. Rendered
+fragments are kept in a per-process LRU cache and, unless
+``AUTO_README_RENDER_CACHE`` disables it, in the user-level render cache on
+disk. The extension is enabled in every environment from
+:func:`auto_readme.template_loader.get_environment`.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, List, Optional, Tuple, cast
+
+from jinja2 import TemplateNotFound, meta, nodes
+from jinja2.ext import Extension
+from jinja2.parser import Parser
+
+from .cache import RenderCache, render_cache
+
+# Fragments kept in memory per process
+DEFAULT_FRAGMENT_CACHE_SIZE = 1024
+
+
+class FragmentCache:
+    """Thread-safe, size-bounded LRU mapping of fragment keys to rendered text."""
+
+    def __init__(self, max_entries: int = DEFAULT_FRAGMENT_CACHE_SIZE) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Fragments to keep before the least recently used
+                         are dropped.
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a fragment, marking it as recently used."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: str) -> None:
+        """Store a fragment, dropping the least recently used if full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Forget every fragment."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_FRAGMENTS = FragmentCache()
+
+
+def clear_fragment_cache() -> None:
+    """Forget the fragments cached in this process."""
+    _FRAGMENTS.clear()
+
+
+class FragmentCacheExtension(Extension):
+    """
+    Jinja extension adding the ``{% cache key %}`` block tag.
+
+    Environment attributes:
+        fragment_cache: In-process ``FragmentCache`` (shared by default).
+        fragment_disk_cache: ``RenderCache`` to also store fragments in;
+            None (the default) uses the user-level render cache, and False
+            keeps fragments in memory only.
+    """
+
+    tags = {"cache"}
+
+    def __init__(self, environment: Any) -> None:
+        super().__init__(environment)
+        environment.extend(fragment_cache=_FRAGMENTS, fragment_disk_cache=None)
+
+    def parse(self, parser: Parser) -> nodes.Node:
+        """Parse ``{% cache key %}body{% endcache %}`` into a cached call."""
+        lineno = next(parser.stream).lineno
+        key = parser.parse_expression()
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+
+        # The parsed body identifies the fragment, so edits invalidate it;
+        # the templates it references are hashed when it is rendered
+        fragment = hashlib.sha256(repr(body).encode("utf-8")).hexdigest()
+        referenced = meta.find_referenced_templates(nodes.Template(body))
+        args: List[nodes.Expr] = [
+            nodes.Const(parser.name or ""),
+            nodes.Const(fragment),
+            nodes.Const(tuple(referenced)),
+            key,
+        ]
+        call = self.call_method("_render_fragment", args)
+        return nodes.CallBlock(call, [], [], body).set_lineno(lineno)
+
+    def _render_fragment(
+        self,
+        template: str,
+        fragment: str,
+        referenced: Tuple[Optional[str], ...],
+        key: Any,
+        caller: Callable[[], Any],
+    ) -> Any:
+        """Return a cached fragment, rendering it through ``caller`` on a miss."""
+        digest = self._fragment_digest(fragment, referenced)
+        if digest is None:
+            return caller()
+
+        cache_key = RenderCache.key(f"fragment:{template}", digest, key)
+        memory = self._memory_cache()
+        cached = memory.get(cache_key)
+        if cached is not None:
+            return cached
+
+        disk = self._disk_cache()
+        if disk is not None:
+            stored = disk.get(cache_key)
+            if stored is not None:
+                text = stored.decode("utf-8")
+                memory.put(cache_key, text)
+                return text
+
+        rendered = caller()
+        if self.environment.is_async:
+            return self._store_async(cache_key, rendered, disk)
+        return self._store(cache_key, rendered, disk)
+
+    async def _store_async(
+        self, cache_key: str, rendered: Any, disk: Optional[RenderCache]
+    ) -> str:
+        """Await an async body's output, then store it."""
+        return self._store(cache_key, await rendered, disk)
+
+    def _store(self, cache_key: str, rendered: str, disk: Optional[RenderCache]) -> str:
+        """Store a freshly rendered fragment in memory and on disk."""
+        self._memory_cache().put(cache_key, rendered)
+        if disk is not None:
+            disk.put(cache_key, rendered.encode("utf-8"))
+        return rendered
+
+    def _fragment_digest(
+        self, fragment: str, referenced: Tuple[Optional[str], ...]
+    ) -> Optional[str]:
+        """
+        Combine a body's hash with the digests of the templates it references.
+
+        Returns None if a reference is not a literal name or cannot be
+        loaded, in which case the fragment is not cached.
+        """
+        from .template_loader import template_digest
+
+        if not referenced:
+            return fragment
+        digest = hashlib.sha256(fragment.encode("utf-8"))
+        for name in referenced:
+            if name is None:
+                return None
+            try:
+                source_digest = template_digest(self.environment, name)
+            except TemplateNotFound:
+                return None
+            if source_digest is None:
+                return None
+            digest.update(f"\0{name}\0{source_digest}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _memory_cache(self) -> FragmentCache:
+        """Get the in-process cache set on the environment."""
+        return cast(FragmentCache, getattr(self.environment, "fragment_cache"))
+
+    def _disk_cache(self) -> Optional[RenderCache]:
+        """Resolve the configured on-disk cache."""
+        disk = getattr(self.environment, "fragment_disk_cache")
+        if disk is False:
+            return None
+        return disk if disk is not None else render_cache()
@@ -3,65 +3,44 @@
 Core README generation functionality.
 
 This module provides the main functions for generating README files, citations,
-licenses, and handling configuration loading.
+licenses, and handling configuration loading. Configuration loading itself lives
+in :mod:`auto_readme.config` and is re-exported here.
 """
 
+import difflib
 import json
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Union
 
-import yaml
-from jinja2 import Environment, FileSystemLoader, PackageLoader
+from jinja2 import Environment
 
-ConfigDict = Dict[str, Any]
-
-
-def load_config(config_path: str = "config.yaml") -> ConfigDict:
-    """
-    Load YAML configuration file.
+from .assets import readme_assets
+from .badges import readme_badges
+from .config import load_config
+from .sinks import FileSystemSink, OutputSink
+from .template_loader import get_environment, render_template, template_search_path
 
-    Args:
-        config_path: Path to the configuration file. Defaults to "config.yaml".
-                    If default is used, searches in config/config.yaml first.
-
-    Returns:
-        Dictionary containing the loaded configuration.
-
-    Raises:
-        FileNotFoundError: If the configuration file cannot be found.
-        yaml.YAMLError: If the YAML file is malformed.
-    """
-    # If a specific path is provided, try it first
-    if config_path != "config.yaml":
-        specific_path = Path(config_path)
-        if specific_path.exists():
-            with open(specific_path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f)
-        else:
-            raise FileNotFoundError(f"Could not find config file: {config_path}")
-
-    # Default search order for config.yaml
-    possible_paths = [
-        Path("config") / "config.yaml",
-        Path("config.yaml"),
-    ]
-
-    for path in possible_paths:
-        if path.exists():
-            with open(path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f)
-
-    raise FileNotFoundError(
-        "Could not find config.yaml in current directory or config/ folder"
-    )
+ConfigDict = Dict[str, Any]
 
 
-def generate_readme(config: ConfigDict) -> str:
+def generate_readme(
+    config: ConfigDict,
+    root: Union[str, Path] = ".",
+    env: Optional[Environment] = None,
+) -> str:
     """
     Generate README from template.
 
+    The template is resolved through the project's ``templates/`` directory,
+    the organisation template directory and finally the bundled template.
+    Identical renders are served from the user-level render cache.
+
     Args:
         config: Configuration dictionary containing project metadata.
+        root: Project root directory used to find template overrides.
+        env: Template environment to render with, e.g. one shared by a
+             pipeline run; defaults to the environment for the project's
+             template search path.
 
     Returns:
         Generated README content as a string.
@@ -69,16 +48,16 @@ def generate_readme(config: ConfigDict) -> str:
     Raises:
         jinja2.TemplateNotFound: If the README template cannot be found.
     """
-    try:
-        # Try to load from package templates first
-        env = Environment(loader=PackageLoader("auto_readme", "templates"))
-        template = env.get_template("readme.md.j2")
-    except Exception:
-        # Fallback to local templates folder if package not installed
-        env = Environment(loader=FileSystemLoader("templates/"))
-        template = env.get_template("readme.md.j2")
-
-    return template.render(**config)
+    if env is None:
+        env = get_environment(template_search_path(config, root))
+
+    badge_paths = {name: badge.path for name, badge in readme_badges(config).items()}
+    context = {
+        **config,
+        "badge_paths": badge_paths,
+        "image_variants": readme_assets(config, root),
+    }
+    return render_template(env, "readme.md.j2", context)
 
 
 def generate_huggingface_card(config: ConfigDict) -> str:
@@ -215,8 +194,34 @@ SOFTWARE."""
     return license_text
 
 
+def render_outputs(
+    config: ConfigDict,
+    root: Union[str, Path] = ".",
+    env: Optional[Environment] = None,
+) -> Dict[str, str]:
+    """
+    Render every generated repository file for a project.
+
+    Args:
+        config: Configuration dictionary containing project metadata.
+        root: Project root directory used to find template overrides and assets.
+        env: Template environment to render the README with.
+
+    Returns:
+        Mapping of filename (relative to the project root) to content.
+    """
+    return {
+        "README.md": generate_readme(config, root, env=env),
+        "LICENSE": generate_license(config),
+        "citation.bib": generate_citation(config),
+    }
+
+
 def write_output(
-    filename: str, content: str, output_dir: Union[str, Path] = "./"
+    filename: str,
+    content: str,
+    output_dir: Union[str, Path] = "./",
+    sink: Optional[OutputSink] = None,
 ) -> None:
     """
     Write content to output file.
@@ -225,12 +230,72 @@ def write_output(
         filename: Name of the file to write.
         content: Content to write to the file.
         output_dir: Directory to write the file to. Defaults to current directory.
+        sink: Destination to write to instead of ``output_dir``, such as an
+              archive or an in-memory dict.
 
     Raises:
         OSError: If the file cannot be written.
     """
-    output_path = Path(output_dir)
-    output_path.mkdir(exist_ok=True)
+    (sink or FileSystemSink(output_dir)).write(filename, content)
+
+
+def output_is_current(
+    filename: str, content: str, output_dir: Union[str, Path] = "./"
+) -> bool:
+    """
+    Check whether an existing output file already matches rendered content.
+
+    The file size is compared first so that stale files are usually detected
+    with a single ``stat`` call; the file is only read when the sizes match.
+
+    Args:
+        filename: Name of the file to compare.
+        content: Freshly rendered content.
+        output_dir: Directory containing the file. Defaults to current directory.
+
+    Returns:
+        True if the file exists and its bytes equal the rendered content.
+    """
+    file_path = Path(output_dir) / filename
+    expected = content.encode("utf-8")
+
+    try:
+        if file_path.stat().st_size != len(expected):
+            return False
+        return file_path.read_bytes() == expected
+    except FileNotFoundError:
+        return False
 
-    file_path = output_path / filename
-    file_path.write_text(content, encoding="utf-8")
+
+def diff_output(
+    filename: str, content: str, output_dir: Union[str, Path] = "./"
+) -> str:
+    """
+    Produce a unified diff between an existing output file and rendered content.
+
+    Args:
+        filename: Name of the file to compare.
+        content: Freshly rendered content.
+        output_dir: Directory containing the file. Defaults to current directory.
+
+    Returns:
+        Unified diff text, empty if the file is up to date.
+    """
+    file_path = Path(output_dir) / filename
+    try:
+        current = file_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        current = ""
+
+    lines = difflib.unified_diff(
+        current.splitlines(keepends=True),
+        content.splitlines(keepends=True),
+        fromfile=f"a/{filename}",
+        tofile=f"b/{filename}",
+    )
+
+    # Keep the diff well-formed when either side lacks a trailing newline
+    return "".join(
+        line if line.endswith("\n") else f"{line}\n\\ No newline at end of file\n"
+        for line in lines
+    )
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Pre-commit hook entry point for auto-research-readme.
+
+The hook receives the staged filenames from pre-commit and regenerates
+README.md, LICENSE and citation.bib only when one of their inputs changed.
+Most commits touch neither the config nor the templates, so the decision is
+made from a stamp file of input hashes before anything heavy is imported:
+Jinja2 and PyYAML are only loaded when regeneration is actually needed.
+"""
+
+import argparse
+import hashlib
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from . import __version__
+from .config import DEFAULT_CONFIG_PATHS, find_config_file
+
+STAMP_FILE = ".auto-research-readme.stamp"
+
+# Project-level template overrides live here
+TEMPLATE_DIR = "templates"
+
+OUTPUT_FILES = ("README.md", "LICENSE", "citation.bib")
+
+
+def collect_inputs(config_file: Path) -> List[Path]:
+    """
+    List the files that generated outputs depend on.
+
+    Args:
+        config_file: Path to the project configuration file.
+
+    Returns:
+        Sorted list of input file paths.
+    """
+    inputs = {config_file}
+    template_dir = Path(TEMPLATE_DIR)
+    if template_dir.is_dir():
+        inputs.update(p for p in template_dir.rglob("*") if p.is_file())
+    return sorted(inputs)
+
+
+def hash_inputs(paths: Sequence[Path]) -> Dict[str, str]:
+    """
+    Hash input files by content.
+
+    Args:
+        paths: Files to hash.
+
+    Returns:
+        Mapping of POSIX path (relative to the working directory when possible)
+        to SHA-256 hex digest. Missing files are skipped.
+    """
+    cwd = Path.cwd()
+    digests = {}
+    for path in paths:
+        if path.is_absolute():
+            try:
+                path = path.relative_to(cwd)
+            except ValueError:
+                pass
+        try:
+            digests[path.as_posix()] = hashlib.sha256(path.read_bytes()).hexdigest()
+        except FileNotFoundError:
+            continue
+    return digests
+
+
+def read_stamp(stamp_path: Path = Path(STAMP_FILE)) -> Dict[str, str]:
+    """
+    Read the input hashes recorded by the last successful run.
+
+    Args:
+        stamp_path: Location of the stamp file.
+
+    Returns:
+        Mapping of input path to digest, empty if there is no usable stamp.
+    """
+    try:
+        stamp = json.loads(stamp_path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return {}
+
+    if stamp.get("version") != __version__:
+        return {}
+    inputs = stamp.get("inputs", {})
+    return inputs if isinstance(inputs, dict) else {}
+
+
+def write_stamp(inputs: Dict[str, str], stamp_path: Path = Path(STAMP_FILE)) -> None:
+    """
+    Record input hashes after a successful run.
+
+    Args:
+        inputs: Mapping of input path to digest.
+        stamp_path: Location of the stamp file.
+    """
+    stamp = {"version": __version__, "inputs": inputs}
+    stamp_path.write_text(json.dumps(stamp, indent=2, sort_keys=True), "utf-8")
+
+
+def is_relevant(filenames: Sequence[str], watched: Sequence[str]) -> bool:
+    """
+    Check whether any staged file can affect the generated outputs.
+
+    Args:
+        filenames: Staged filenames passed by pre-commit.
+        watched: Known input paths.
+
+    Returns:
+        True if any staged file is a known input or a template override.
+    """
+    watched_set = set(watched)
+    template_prefix = f"{TEMPLATE_DIR}/"
+    for filename in filenames:
+        name = Path(filename).as_posix()
+        if name in watched_set or name.startswith(template_prefix):
+            return True
+    return False
+
+
+def regenerate(config_file: Path) -> Tuple[List[str], List[Path]]:
+    """
+    Regenerate outputs and stage the ones that changed.
+
+    Args:
+        config_file: Path to the project configuration file.
+
+    Returns:
+        Tuple of the output filenames that were rewritten and the config
+        source files (including inherited bases) that were read.
+    """
+    from .badges import write_badges
+    from .config import load_config_with_sources
+    from .generator import (
+        generate_citation,
+        generate_license,
+        generate_readme,
+        output_is_current,
+        write_output,
+    )
+
+    config, sources = load_config_with_sources(str(config_file))
+    generators = {
+        "README.md": generate_readme,
+        "LICENSE": generate_license,
+        "citation.bib": generate_citation,
+    }
+
+    changed = []
+    for filename, generator in generators.items():
+        content = generator(config)
+        if not output_is_current(filename, content):
+            write_output(filename, content)
+            changed.append(filename)
+
+    # Badge files are content-addressed: new ones are added, stale ones removed
+    badges = write_badges(config)
+    removed = [path for path in badges if not Path(path).exists()]
+    if removed:
+        subprocess.run(
+            ["git", "rm", "--cached", "--quiet", "--ignore-unmatch", "--", *removed],
+            check=True,
+        )
+    changed += badges
+
+    staged = [path for path in changed if path not in removed]
+    if staged:
+        subprocess.run(["git", "add", "--", *staged], check=True)
+    return changed, sources
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Pre-commit hook entry point.
+
+    Args:
+        argv: Command line arguments (staged filenames and options).
+
+    Returns:
+        Process exit code.
+    """
+    parser = argparse.ArgumentParser(
+        prog="auto-research-readme-hook",
+        description="Regenerate README outputs when their inputs are staged",
+    )
+    parser.add_argument("filenames", nargs="*", help="Staged filenames")
+    parser.add_argument("--config", default="config.yaml", help="Config file path")
+    args = parser.parse_args(argv)
+
+    try:
+        config_file = find_config_file(args.config)
+    except FileNotFoundError:
+        # Nothing to generate from; never block a commit for it
+        return 0
+
+    stamp = read_stamp()
+    watched = [config_file.as_posix(), *DEFAULT_CONFIG_PATHS, *stamp]
+
+    # Fast path: pre-commit passed filenames and none of them are inputs
+    if stamp and args.filenames and not is_relevant(args.filenames, watched):
+        return 0
+
+    # Inherited base configs are only known after parsing, so reuse the ones
+    # recorded by the previous run
+    inputs = set(collect_inputs(config_file))
+    inputs.update(Path(p) for p in stamp)
+    if stamp == hash_inputs(sorted(inputs)):
+        return 0
+
+    try:
+        changed, sources = regenerate(config_file)
+    except Exception as e:
+        print(f"❌ Error regenerating files: {e}", file=sys.stderr)
+        return 1
+
+    inputs = set(collect_inputs(config_file))
+    inputs.update(sources)
+    write_stamp(hash_inputs(sorted(inputs)))
+    for filename in changed:
+        print(f"✓ Regenerated and staged {filename}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,8 +8,11 @@ The integration system uses a plugin-based architecture where each integration
 is auto-discovered and applied based on the project configuration.
 """
 
-from typing import Any, Dict, List
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
 
+from ..sinks import OutputSink
+from .context import ProjectContext, ProjectInput, project_context
 from .platforms.github.integration import GitHubIntegration
 from .platforms.pypi.integration import PyPIIntegration
 from .platforms.zenodo.integration import ZenodoIntegration
@@ -24,12 +27,24 @@ INTEGRATIONS = [
 ]
 
 
-def setup_all_integrations(config: ConfigDict) -> List[str]:
+def setup_all_integrations(
+    project: ProjectInput,
+    root: Union[str, Path] = ".",
+    verbose: bool = True,
+    sink: Optional[OutputSink] = None,
+) -> List[str]:
     """
     Set up all applicable integrations for the project.
 
+    The project context is built once and shared by every integration.
+
     Args:
-        config: Project configuration dictionary.
+        project: Project context, or a bare configuration dictionary.
+        root: Project root directory, used when a configuration is passed.
+        verbose: Print progress and requirements; disable when setting up
+                 many projects concurrently.
+        sink: Where to write files when a configuration is passed; defaults
+              to the project root.
 
     Returns:
         List of integration names that were successfully set up.
@@ -37,41 +52,49 @@ def setup_all_integrations(config: ConfigDict) -> List[str]:
     Raises:
         Exception: If any integration setup fails.
     """
+    project = project_context(project, root, sink)
+    say = print if verbose else _quiet
     applied_integrations = []
 
     for integration_class in INTEGRATIONS:
         integration = integration_class()
 
-        if integration.is_applicable(config):
-            print(f"📦 Setting up {integration.name} integration...")
+        if integration.is_applicable(project):
+            say(f"📦 Setting up {integration.name} integration...")
 
             try:
-                integration.setup(config)
+                integration.setup(project)
                 applied_integrations.append(integration.name)
-                print(f"✓ {integration.name} integration configured")
+                say(f"✓ {integration.name} integration configured")
 
                 # Print requirements if any
                 requirements = integration.get_requirements()
                 if requirements:
-                    print(f"ℹ️  {integration.name} requirements:")
+                    say(f"ℹ️  {integration.name} requirements:")
                     for req in requirements:
-                        print(f"   • {req}")
+                        say(f"   • {req}")
 
             except Exception as e:
-                print(f"❌ Failed to setup {integration.name}: {e}")
+                say(f"❌ Failed to setup {integration.name}: {e}")
                 raise
 
     if applied_integrations:
         count = len(applied_integrations)
-        print(f"\n🎉 Successfully configured {count} integrations!")
+        say(f"\n🎉 Successfully configured {count} integrations!")
         return applied_integrations
     else:
-        print("ℹ️  No integrations were applicable for this project")
+        say("ℹ️  No integrations were applicable for this project")
         return []
 
 
+def _quiet(*args: Any, **kwargs: Any) -> None:
+    """Discard progress output."""
+
+
 __all__ = [
     "setup_all_integrations",
+    "ProjectContext",
+    "project_context",
     "GitHubIntegration",
     "ZenodoIntegration",
     "PyPIIntegration",
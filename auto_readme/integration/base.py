@@ -8,6 +8,8 @@ providing a consistent interface for integration discovery and setup.
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List
 
+from auto_readme.integration.context import ProjectInput
+
 ConfigDict = Dict[str, Any]
 
 
@@ -20,12 +22,12 @@ class BaseIntegration(ABC):
     """
 
     @abstractmethod
-    def is_applicable(self, config: ConfigDict) -> bool:
+    def is_applicable(self, project: ProjectInput) -> bool:
         """
         Check if this integration should be enabled for the current project.
 
         Args:
-            config: Project configuration dictionary.
+            project: Project context, or a bare configuration dictionary.
 
         Returns:
             True if integration should be set up, False otherwise.
@@ -33,12 +35,12 @@ class BaseIntegration(ABC):
         pass
 
     @abstractmethod
-    def setup(self, config: ConfigDict) -> str:
+    def setup(self, project: ProjectInput) -> str:
         """
         Set up the integration (create files, configurations, etc.).
 
         Args:
-            config: Project configuration dictionary.
+            project: Project context, or a bare configuration dictionary.
 
         Returns:
             Description of what was set up.
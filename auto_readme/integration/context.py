@@ -0,0 +1,146 @@
+"""
+Project state shared by all integrations.
+
+A ``ProjectContext`` is built once per project: it finds the git root, lists
+the existing workflow files and normalizes the identifiers integrations
+inspect (project type, DOI, links). Applicability checks are then plain
+attribute lookups, with no filesystem access or string processing per
+integration.
+
+Integrations still accept a bare ``ConfigDict`` and build a context from it,
+so existing callers keep working.
+"""
+
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Optional, Union
+
+from auto_readme.links import normalize_doi
+from auto_readme.sinks import Content, FileSystemSink, OutputSink
+
+ConfigDict = Dict[str, Any]
+
+WORKFLOWS_DIR = ".github/workflows"
+
+
+@dataclass(frozen=True)
+class ProjectContext:
+    """Everything integrations need to know about one project."""
+
+    config: ConfigDict
+    root: Path
+    git_root: Optional[Path]
+    existing_workflows: FrozenSet[str]
+    project_type: str
+    doi: str
+    zenodo_link: str
+    github_link: str
+    zenodo_record_id: Optional[str]
+    sink: Optional[OutputSink] = None
+
+    @classmethod
+    def from_config(
+        cls,
+        config: ConfigDict,
+        root: Union[str, Path] = ".",
+        sink: Optional[OutputSink] = None,
+    ) -> "ProjectContext":
+        """
+        Build the context for a project.
+
+        Args:
+            config: Project configuration dictionary.
+            root: Project root directory.
+            sink: Where integrations write files; defaults to the root directory.
+
+        Returns:
+            Context holding the project's git root, workflows and identifiers.
+        """
+        from auto_readme.integration.platforms.zenodo.uploader import (
+            zenodo_record_id,
+        )
+
+        root_path = Path(root)
+        return cls(
+            config=config,
+            root=root_path,
+            git_root=find_git_root(root_path),
+            existing_workflows=_list_workflows(root_path / WORKFLOWS_DIR),
+            project_type=str(config.get("type") or "").strip().lower(),
+            doi=normalize_doi(str(config.get("doi") or "")).lower(),
+            zenodo_link=str(config.get("zenodo_link") or "").strip().lower(),
+            github_link=str(config.get("github_link") or "").strip(),
+            zenodo_record_id=zenodo_record_id(config),
+            sink=sink,
+        )
+
+    @property
+    def has_git(self) -> bool:
+        """Whether the project is inside a git repository."""
+        return self.git_root is not None
+
+    @property
+    def workflows_dir(self) -> Path:
+        """Directory GitHub Actions workflows are written to."""
+        return self.root / WORKFLOWS_DIR
+
+    def write(self, path: str, content: Content) -> None:
+        """
+        Write a file produced by an integration.
+
+        Args:
+            path: File path relative to the project root.
+            content: File content.
+        """
+        (self.sink or FileSystemSink(self.root)).write(path, content)
+
+
+ProjectInput = Union[ProjectContext, ConfigDict]
+
+
+def project_context(
+    project: ProjectInput,
+    root: Union[str, Path] = ".",
+    sink: Optional[OutputSink] = None,
+) -> ProjectContext:
+    """
+    Get a context for a project, building one from a bare config if needed.
+
+    Args:
+        project: Existing context, or a project configuration dictionary.
+        root: Project root directory, used when building a new context.
+        sink: Output destination, used when building a new context.
+
+    Returns:
+        The project context.
+    """
+    if isinstance(project, ProjectContext):
+        return project
+    return ProjectContext.from_config(project, root, sink)
+
+
+def find_git_root(root: Path) -> Optional[Path]:
+    """
+    Find the git work tree containing a directory.
+
+    Args:
+        root: Directory to start from.
+
+    Returns:
+        The nearest directory (the root itself or a parent) containing
+        ``.git``, or None outside a git repository.
+    """
+    for directory in (root, *root.resolve().parents):
+        if (directory / ".git").exists():
+            return directory
+    return None
+
+
+def _list_workflows(directory: Path) -> FrozenSet[str]:
+    """List workflow file names, empty if the directory does not exist."""
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except OSError:
+        return frozenset()
@@ -6,11 +6,20 @@ and documentation updates when git repositories are detected.
 """
 
 from pathlib import Path
-from typing import List
-
-from jinja2 import Environment, FileSystemLoader
+from typing import Any, Dict, List, Optional
 
+from auto_readme import __version__
 from auto_readme.integration.base import BaseIntegration, ConfigDict
+from auto_readme.integration.context import (
+    WORKFLOWS_DIR,
+    ProjectContext,
+    ProjectInput,
+    project_context,
+)
+from auto_readme.template_loader import get_environment, render_template
+
+# Python version pinned in generated workflows
+WORKFLOW_PYTHON_VERSION = "3.11"
 
 
 class GitHubIntegration(BaseIntegration):
@@ -19,37 +28,37 @@ class GitHubIntegration(BaseIntegration):
 
     This integration creates GitHub Actions workflows for:
     - Automated releases on version tags
-    - Documentation updates
+    - Verifying generated documentation is up to date
     - Repository maintenance
 
+    The workflow pins the Python and tool versions, caches the tool's
+    environment and render caches, and cancels superseded runs. Monorepos
+    (``monorepo`` in the config) instead get a workflow whose first job
+    computes the changed projects and fans out one job per project.
+
     Applicable when a git repository is detected in the project.
     """
 
-    def is_applicable(self, config: ConfigDict) -> bool:
+    def is_applicable(self, project: ProjectInput) -> bool:
         """
         Check if GitHub integration should be enabled.
 
         Args:
-            config: Project configuration dictionary.
+            project: Project context, or a bare configuration dictionary.
 
         Returns:
-            True if .git directory exists or github_link is specified.
+            True if the project is in a git repository or github_link is
+            specified.
         """
-        # Check if we're in a git repository
-        git_dir = Path(".git")
-        has_git = git_dir.exists()
-
-        # Check if GitHub link is specified in config
-        has_github_link = bool(config.get("github_link"))
+        project = project_context(project)
+        return project.has_git or bool(project.github_link)
 
-        return has_git or has_github_link
-
-    def setup(self, config: ConfigDict) -> str:
+    def setup(self, project: ProjectInput) -> str:
         """
         Set up GitHub Actions workflow files.
 
         Args:
-            config: Project configuration dictionary.
+            project: Project context, or a bare configuration dictionary.
 
         Returns:
             Description of what was set up.
@@ -57,31 +66,84 @@ class GitHubIntegration(BaseIntegration):
         Raises:
             Exception: If workflow file creation fails.
         """
+        project = project_context(project)
+        config = project.config
         try:
-            # Create .github/workflows directory
-            workflows_dir = Path(".github/workflows")
-            workflows_dir.mkdir(parents=True, exist_ok=True)
+            workflows_dir = project.workflows_dir
 
             # Load and render workflow template
-            template_dir = Path(__file__).parent
-            env = Environment(loader=FileSystemLoader(str(template_dir)))
-            template = env.get_template("workflow.yml.j2")
-
-            workflow_content = template.render(
-                title=config.get("title", "Repository"),
-                github_link=config.get("github_link", ""),
-                maintainer=config.get("maintainer", ""),
+            env = get_environment([Path(__file__).parent])
+
+            monorepo = self._get_monorepo_settings(config)
+            if monorepo is not None:
+                workflow_content = render_template(
+                    env,
+                    "monorepo_workflow.yml.j2",
+                    {
+                        "python_version": WORKFLOW_PYTHON_VERSION,
+                        "tool_version": __version__,
+                        **monorepo,
+                    },
+                )
+                workflow_file = workflows_dir / "projects.yml"
+                project.write(f"{WORKFLOWS_DIR}/projects.yml", workflow_content)
+                action = _action(project, workflow_file)
+                return f"{action} monorepo GitHub Actions workflow at {workflow_file}"
+
+            workflow_content = render_template(
+                env,
+                "workflow.yml.j2",
+                {
+                    "title": config.get("title", "Repository"),
+                    "description": config.get("description", ""),
+                    "github_link": config.get("github_link", ""),
+                    "maintainer": config.get("maintainer", ""),
+                    "tags": config.get("tags", []),
+                    "authors": config.get("contributors", config.get("authors", [])),
+                    "year": str(config.get("published", "2025"))[:4],
+                    "python_version": WORKFLOW_PYTHON_VERSION,
+                    "tool_version": __version__,
+                    "zenodo_record_id": project.zenodo_record_id,
+                },
             )
 
             # Write workflow file
             workflow_file = workflows_dir / "release.yml"
-            workflow_file.write_text(workflow_content, encoding="utf-8")
+            project.write(f"{WORKFLOWS_DIR}/release.yml", workflow_content)
 
-            return f"Created GitHub Actions workflow at {workflow_file}"
+            action = _action(project, workflow_file)
+            return f"{action} GitHub Actions workflow at {workflow_file}"
 
         except Exception as e:
             raise Exception(f"Failed to create GitHub workflow: {e}")
 
+    def _get_monorepo_settings(self, config: ConfigDict) -> Optional[Dict[str, Any]]:
+        """
+        Extract monorepo workflow settings from config.
+
+        A monorepo is declared with ``monorepo: true`` or a mapping such as
+        ``monorepo: {projects_dir: "projects", branch: "main"}``; each project
+        lives in ``<projects_dir>/<name>/`` with its own ``config/`` folder.
+
+        Args:
+            config: Project configuration dictionary.
+
+        Returns:
+            Template context for the monorepo workflow, or None for a single
+            project repository.
+        """
+        monorepo = config.get("monorepo")
+        if not monorepo:
+            return None
+
+        settings = monorepo if isinstance(monorepo, dict) else {}
+        projects_dir = str(settings.get("projects_dir", "projects")).strip("/")
+        return {
+            "projects_dir": projects_dir,
+            "project_depth": len(Path(projects_dir).parts) + 1,
+            "branch": settings.get("branch", "main"),
+        }
+
     def get_requirements(self) -> List[str]:
         """
         Get manual steps for GitHub integration.
@@ -94,3 +156,10 @@ class GitHubIntegration(BaseIntegration):
             "Ensure GitHub Actions are enabled in repository settings",
             "Create releases by pushing git tags (e.g., 'git tag v1.0.0 && git push origin v1.0.0')",
         ]
+
+
+def _action(project: ProjectContext, workflow_file: Path) -> str:
+    """Describe whether a workflow file was new or replaced an existing one."""
+    if workflow_file.name in project.existing_workflows:
+        return "Updated"
+    return "Created"
@@ -8,9 +8,16 @@ when Python packages are detected in the project configuration.
 from pathlib import Path
 from typing import List
 
-from jinja2 import Environment, FileSystemLoader
-
 from auto_readme.integration.base import BaseIntegration, ConfigDict
+from auto_readme.integration.context import (
+    WORKFLOWS_DIR,
+    ProjectInput,
+    project_context,
+)
+from auto_readme.integration.platforms.github.integration import (
+    WORKFLOW_PYTHON_VERSION,
+)
+from auto_readme.template_loader import get_environment, render_template, slugify
 
 
 class PyPIIntegration(BaseIntegration):
@@ -18,32 +25,31 @@ class PyPIIntegration(BaseIntegration):
     PyPI publishing integration for Python packages.
 
     This integration creates GitHub Actions workflows for automated
-    publishing to PyPI using trusted publishing (OIDC).
+    publishing to PyPI using trusted publishing (OIDC). Distributions are
+    built once and reused by the test, provenance and publish jobs, and the
+    upload is skipped when PyPI already has identical files.
 
     Only applicable for Python packages (type: "python-package").
     """
 
-    def is_applicable(self, config: ConfigDict) -> bool:
+    def is_applicable(self, project: ProjectInput) -> bool:
         """
         Check if PyPI integration should be enabled.
 
         Args:
-            config: Project configuration dictionary.
+            project: Project context, or a bare configuration dictionary.
 
         Returns:
             True if project type is 'python-package'.
         """
-        project_type = config.get("type", "").lower()
-        is_python_package = project_type == "python-package"
-
-        return is_python_package
+        return project_context(project).project_type == "python-package"
 
-    def setup(self, config: ConfigDict) -> str:
+    def setup(self, project: ProjectInput) -> str:
         """
         Set up PyPI publishing workflow.
 
         Args:
-            config: Project configuration dictionary.
+            project: Project context, or a bare configuration dictionary.
 
         Returns:
             Description of what was set up.
@@ -51,27 +57,29 @@ class PyPIIntegration(BaseIntegration):
         Raises:
             Exception: If workflow file creation fails.
         """
+        project = project_context(project)
+        config = project.config
         try:
-            # Create .github/workflows directory
-            workflows_dir = Path(".github/workflows")
-            workflows_dir.mkdir(parents=True, exist_ok=True)
-
             # Load and render workflow template
-            template_dir = Path(__file__).parent
-            env = Environment(loader=FileSystemLoader(str(template_dir)))
-            template = env.get_template("workflow.yml.j2")
-
-            workflow_content = template.render(
-                title=config.get("title", "Python Package"),
-                maintainer=config.get("maintainer", ""),
-                package_name=self._get_package_name(config),
+            env = get_environment([Path(__file__).parent])
+            workflow_content = render_template(
+                env,
+                "pypi_workflow.yml.j2",
+                {
+                    "title": config.get("title", "Python Package"),
+                    "maintainer": config.get("maintainer", ""),
+                    "package_name": self._get_package_name(config),
+                    "python_version": WORKFLOW_PYTHON_VERSION,
+                },
             )
 
             # Write workflow file
-            workflow_file = workflows_dir / "pypi-publish.yml"
-            workflow_file.write_text(workflow_content, encoding="utf-8")
+            workflow_file = project.workflows_dir / "pypi-publish.yml"
+            project.write(f"{WORKFLOWS_DIR}/pypi-publish.yml", workflow_content)
 
-            return f"Created PyPI publishing workflow at {workflow_file}"
+            exists = workflow_file.name in project.existing_workflows
+            action = "Updated" if exists else "Created"
+            return f"{action} PyPI publishing workflow at {workflow_file}"
 
         except Exception as e:
             raise Exception(f"Failed to create PyPI workflow: {e}")
@@ -107,4 +115,4 @@ class PyPIIntegration(BaseIntegration):
 
         # Fall back to title, converting to PyPI-friendly format
         title = config.get("title", "my-package")
-        return title.lower().replace("_", "-")
+        return slugify(title)
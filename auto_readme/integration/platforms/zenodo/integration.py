@@ -6,10 +6,10 @@ when Zenodo DOIs or badges are detected in the project configuration.
 """
 
 import json
-from pathlib import Path
 from typing import Any, Dict, List
 
 from auto_readme.integration.base import BaseIntegration, ConfigDict
+from auto_readme.integration.context import ProjectInput, project_context
 
 
 class ZenodoIntegration(BaseIntegration):
@@ -22,32 +22,25 @@ class ZenodoIntegration(BaseIntegration):
     Applicable when Zenodo DOI or Zenodo badge is present in the configuration.
     """
 
-    def is_applicable(self, config: ConfigDict) -> bool:
+    def is_applicable(self, project: ProjectInput) -> bool:
         """
         Check if Zenodo integration should be enabled.
 
         Args:
-            config: Project configuration dictionary.
+            project: Project context, or a bare configuration dictionary.
 
         Returns:
             True if DOI contains 'zenodo' or zenodo_link is specified.
         """
-        # Check for Zenodo DOI
-        doi = config.get("doi", "").lower()
-        has_zenodo_doi = "zenodo" in doi
-
-        # Check for Zenodo link
-        zenodo_link = config.get("zenodo_link", "").lower()
-        has_zenodo_link = "zenodo" in zenodo_link
+        project = project_context(project)
+        return "zenodo" in project.doi or "zenodo" in project.zenodo_link
 
-        return has_zenodo_doi or has_zenodo_link
-
-    def setup(self, config: ConfigDict) -> str:
+    def setup(self, project: ProjectInput) -> str:
         """
         Set up Zenodo metadata file.
 
         Args:
-            config: Project configuration dictionary.
+            project: Project context, or a bare configuration dictionary.
 
         Returns:
             Description of what was set up.
@@ -55,13 +48,14 @@ class ZenodoIntegration(BaseIntegration):
         Raises:
             Exception: If metadata file creation fails.
         """
+        project = project_context(project)
         try:
-            metadata = self._create_zenodo_metadata(config)
+            metadata = self._create_zenodo_metadata(project.config)
 
             # Write .zenodo.json file
-            zenodo_file = Path(".zenodo.json")
-            zenodo_file.write_text(
-                json.dumps(metadata, indent=2, ensure_ascii=False), encoding="utf-8"
+            zenodo_file = project.root / ".zenodo.json"
+            project.write(
+                ".zenodo.json", json.dumps(metadata, indent=2, ensure_ascii=False)
             )
 
             return f"Created Zenodo metadata file at {zenodo_file}"
@@ -0,0 +1,350 @@
+"""
+Zenodo deposition upload engine.
+
+This module talks to the Zenodo REST API to create depositions (or new
+versions of published ones) and upload dataset files into their buckets.
+
+Files are uploaded concurrently with bounded parallelism and streamed from
+disk in fixed-size chunks, so multi-GB files never have to fit in memory.
+Files whose MD5 checksum the deposition already has are skipped, which makes
+re-running an interrupted upload resume where it stopped; failed transfers
+are retried with exponential backoff.
+"""
+
+import hashlib
+import json
+import re
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+from auto_readme.integration.base import ConfigDict
+
+ZENODO_API_URL = "https://zenodo.org/api"
+ZENODO_SANDBOX_API_URL = "https://sandbox.zenodo.org/api"
+
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+class ZenodoError(Exception):
+    """Raised when the Zenodo API returns an error response."""
+
+    def __init__(self, status: int, message: str) -> None:
+        """
+        Initialize the error.
+
+        Args:
+            status: HTTP status code.
+            message: Error message returned by the API.
+        """
+        super().__init__(f"Zenodo API error {status}: {message}")
+        self.status = status
+
+
+@dataclass
+class UploadResult:
+    """Outcome of uploading a single file."""
+
+    filename: str
+    status: str  # "uploaded", "skipped" or "failed"
+    checksum: str
+    error: Optional[str] = None
+
+
+def zenodo_record_id(config: ConfigDict) -> Optional[str]:
+    """
+    Extract the Zenodo record ID from a project's link or DOI.
+
+    Args:
+        config: Project configuration dictionary.
+
+    Returns:
+        Record ID, or None if the config does not reference a Zenodo record.
+    """
+    link = str(config.get("zenodo_link", ""))
+    match = re.search(r"/records?/(\d+)", link)
+    if match:
+        return match.group(1)
+
+    match = re.search(r"zenodo\.(\d+)", str(config.get("doi", "")).lower())
+    return match.group(1) if match else None
+
+
+def file_md5(path: Union[str, Path], chunk_size: int = DEFAULT_CHUNK_SIZE) -> str:
+    """
+    Compute the MD5 checksum Zenodo reports for a file.
+
+    Args:
+        path: File to hash.
+        chunk_size: Read size in bytes.
+
+    Returns:
+        Hex digest.
+    """
+    digest = hashlib.md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ZenodoUploader:
+    """
+    Client for creating Zenodo depositions and uploading their files.
+
+    Example:
+        >>> uploader = ZenodoUploader(token)
+        >>> deposition = uploader.new_version("123456")
+        >>> results = uploader.upload_files(deposition, ["data.zip"])
+    """
+
+    def __init__(
+        self,
+        token: str,
+        base_url: str = ZENODO_API_URL,
+        max_workers: int = 4,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        timeout: float = 300.0,
+    ) -> None:
+        """
+        Initialize the uploader.
+
+        Args:
+            token: Zenodo personal access token.
+            base_url: API root, e.g. the production or sandbox API.
+            max_workers: Maximum number of concurrent file uploads.
+            chunk_size: Bytes read from disk and sent per chunk.
+            max_retries: Attempts per file after the first failure.
+            retry_delay: Initial backoff delay in seconds, doubled per retry.
+            timeout: Socket timeout in seconds for each request.
+        """
+        self.token = token
+        self.base_url = base_url.rstrip("/")
+        self.max_workers = max(1, max_workers)
+        self.chunk_size = chunk_size
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.timeout = timeout
+
+    def create_deposition(
+        self, metadata: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Create a new, empty deposition.
+
+        Args:
+            metadata: Optional deposition metadata.
+
+        Returns:
+            Deposition resource.
+        """
+        body = {"metadata": metadata} if metadata else {}
+        return self._request_json("POST", f"{self.base_url}/deposit/depositions", body)
+
+    def get_deposition(self, deposition_id: str) -> Dict[str, Any]:
+        """
+        Fetch a deposition by ID.
+
+        Args:
+            deposition_id: Deposition ID.
+
+        Returns:
+            Deposition resource.
+        """
+        url = f"{self.base_url}/deposit/depositions/{deposition_id}"
+        return self._request_json("GET", url)
+
+    def new_version(self, deposition_id: str) -> Dict[str, Any]:
+        """
+        Create a new draft version of a published deposition.
+
+        The draft starts with the previous version's files, so unchanged
+        files are skipped by ``upload_files``.
+
+        Args:
+            deposition_id: ID of the published deposition.
+
+        Returns:
+            The new draft deposition resource.
+        """
+        url = f"{self.base_url}/deposit/depositions/{deposition_id}/actions/newversion"
+        response = self._request_json("POST", url)
+        return self._request_json("GET", response["links"]["latest_draft"])
+
+    def update_metadata(
+        self, deposition: Dict[str, Any], metadata: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Replace a draft deposition's metadata.
+
+        Args:
+            deposition: Deposition resource.
+            metadata: New metadata.
+
+        Returns:
+            Updated deposition resource.
+        """
+        url = f"{self.base_url}/deposit/depositions/{deposition['id']}"
+        return self._request_json("PUT", url, {"metadata": metadata})
+
+    def publish(self, deposition: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Publish a draft deposition. This cannot be undone.
+
+        Args:
+            deposition: Deposition resource.
+
+        Returns:
+            Published deposition resource.
+        """
+        url = f"{self.base_url}/deposit/depositions/{deposition['id']}/actions/publish"
+        return self._request_json("POST", url)
+
+    def existing_checksums(self, deposition: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Get the MD5 checksums of files already in a deposition.
+
+        Args:
+            deposition: Deposition resource.
+
+        Returns:
+            Mapping of filename to MD5 hex digest.
+        """
+        checksums = {}
+        for entry in deposition.get("files", []):
+            name = entry.get("filename") or entry.get("key")
+            checksum = str(entry.get("checksum", ""))
+            if name and checksum:
+                checksums[name] = checksum.split(":", 1)[-1]
+        return checksums
+
+    def upload_files(
+        self, deposition: Dict[str, Any], paths: Sequence[Union[str, Path]]
+    ) -> List[UploadResult]:
+        """
+        Upload files into a deposition's bucket concurrently.
+
+        Args:
+            deposition: Deposition resource (must have a bucket link).
+            paths: Files to upload; each is stored under its base name.
+
+        Returns:
+            One result per path, in input order.
+        """
+        bucket_url = deposition["links"]["bucket"]
+        existing = self.existing_checksums(deposition)
+
+        def upload(path: Union[str, Path]) -> UploadResult:
+            return self._upload_one(bucket_url, Path(path), existing)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(upload, paths))
+
+    def upload_file(self, bucket_url: str, path: Union[str, Path]) -> Dict[str, Any]:
+        """
+        Stream a single file into a bucket.
+
+        Args:
+            bucket_url: Deposition bucket URL.
+            path: File to upload.
+
+        Returns:
+            File resource returned by Zenodo.
+        """
+        path = Path(path)
+        url = f"{bucket_url.rstrip('/')}/{urllib.parse.quote(path.name)}"
+        headers = {
+            "Content-Type": "application/octet-stream",
+            "Content-Length": str(path.stat().st_size),
+        }
+        return self._request_json("PUT", url, self._iter_file(path), headers)
+
+    def _upload_one(
+        self, bucket_url: str, path: Path, existing: Dict[str, str]
+    ) -> UploadResult:
+        """Upload one file with checksum skipping and retries."""
+        try:
+            checksum = file_md5(path, self.chunk_size)
+        except OSError as e:
+            return UploadResult(path.name, "failed", "", str(e))
+
+        if existing.get(path.name) == checksum:
+            return UploadResult(path.name, "skipped", checksum)
+
+        delay = self.retry_delay
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.upload_file(bucket_url, path)
+            except (OSError, ZenodoError) as e:
+                retryable = not isinstance(e, ZenodoError) or e.status >= 500
+                if not retryable or attempt == self.max_retries:
+                    return UploadResult(path.name, "failed", checksum, str(e))
+                time.sleep(delay)
+                delay *= 2
+                continue
+
+            remote = str(response.get("checksum", "")).split(":", 1)[-1]
+            if remote and remote != checksum:
+                return UploadResult(
+                    path.name, "failed", checksum, f"checksum mismatch ({remote})"
+                )
+            return UploadResult(path.name, "uploaded", checksum)
+
+        return UploadResult(path.name, "failed", checksum, "retries exhausted")
+
+    def _iter_file(self, path: Path) -> Iterator[bytes]:
+        """Yield a file's content in chunks."""
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(self.chunk_size), b""):
+                yield chunk
+
+    def _request_json(
+        self,
+        method: str,
+        url: str,
+        body: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Send an authenticated request and decode the JSON response.
+
+        Args:
+            method: HTTP method.
+            url: Absolute URL.
+            body: JSON-serializable body, or an iterator of bytes to stream.
+            headers: Extra request headers.
+
+        Returns:
+            Decoded JSON response (empty dict for empty bodies).
+
+        Raises:
+            ZenodoError: If the API returns an error status.
+        """
+        request_headers = {"Authorization": f"Bearer {self.token}"}
+        request_headers.update(headers or {})
+
+        data: Any = None
+        if isinstance(body, dict):
+            data = json.dumps(body).encode("utf-8")
+            request_headers["Content-Type"] = "application/json"
+        elif body is not None:
+            data = body
+
+        request = urllib.request.Request(
+            url, data=data, headers=request_headers, method=method
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                payload = response.read()
+        except urllib.error.HTTPError as e:
+            message = e.read().decode("utf-8", errors="replace")
+            raise ZenodoError(e.code, message or str(e.reason))
+
+        return json.loads(payload) if payload else {}
@@ -15,6 +15,11 @@ def get_changelog_from_config(config_path="config.yaml"):
         sys.exit(1)
     with open(config_file) as f:
         config = yaml.safe_load(f)
+    return changelog_entry(config)
+
+
+def changelog_entry(config):
+    """Return the configured version and its changelog entries."""
     version = config.get("version")
     changelog = config.get("changelog", {})
     changes = changelog.get(str(version), [])
@@ -45,8 +50,18 @@ def append_to_changelog_md(version, changes, changelog_path="CHANGELOG.md"):
     print(f"Appended entry for version {version} to {changelog_path}.")
 
 
-def update_changelog(config_path="config.yaml", changelog_path="CHANGELOG.md"):
-    version, changes = get_changelog_from_config(config_path)
+def update_changelog(
+    config_path="config.yaml", changelog_path="CHANGELOG.md", config=None, root="."
+):
+    """Add the current version's entry; an already-loaded config skips parsing.
+
+    Relative paths are resolved against the project ``root``.
+    """
+    changelog_path = str(Path(root) / changelog_path)
+    if config is None:
+        version, changes = get_changelog_from_config(str(Path(root) / config_path))
+    else:
+        version, changes = changelog_entry(config)
     if not changes:
         print(f"No changelog entry found for version {version} in {config_path}.")
         return
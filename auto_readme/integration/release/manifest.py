@@ -0,0 +1,383 @@
+"""
+Content-addressed release manifests and delta releases.
+
+Every released version gets a manifest mapping each tracked path to the
+SHA-256 digest and size of its content. A release then only has to ship the
+blobs whose digests the previous version did not already have, plus the full
+manifest, which is enough for consumers to reconstruct any version from the
+accumulated blob store.
+
+Manifests are built straight from git trees: files whose git object ID did not
+change since the previous release reuse its digest, so only changed files are
+read and hashed. Manifests are cached by tree ID in the user cache directory.
+"""
+
+import hashlib
+import json
+import re
+import shutil
+import subprocess
+from pathlib import Path
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
+
+from auto_readme.cache import user_cache_dir
+
+MANIFEST_FORMAT = 1
+
+Manifest = Dict[str, Any]
+
+_READ_SIZE = 1024 * 1024
+
+
+class TreeEntry(NamedTuple):
+    """A file in a git tree."""
+
+    path: str
+    mode: int
+    object_id: str
+    size: int
+
+
+def ls_tree(ref: str, root: Union[str, Path] = ".") -> List[TreeEntry]:
+    """
+    List the files in a git tree, sorted by path.
+
+    Submodules are skipped since their content is not part of the tree.
+
+    Args:
+        ref: Commit, tag or tree to list.
+        root: Repository directory.
+
+    Returns:
+        One entry per file.
+    """
+    output = subprocess.check_output(
+        ["git", "ls-tree", "-r", "-l", "-z", ref], cwd=root
+    )
+
+    entries = []
+    for record in output.split(b"\0"):
+        if not record:
+            continue
+        meta, path = record.split(b"\t", 1)
+        mode, object_type, object_id, size = meta.split()
+        if object_type != b"blob":
+            continue
+        entries.append(
+            TreeEntry(
+                path.decode("utf-8", "surrogateescape"),
+                int(mode, 8),
+                object_id.decode("ascii"),
+                int(size),
+            )
+        )
+    return sorted(entries)
+
+
+def tree_entries(ref: str, root: Union[str, Path] = ".") -> Dict[str, Tuple[str, int]]:
+    """
+    List the files in a git tree.
+
+    Args:
+        ref: Commit, tag or tree to list.
+        root: Repository directory.
+
+    Returns:
+        Mapping of path to (git object ID, size in bytes).
+    """
+    return {e.path: (e.object_id, e.size) for e in ls_tree(ref, root)}
+
+
+def previous_release_tag(tag: str, root: Union[str, Path] = ".") -> Optional[str]:
+    """
+    Find the release tag preceding a tag.
+
+    Args:
+        tag: Current release tag.
+        root: Repository directory.
+
+    Returns:
+        Previous ``v*`` tag reachable from ``tag``, or None for the first release.
+    """
+    result = subprocess.run(
+        ["git", "describe", "--tags", "--abbrev=0", "--match", "v*", f"{tag}^"],
+        cwd=root,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.strip() or None if result.returncode == 0 else None
+
+
+def has_delta_store(tag: str, root: Union[str, Path] = ".") -> bool:
+    """
+    Check whether a release was published with a delta blob store.
+
+    The store is filled by the release workflow's ``release-delta`` step, so
+    a release tagged before that step was set up left no blobs to build on.
+
+    Args:
+        tag: Release tag.
+        root: Repository directory.
+
+    Returns:
+        True if a workflow at ``tag`` runs ``release-delta``.
+    """
+    result = subprocess.run(
+        ["git", "grep", "-q", "-F", "release-delta", tag, "--", ".github/workflows"],
+        cwd=root,
+        capture_output=True,
+    )
+    return result.returncode == 0
+
+
+class GitBlobReader:
+    """Stream blob contents out of a repository via ``git cat-file --batch``."""
+
+    def __init__(self, root: Union[str, Path] = ".") -> None:
+        """
+        Start the batch reader.
+
+        Args:
+            root: Repository directory.
+        """
+        self._process = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=root,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+
+    def __enter__(self) -> "GitBlobReader":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def stream(self, object_id: str) -> Iterator[bytes]:
+        """
+        Yield the content of a blob in chunks.
+
+        The generator must be exhausted before the next blob is requested.
+
+        Args:
+            object_id: Git object ID of the blob.
+
+        Raises:
+            KeyError: If the object does not exist.
+        """
+        stdin = cast(IO[bytes], self._process.stdin)
+        stdout = cast(IO[bytes], self._process.stdout)
+        stdin.write(f"{object_id}\n".encode("ascii"))
+        stdin.flush()
+
+        header = stdout.readline().split()
+        if len(header) != 3:
+            raise KeyError(object_id)
+
+        remaining = int(header[2])
+        while remaining:
+            chunk = stdout.read(min(remaining, _READ_SIZE))
+            remaining -= len(chunk)
+            yield chunk
+        stdout.read(1)  # trailing newline
+
+    def close(self) -> None:
+        """Stop the batch reader."""
+        if self._process.stdin:
+            self._process.stdin.close()
+        self._process.wait()
+
+
+def build_manifest(
+    ref: str,
+    root: Union[str, Path] = ".",
+    previous: Optional[Manifest] = None,
+    cache_dir: Optional[Path] = None,
+) -> Manifest:
+    """
+    Build the content-addressed manifest of a release.
+
+    Args:
+        ref: Tag or commit being released.
+        root: Repository directory.
+        previous: Manifest of the previous release; digests of files whose
+                  git object ID is unchanged are reused instead of rehashed.
+        cache_dir: Manifest cache directory. Defaults to the user cache.
+
+    Returns:
+        Manifest with ``ref``, ``tree`` and ``files`` entries.
+    """
+    tree = subprocess.check_output(
+        ["git", "rev-parse", f"{ref}^{{tree}}"], cwd=root, text=True
+    ).strip()
+
+    cache_file = (cache_dir or user_cache_dir() / "manifests") / f"{tree}.json"
+    if cache_file.exists():
+        cached = cast(Manifest, json.loads(cache_file.read_text(encoding="utf-8")))
+        return {**cached, "ref": ref}
+
+    known = {}
+    if previous:
+        known = {e["git"]: e["sha256"] for e in previous["files"].values()}
+
+    entries = tree_entries(ref, root)
+    with GitBlobReader(root) as reader:
+        for object_id, _size in entries.values():
+            if object_id not in known:
+                digest = hashlib.sha256()
+                for chunk in reader.stream(object_id):
+                    digest.update(chunk)
+                known[object_id] = digest.hexdigest()
+
+    manifest = {
+        "format": MANIFEST_FORMAT,
+        "ref": ref,
+        "tree": tree,
+        "files": {
+            path: {"sha256": known[object_id], "size": size, "git": object_id}
+            for path, (object_id, size) in sorted(entries.items())
+        },
+    }
+
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache_file.write_text(json.dumps(manifest, sort_keys=True), encoding="utf-8")
+    return manifest
+
+
+def compute_delta(
+    current: Manifest, previous: Optional[Manifest] = None, full: bool = False
+) -> Manifest:
+    """
+    Compare two release manifests.
+
+    Args:
+        current: Manifest of the release being built.
+        previous: Manifest of the previous release, if any.
+        full: List every blob of the current release, e.g. because the
+              previous release has no blob store to build on.
+
+    Returns:
+        Delta listing added, changed and removed paths, and the digests of
+        blobs the previous release does not already contain (or all of them).
+    """
+    current_files = current["files"]
+    previous_files = previous["files"] if previous else {}
+    previous_digests = set()
+    if not full:
+        previous_digests = {entry["sha256"] for entry in previous_files.values()}
+
+    added = [p for p in current_files if p not in previous_files]
+    changed = [
+        p
+        for p in current_files
+        if p in previous_files
+        and previous_files[p]["sha256"] != current_files[p]["sha256"]
+    ]
+    removed = [p for p in previous_files if p not in current_files]
+
+    sizes = {}
+    for path in current_files if full else added + changed:
+        entry = current_files[path]
+        if entry["sha256"] not in previous_digests:
+            sizes[entry["sha256"]] = entry["size"]
+
+    return {
+        "from": previous["ref"] if previous else None,
+        "to": current["ref"],
+        "added": added,
+        "changed": changed,
+        "removed": removed,
+        "full": full,
+        "blobs": sorted(sizes),
+        "bytes": sum(sizes.values()),
+    }
+
+
+def stage_release(
+    current: Manifest,
+    delta: Manifest,
+    output_dir: Union[str, Path],
+    root: Union[str, Path] = ".",
+) -> List[Path]:
+    """
+    Write the files needed to publish a delta release.
+
+    The output directory receives ``blobs/<sha256>`` for every new blob plus
+    ``manifest-<ref>.json`` and ``delta-<ref>.json``. File names are unique
+    per version, so they can accumulate in one flat store (e.g. successive
+    Zenodo versions) from which any version can be reconstructed.
+
+    Args:
+        current: Manifest of the release being built.
+        delta: Delta computed against the previous release.
+        output_dir: Directory to write to.
+        root: Repository directory.
+
+    Returns:
+        Paths of all files written.
+    """
+    output_path = Path(output_dir)
+    blob_dir = output_path / "blobs"
+    blob_dir.mkdir(parents=True, exist_ok=True)
+
+    object_ids = {e["sha256"]: e["git"] for e in current["files"].values()}
+    written = []
+    with GitBlobReader(root) as reader:
+        for digest in delta["blobs"]:
+            blob_path = blob_dir / digest
+            with open(blob_path, "wb") as f:
+                for chunk in reader.stream(object_ids[digest]):
+                    f.write(chunk)
+            written.append(blob_path)
+
+    label = _safe_label(current["ref"])
+    for name, content in (("manifest", current), ("delta", delta)):
+        path = output_path / f"{name}-{label}.json"
+        path.write_text(json.dumps(content, indent=2, sort_keys=True), "utf-8")
+        written.append(path)
+    return written
+
+
+def reconstruct(
+    manifest: Manifest, blob_dir: Union[str, Path], dest: Union[str, Path]
+) -> None:
+    """
+    Recreate a released version from its manifest and a blob store.
+
+    Args:
+        manifest: Manifest of the version to reconstruct.
+        blob_dir: Directory containing blobs named by SHA-256 digest.
+        dest: Directory to write the files into.
+
+    Raises:
+        ValueError: If a blob does not match its digest.
+    """
+    for path, entry in manifest["files"].items():
+        with open(Path(blob_dir) / entry["sha256"], "rb") as blob:
+            digest = hashlib.sha256()
+            for chunk in iter(lambda: blob.read(_READ_SIZE), b""):
+                digest.update(chunk)
+            if digest.hexdigest() != entry["sha256"]:
+                raise ValueError(f"Blob for {path} does not match its digest")
+
+            target = Path(dest) / path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            blob.seek(0)
+            with open(target, "wb") as f:
+                shutil.copyfileobj(blob, f, _READ_SIZE)
+
+
+def _safe_label(ref: str) -> str:
+    """Turn a ref into a string usable in file names."""
+    return re.sub(r"[^A-Za-z0-9._-]+", "-", ref).strip("-") or "release"
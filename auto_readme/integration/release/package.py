@@ -0,0 +1,395 @@
+"""
+Reproducible release archive builder.
+
+Builds ``.tar.gz`` and ``.zip`` archives of a git ref plus a ``SHA256SUMS``
+file in a single pass over the data: every blob is streamed once out of git
+and fed to both archive writers, and the archives are hashed as they are
+written.
+
+Archives are byte-identical across machines and runs: entries are sorted by
+path, every entry gets the same fixed timestamp (``SOURCE_DATE_EPOCH`` or the
+commit time of the ref), and ownership and header fields are normalized.
+
+The gzip stream is compressed in parallel, pigz-style: the tar stream is cut
+into fixed-size chunks that are deflated concurrently (each primed with the
+previous 32 KiB as a dictionary) and joined into a single gzip member. Since
+chunk boundaries do not depend on the number of workers, the output does not
+either. The zip archive is compressed on its own thread alongside.
+"""
+
+import hashlib
+import os
+import queue
+import struct
+import subprocess
+import sys
+import tarfile
+import threading
+import time
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, Any, Deque, Dict, List, Optional, Sequence, Union
+
+from auto_readme.integration.release.manifest import (
+    GitBlobReader,
+    TreeEntry,
+    ls_tree,
+)
+
+ARCHIVE_FORMATS = ("tar.gz", "zip")
+CHECKSUM_FILE = "SHA256SUMS"
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+DEFAULT_LEVEL = 6
+
+_WINDOW_SIZE = 32 * 1024
+_TAR_RECORD_SIZE = tarfile.RECORDSIZE
+_ZIP_EPOCH = 315532800  # 1980-01-01, the earliest zip timestamp
+_SYMLINK_MODE = 0o120000
+
+
+class HashingWriter:
+    """Write-only file wrapper that hashes everything written through it."""
+
+    def __init__(self, fileobj: IO[bytes]) -> None:
+        """
+        Wrap a binary file.
+
+        Args:
+            fileobj: Destination file.
+        """
+        self._fileobj = fileobj
+        self.sha256 = hashlib.sha256()
+
+    def write(self, data: bytes) -> int:
+        """Hash and write data."""
+        self.sha256.update(data)
+        return self._fileobj.write(data)
+
+    def flush(self) -> None:
+        """Flush the underlying file."""
+        self._fileobj.flush()
+
+
+class ParallelGzipWriter:
+    """
+    Write a single-member gzip stream, deflating fixed-size chunks in parallel.
+
+    Example:
+        >>> with open("out.gz", "wb") as f:
+        ...     gz = ParallelGzipWriter(f)
+        ...     gz.write(data)
+        ...     gz.close()
+    """
+
+    def __init__(
+        self,
+        fileobj: Any,
+        level: int = DEFAULT_LEVEL,
+        jobs: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """
+        Start the gzip stream.
+
+        Args:
+            fileobj: Destination with a ``write`` method.
+            level: zlib compression level.
+            jobs: Number of compression threads. Defaults to the CPU count.
+            chunk_size: Bytes of input deflated per task.
+        """
+        self._fileobj = fileobj
+        self._level = level
+        self._jobs = jobs or os.cpu_count() or 1
+        self._chunk_size = chunk_size
+        self._executor = ThreadPoolExecutor(max_workers=self._jobs)
+        self._pending: Deque["Future[bytes]"] = deque()
+        self._buffer = bytearray()
+        self._dictionary = b""
+        self._crc = 0
+        self.size = 0
+
+        # Magic, deflate, no flags, zero mtime, no extra flags, unknown OS
+        self._fileobj.write(b"\x1f\x8b\x08\x00" + struct.pack("<I", 0) + b"\x00\xff")
+
+    def write(self, data: bytes) -> int:
+        """Buffer data, submitting full chunks for compression."""
+        self._crc = zlib.crc32(data, self._crc)
+        self.size += len(data)
+        self._buffer += data
+        while len(self._buffer) >= self._chunk_size:
+            chunk = bytes(self._buffer[: self._chunk_size])
+            del self._buffer[: self._chunk_size]
+            self._submit(chunk, final=False)
+        return len(data)
+
+    def close(self) -> None:
+        """Compress the remaining data and write the gzip trailer."""
+        self._submit(bytes(self._buffer), final=True)
+        self._buffer.clear()
+        while self._pending:
+            self._fileobj.write(self._pending.popleft().result())
+        self._executor.shutdown()
+        self._fileobj.write(struct.pack("<II", self._crc, self.size & 0xFFFFFFFF))
+
+    def abort(self) -> None:
+        """Stop compressing after a failure, leaving the stream incomplete."""
+        self._pending.clear()
+        self._executor.shutdown(cancel_futures=True)
+
+    def _submit(self, chunk: bytes, final: bool) -> None:
+        """Queue a chunk for compression, writing finished chunks in order."""
+        future = self._executor.submit(
+            _deflate_chunk, chunk, self._dictionary, self._level, final
+        )
+        self._pending.append(future)
+        self._dictionary = (self._dictionary + chunk)[-_WINDOW_SIZE:]
+
+        # Bound memory: keep at most two chunks per worker in flight
+        while len(self._pending) > 2 * self._jobs:
+            self._fileobj.write(self._pending.popleft().result())
+
+
+def _deflate_chunk(chunk: bytes, dictionary: bytes, level: int, final: bool) -> bytes:
+    """Raw-deflate one chunk so that consecutive chunks concatenate."""
+    if dictionary:
+        compressor = zlib.compressobj(
+            level, zlib.DEFLATED, -zlib.MAX_WBITS, zdict=dictionary
+        )
+    else:
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(chunk) + compressor.flush(
+        zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+    )
+
+
+class _ZipWriterThread(threading.Thread):
+    """Compress zip entries on a background thread, fed chunk by chunk."""
+
+    _END = object()
+
+    def __init__(self, fileobj: Any, level: int) -> None:
+        super().__init__(daemon=True)
+        self._fileobj = fileobj
+        self._level = level
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=64)
+        self._error: Optional[BaseException] = None
+
+    def start_entry(self, info: zipfile.ZipInfo, size: int) -> None:
+        self._queue.put((info, size))
+
+    def feed(self, chunk: bytes) -> None:
+        self._queue.put(chunk)
+
+    def end_entry(self) -> None:
+        self._queue.put(None)
+
+    def finish(self) -> None:
+        self._queue.put(self._END)
+        self.join()
+        if self._error:
+            raise self._error
+
+    def abort(self) -> None:
+        """Stop after a failure on the feeding thread, wherever it got to."""
+        if self.is_alive():
+            # End any open entry, then the archive
+            self._queue.put(None)
+            self._queue.put(self._END)
+            self.join()
+
+    def run(self) -> None:
+        try:
+            # The output is write-only, so zipfile streams entries with data
+            # descriptors instead of seeking back to patch local headers
+            with zipfile.ZipFile(
+                self._fileobj, "w", zipfile.ZIP_DEFLATED, compresslevel=self._level
+            ) as zf:
+                while True:
+                    item = self._queue.get()
+                    if item is self._END:
+                        break
+                    info, size = item
+                    chunks = iter(self._queue.get, None)
+                    if sys.version_info >= (3, 13):
+                        info.compress_level = self._level
+                    elif self._level != DEFAULT_LEVEL:
+                        # Before Python 3.13 a prepared ZipInfo only takes a
+                        # level through writestr, so the entry is buffered;
+                        # zlib already defaults to DEFAULT_LEVEL
+                        data = b"".join(chunks)
+                        zf.writestr(info, data, compresslevel=self._level)
+                        continue
+                    force_zip64 = size >= zipfile.ZIP64_LIMIT
+                    with zf.open(info, "w", force_zip64=force_zip64) as entry:
+                        for chunk in chunks:
+                            entry.write(chunk)
+        except BaseException as e:  # re-raised on the caller's thread
+            self._error = e
+            while self._queue.get() is not self._END:
+                pass
+
+
+def source_date_epoch(ref: str = "HEAD", root: Union[str, Path] = ".") -> int:
+    """
+    Get the fixed timestamp for archive entries.
+
+    Args:
+        ref: Ref being archived.
+        root: Repository directory.
+
+    Returns:
+        ``SOURCE_DATE_EPOCH`` if set, otherwise the commit time of ``ref``.
+    """
+    if os.environ.get("SOURCE_DATE_EPOCH"):
+        return int(os.environ["SOURCE_DATE_EPOCH"])
+    output = subprocess.check_output(
+        ["git", "log", "-1", "--format=%ct", ref], cwd=root, text=True
+    )
+    return int(output.strip())
+
+
+def build_archives(
+    ref: str,
+    output_dir: Union[str, Path],
+    name: str,
+    root: Union[str, Path] = ".",
+    formats: Sequence[str] = ARCHIVE_FORMATS,
+    jobs: Optional[int] = None,
+    level: int = DEFAULT_LEVEL,
+    mtime: Optional[int] = None,
+) -> Dict[str, str]:
+    """
+    Build reproducible release archives of a git ref.
+
+    Entries are stored under a ``<name>/`` prefix. The output directory gets
+    ``<name>.tar.gz`` and/or ``<name>.zip`` and a ``SHA256SUMS`` file.
+
+    Args:
+        ref: Tag or commit to archive.
+        output_dir: Directory to write archives to.
+        name: Archive base name and entry prefix.
+        root: Repository directory.
+        formats: Archive formats to produce (``tar.gz``, ``zip``).
+        jobs: Compression threads for the gzip stream. Defaults to CPU count.
+        level: Compression level for both formats.
+        mtime: Entry timestamp. Defaults to ``source_date_epoch(ref)``.
+
+    Returns:
+        Mapping of archive filename to SHA-256 digest.
+
+    Raises:
+        ValueError: If an unknown format is requested.
+    """
+    unknown = set(formats) - set(ARCHIVE_FORMATS)
+    if unknown:
+        raise ValueError(f"Unknown archive format(s): {', '.join(sorted(unknown))}")
+
+    if mtime is None:
+        mtime = source_date_epoch(ref, root)
+    date_time = time.gmtime(max(mtime, _ZIP_EPOCH))[:6]
+
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    entries = ls_tree(ref, root)
+
+    files: List[IO[bytes]] = []
+    writers: Dict[str, HashingWriter] = {}
+    gz: Optional[ParallelGzipWriter] = None
+    zip_thread: Optional[_ZipWriterThread] = None
+    try:
+        for fmt in formats:
+            archive = open(output_path / f"{name}.{fmt}", "wb")
+            files.append(archive)
+            writers[f"{name}.{fmt}"] = HashingWriter(archive)
+        if "tar.gz" in formats:
+            gz = ParallelGzipWriter(writers[f"{name}.tar.gz"], level, jobs)
+        if "zip" in formats:
+            zip_thread = _ZipWriterThread(writers[f"{name}.zip"], level)
+            zip_thread.start()
+
+        with GitBlobReader(root) as reader:
+            for entry in entries:
+                path = f"{name}/{entry.path}"
+                chunks = reader.stream(entry.object_id)
+
+                link_target = None
+                if entry.mode == _SYMLINK_MODE:
+                    link_target = b"".join(chunks)
+                    chunks = iter([link_target])
+
+                # Symlink targets live in the tar header, not in the data
+                tar_data = gz if link_target is None else None
+                if gz:
+                    gz.write(_tar_header(path, entry, mtime, link_target))
+                if zip_thread:
+                    info = _zip_info(path, entry.mode, date_time)
+                    zip_thread.start_entry(info, entry.size)
+
+                for chunk in chunks:
+                    if tar_data:
+                        tar_data.write(chunk)
+                    if zip_thread:
+                        zip_thread.feed(chunk)
+
+                if tar_data:
+                    tar_data.write(b"\0" * (-entry.size % tarfile.BLOCKSIZE))
+                if zip_thread:
+                    zip_thread.end_entry()
+
+        if gz:
+            gz.write(b"\0" * (2 * tarfile.BLOCKSIZE))
+            gz.write(b"\0" * (-gz.size % _TAR_RECORD_SIZE))
+            gz.close()
+        if zip_thread:
+            zip_thread.finish()
+    except BaseException:
+        # Release the compression threads before the files they write to
+        if gz:
+            gz.abort()
+        if zip_thread:
+            zip_thread.abort()
+        raise
+    finally:
+        for handle in files:
+            handle.close()
+
+    checksums = {filename: w.sha256.hexdigest() for filename, w in writers.items()}
+    sums_path = output_path / CHECKSUM_FILE
+    with open(sums_path, "w", encoding="utf-8", newline="\n") as sums:
+        for filename, digest in sorted(checksums.items()):
+            sums.write(f"{digest}  {filename}\n")
+    return checksums
+
+
+def _tar_header(
+    path: str, entry: TreeEntry, mtime: int, link_target: Optional[bytes]
+) -> bytes:
+    """Build a normalized PAX tar header."""
+    info = tarfile.TarInfo(path)
+    info.mtime = mtime
+    info.uid = info.gid = 0
+    info.uname = info.gname = ""
+    if link_target is not None:
+        info.type = tarfile.SYMTYPE
+        info.linkname = link_target.decode("utf-8", "surrogateescape")
+        info.mode = 0o777
+    else:
+        info.size = entry.size
+        info.mode = 0o755 if entry.mode & 0o111 else 0o644
+    return info.tobuf(tarfile.PAX_FORMAT, "utf-8", "surrogateescape")
+
+
+def _zip_info(path: str, mode: int, date_time: Any) -> zipfile.ZipInfo:
+    """Build a normalized zip entry header."""
+    info = zipfile.ZipInfo(path, date_time)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.create_system = 3  # Unix, so external_attr carries the file mode
+    if mode == _SYMLINK_MODE:
+        info.external_attr = (_SYMLINK_MODE | 0o777) << 16
+    else:
+        info.external_attr = (0o100755 if mode & 0o111 else 0o100644) << 16
+    return info
@@ -16,6 +16,11 @@ def get_version_from_config(config_path="config.yaml"):
         sys.exit(1)
     with open(config_file) as f:
         config = yaml.safe_load(f)
+    return release_version(config)
+
+
+def release_version(config):
+    """Return the version to release, exiting if the config has none."""
     version = config.get("version")
     if not version:
         print("No 'version' field found in config.yaml.")
@@ -23,30 +28,52 @@ def get_version_from_config(config_path="config.yaml"):
     return version
 
 
-def tag_exists(tag):
-    tags = subprocess.check_output(["git", "tag"], text=True).splitlines()
+def tag_exists(tag, tags=None, root="."):
+    if tags is None:
+        tags = subprocess.check_output(["git", "tag"], cwd=root, text=True).splitlines()
     return tag in tags
 
 
-def main():
-    version = get_version_from_config()
+def create_release(version, tags=None, config_dirty=None, root="."):
+    """Create and push the release tag in the repository at ``root``.
+
+    ``tags`` and ``config_dirty`` can come from an existing snapshot of the
+    repository; otherwise git is queried. Returns the tag, or None if it
+    already exists.
+    """
     tag = f"v{version}"
-    if tag_exists(tag):
+    if tag_exists(tag, tags, root):
         print(f"Tag {tag} already exists. No new release created.")
-        sys.exit(0)
+        return None
     # Ensure config.yaml is committed
-    result = subprocess.run(
-        ["git", "status", "--porcelain", "config.yaml"], capture_output=True, text=True
-    )
-    if result.stdout.strip():
-        print(
+    if config_dirty is None:
+        result = subprocess.run(
+            ["git", "status", "--porcelain", "config.yaml"],
+            cwd=root,
+            capture_output=True,
+            text=True,
+        )
+        config_dirty = bool(result.stdout.strip())
+    if config_dirty:
+        raise RuntimeError(
             "config.yaml has uncommitted changes. Please commit them before releasing."
         )
-        sys.exit(1)
     # Create and push the tag
-    subprocess.run(["git", "tag", tag], check=True)
-    subprocess.run(["git", "push", "origin", tag], check=True)
+    subprocess.run(["git", "tag", tag], cwd=root, check=True)
+    subprocess.run(["git", "push", "origin", tag], cwd=root, check=True)
     print(f"Created and pushed tag {tag}. All release automations will now run.")
+    return tag
+
+
+def main():
+    version = get_version_from_config()
+    try:
+        tag = create_release(version)
+    except RuntimeError as e:
+        print(e)
+        sys.exit(1)
+    if tag is None:
+        sys.exit(0)
 
     # Update CHANGELOG.md from config.yaml
     try:
@@ -0,0 +1,233 @@
+"""
+Link and identifier checking for project configs.
+
+Collects the ``github_link``, ``huggingface_link``, ``zenodo_link``, ``doi``
+and contributor ``orcid`` values of one or many configs and checks them
+concurrently. Malformed DOIs and ORCID iDs (bad syntax or checksum) are
+reported without a request; everything else is resolved through the shared
+``AsyncHTTPClient``, so a URL used by many projects is requested once and
+responses are reused from the on-disk cache until they expire.
+"""
+
+import asyncio
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from auto_readme.cache import user_cache_dir
+from auto_readme.net import (
+    DEFAULT_TTL,
+    REQUEST_ERRORS,
+    AsyncHTTPClient,
+    ResponseCache,
+)
+
+ConfigDict = Dict[str, Any]
+
+DOI_RESOLVER = "https://doi.org/"
+ORCID_RESOLVER = "https://orcid.org/"
+
+LINK_FIELDS = ("github_link", "huggingface_link", "zenodo_link")
+PEOPLE_FIELDS = ("contributors", "authors")
+
+# Servers that refuse HEAD are retried with GET
+_HEAD_REJECTED = {403, 405, 501}
+
+_DOI_PATTERN = re.compile(r"^10\.\d{4,9}/\S+$")
+_ORCID_PATTERN = re.compile(r"^\d{4}-\d{4}-\d{4}-\d{3}[\dX]$")
+
+
+@dataclass
+class LinkResult:
+    """Outcome of checking one link or identifier."""
+
+    field: str
+    value: str
+    url: Optional[str]
+    ok: bool
+    status: Optional[int] = None
+    error: Optional[str] = None
+
+
+def normalize_doi(value: str) -> str:
+    """Strip resolver URL and ``doi:`` prefixes from a DOI."""
+    value = value.strip()
+    value = re.sub(r"^https?://(dx\.)?doi\.org/", "", value, flags=re.IGNORECASE)
+    return re.sub(r"^doi:\s*", "", value, flags=re.IGNORECASE)
+
+
+def normalize_orcid(value: str) -> str:
+    """Strip the resolver URL from an ORCID iD."""
+    return re.sub(r"^https?://orcid\.org/", "", value.strip(), flags=re.IGNORECASE)
+
+
+def orcid_checksum_valid(orcid: str) -> bool:
+    """
+    Validate the ISO 7064 11,2 check digit of an ORCID iD.
+
+    Args:
+        orcid: ORCID iD in ``0000-0000-0000-0000`` form.
+
+    Returns:
+        True if the final character matches the checksum.
+    """
+    digits = orcid.replace("-", "")
+    total = 0
+    for char in digits[:-1]:
+        total = (total + int(char)) * 2
+    check = (12 - total % 11) % 11
+    return digits[-1] == ("X" if check == 10 else str(check))
+
+
+def valid_doi(doi: str) -> bool:
+    """Check the syntax of a normalized DOI."""
+    return bool(_DOI_PATTERN.match(doi))
+
+
+def valid_orcid(orcid: str) -> bool:
+    """Check the syntax and checksum of a normalized ORCID iD."""
+    return bool(_ORCID_PATTERN.match(orcid)) and orcid_checksum_valid(orcid)
+
+
+def collect_links(
+    config: ConfigDict,
+    doi_resolver: str = DOI_RESOLVER,
+    orcid_resolver: str = ORCID_RESOLVER,
+) -> List[LinkResult]:
+    """
+    List the links and identifiers of a config that need checking.
+
+    Args:
+        config: Project configuration dictionary.
+        doi_resolver: Base URL DOIs are resolved against.
+        orcid_resolver: Base URL ORCID iDs are resolved against.
+
+    Returns:
+        Pending results: ``url`` is set for values to request, and malformed
+        identifiers are already marked as failed.
+    """
+    targets = []
+    for name in LINK_FIELDS:
+        value = str(config.get(name) or "").strip()
+        if value:
+            targets.append(LinkResult(name, value, value, ok=False))
+
+    doi = str(config.get("doi") or "").strip()
+    if doi:
+        normalized = normalize_doi(doi)
+        if valid_doi(normalized):
+            targets.append(LinkResult("doi", doi, doi_resolver + normalized, ok=False))
+        else:
+            targets.append(LinkResult("doi", doi, None, False, error="malformed DOI"))
+
+    seen = set()
+    for people_field in PEOPLE_FIELDS:
+        for i, person in enumerate(config.get(people_field) or []):
+            orcid = str(person.get("orcid") or "").strip() if person else ""
+            if not orcid or orcid in seen:
+                continue
+            seen.add(orcid)
+
+            name = f"{people_field}[{i}].orcid"
+            normalized = normalize_orcid(orcid)
+            if not _ORCID_PATTERN.match(normalized):
+                error = "malformed ORCID iD"
+            elif not orcid_checksum_valid(normalized):
+                error = "invalid ORCID iD checksum"
+            else:
+                url = orcid_resolver + normalized
+                targets.append(LinkResult(name, orcid, url, ok=False))
+                continue
+            targets.append(LinkResult(name, orcid, None, False, error=error))
+    return targets
+
+
+async def check_url(
+    client: AsyncHTTPClient, url: str
+) -> Tuple[Optional[int], Optional[str]]:
+    """
+    Check that a URL resolves.
+
+    Args:
+        client: HTTP client to use.
+        url: URL to check.
+
+    Returns:
+        (final status, error message); the status is None on network errors.
+    """
+    try:
+        response = await client.request("HEAD", url)
+        if response.status in _HEAD_REJECTED:
+            response = await client.request("GET", url)
+    except REQUEST_ERRORS as e:
+        return None, str(e) or type(e).__name__
+
+    if 200 <= response.status < 400:
+        return response.status, None
+    return response.status, f"HTTP {response.status}"
+
+
+async def check_links(
+    configs: Sequence[ConfigDict],
+    client: AsyncHTTPClient,
+    doi_resolver: str = DOI_RESOLVER,
+    orcid_resolver: str = ORCID_RESOLVER,
+) -> List[List[LinkResult]]:
+    """
+    Check the links of many configs concurrently.
+
+    Args:
+        configs: Project configuration dictionaries.
+        client: HTTP client shared by all checks.
+        doi_resolver: Base URL DOIs are resolved against.
+        orcid_resolver: Base URL ORCID iDs are resolved against.
+
+    Returns:
+        One list of results per config, in input order.
+    """
+    per_config = [collect_links(c, doi_resolver, orcid_resolver) for c in configs]
+    urls = sorted({r.url for results in per_config for r in results if r.url})
+    outcomes = dict(
+        zip(urls, await asyncio.gather(*(check_url(client, url) for url in urls)))
+    )
+
+    for results in per_config:
+        for result in results:
+            if result.url:
+                result.status, result.error = outcomes[result.url]
+                result.ok = result.error is None
+    return per_config
+
+
+def run_link_check(
+    configs: Sequence[ConfigDict],
+    max_per_host: int = 4,
+    rate_limit: Optional[float] = None,
+    ttl: float = DEFAULT_TTL,
+    cache_dir: Optional[Union[str, Path]] = None,
+    use_cache: bool = True,
+) -> List[List[LinkResult]]:
+    """
+    Synchronous entry point for ``check_links``.
+
+    Args:
+        configs: Project configuration dictionaries.
+        max_per_host: Maximum concurrent connections per host.
+        rate_limit: Maximum requests per second per host.
+        ttl: Seconds cached responses stay fresh.
+        cache_dir: Response cache directory. Defaults to the user cache.
+        use_cache: Whether to use the response cache at all.
+
+    Returns:
+        One list of results per config, in input order.
+    """
+    cache = None
+    if use_cache:
+        cache = ResponseCache(cache_dir or user_cache_dir() / "http", ttl)
+
+    async def run() -> List[List[LinkResult]]:
+        async with AsyncHTTPClient(max_per_host, rate_limit, cache=cache) as client:
+            return await check_links(configs, client)
+
+    return asyncio.run(run())
@@ -0,0 +1,538 @@
+"""
+Asynchronous HTTP client shared by the network-facing stages.
+
+The client speaks plain HTTP/1.1 over asyncio streams, so it needs no
+third-party dependencies. It keeps a pool of keep-alive connections per host,
+limits concurrency and request rate per host, and collapses identical
+requests: within one client (one batch), each unique request is sent at most
+once no matter how many projects ask for it.
+
+Responses can be cached on disk with a TTL. Expired entries that carry an
+``ETag`` or ``Last-Modified`` header are revalidated with a conditional
+request instead of being fetched again.
+
+Proxies are taken from the environment like ``urllib`` does (``HTTP_PROXY``,
+``HTTPS_PROXY`` and ``NO_PROXY``): plain HTTP requests are sent to the proxy
+in absolute form, and HTTPS requests are tunnelled through it with
+``CONNECT``.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import socket
+import ssl
+import tempfile
+import time
+import urllib.request
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import SplitResult, unquote, urljoin, urlsplit
+
+from auto_readme import __version__
+
+USER_AGENT = f"auto-research-readme/{__version__}"
+DEFAULT_TTL = 24 * 60 * 60
+DEFAULT_TIMEOUT = 30.0
+MAX_BODY_SIZE = 16 * 1024 * 1024
+
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+# Network failures surfaced by AsyncHTTPClient.request
+REQUEST_ERRORS = (OSError, EOFError, ValueError, asyncio.TimeoutError)
+
+_Connection = Tuple[asyncio.StreamReader, asyncio.StreamWriter]
+
+
+@dataclass
+class Response:
+    """An HTTP response, possibly served from the disk cache."""
+
+    url: str
+    status: int
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    from_cache: bool = False
+
+    def json(self) -> Any:
+        """Decode the body as JSON."""
+        return json.loads(self.body)
+
+
+class ResponseCache:
+    """
+    On-disk response cache with per-entry expiry.
+
+    Entries are JSON files named by the hash of their key and written
+    atomically, so several processes can share one cache directory.
+    """
+
+    def __init__(self, directory: Union[str, Path], ttl: float = DEFAULT_TTL) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            directory: Cache directory; created on first write.
+            ttl: Seconds an entry stays fresh.
+        """
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    @staticmethod
+    def key(method: str, url: str, headers: Optional[Dict[str, str]] = None) -> str:
+        """Build the cache key of a request."""
+        parts = [method.upper(), url]
+        parts += [f"{k.lower()}:{v}" for k, v in sorted((headers or {}).items())]
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Read an entry, fresh or expired.
+
+        Returns:
+            Entry with ``url``, ``status``, ``headers``, ``body`` (base64) and
+            ``expires`` fields, or None if missing or unreadable.
+        """
+        try:
+            return dict(json.loads(self._path(key).read_text(encoding="utf-8")))
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, response: Response) -> Dict[str, Any]:
+        """Store a response and return the new entry."""
+        entry = {
+            "url": response.url,
+            "status": response.status,
+            "headers": response.headers,
+            "body": base64.b64encode(response.body).decode("ascii"),
+            "expires": time.time() + self.ttl,
+        }
+        self._write(key, entry)
+        return entry
+
+    def refresh(self, key: str, entry: Dict[str, Any]) -> None:
+        """Extend an entry's expiry after a successful revalidation."""
+        self._write(key, {**entry, "expires": time.time() + self.ttl})
+
+    @staticmethod
+    def is_fresh(entry: Dict[str, Any]) -> bool:
+        """Check whether an entry has not expired yet."""
+        return float(entry.get("expires", 0)) > time.time()
+
+    @staticmethod
+    def to_response(entry: Dict[str, Any]) -> Response:
+        """Turn a cache entry back into a response."""
+        return Response(
+            entry["url"],
+            entry["status"],
+            entry["headers"],
+            base64.b64decode(entry["body"]),
+            from_cache=True,
+        )
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _write(self, key: str, entry: Dict[str, Any]) -> None:
+        """Write an entry; failing to write leaves the response uncached."""
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+
+
+class _HostPool:
+    """Idle connections, concurrency limit and rate limit for one host."""
+
+    def __init__(self, max_connections: int, min_interval: float) -> None:
+        self.semaphore = asyncio.Semaphore(max_connections)
+        self.idle: List[_Connection] = []
+        self.min_interval = min_interval
+        self.next_start = 0.0
+
+    async def wait_turn(self) -> None:
+        """Sleep until this host's rate limit allows another request."""
+        if not self.min_interval:
+            return
+        now = asyncio.get_running_loop().time()
+        start = max(now, self.next_start)
+        self.next_start = start + self.min_interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+class AsyncHTTPClient:
+    """
+    Pooled, rate-limited, deduplicating HTTP/1.1 client.
+
+    Example:
+        >>> async with AsyncHTTPClient(cache=ResponseCache(path)) as client:
+        ...     response = await client.request("HEAD", "https://example.org")
+    """
+
+    def __init__(
+        self,
+        max_per_host: int = 4,
+        rate_limit: Optional[float] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        cache: Optional[ResponseCache] = None,
+        max_redirects: int = 5,
+        user_agent: str = USER_AGENT,
+        proxies: Optional[Dict[str, str]] = None,
+        max_body_size: int = MAX_BODY_SIZE,
+    ) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            max_per_host: Maximum concurrent connections per host.
+            rate_limit: Maximum requests per second per host (None: unlimited).
+            timeout: Seconds allowed for connecting and for each exchange.
+            cache: Optional disk cache for responses.
+            max_redirects: Redirects followed before giving up.
+            user_agent: User-Agent header value.
+            proxies: Proxy URL per scheme, plus an optional ``"no"`` entry
+                     listing hosts to reach directly, as returned by
+                     ``urllib.request.getproxies()``; defaults to the
+                     environment and system settings.
+            max_body_size: Largest response body accepted, in bytes.
+        """
+        self.max_per_host = max(1, max_per_host)
+        self.min_interval = 1.0 / rate_limit if rate_limit else 0.0
+        self.timeout = timeout
+        self.cache = cache
+        self.max_redirects = max_redirects
+        self.user_agent = user_agent
+        self.proxies = proxies
+        if proxies is None:
+            self.proxies = urllib.request.getproxies()
+        self._system_proxies = proxies is None
+        self.max_body_size = max_body_size
+        self.requests_sent = 0
+        self._pools: Dict[Tuple[str, str, int], _HostPool] = {}
+        self._requests: Dict[Tuple[Any, ...], "asyncio.Future[Response]"] = {}
+        self._ssl_context: Optional[ssl.SSLContext] = None
+
+    async def __aenter__(self) -> "AsyncHTTPClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def request(
+        self, method: str, url: str, headers: Optional[Dict[str, str]] = None
+    ) -> Response:
+        """
+        Send a request, following redirects.
+
+        Identical requests made through this client share one result.
+
+        Args:
+            method: HTTP method.
+            url: Absolute http(s) URL.
+            headers: Extra request headers.
+
+        Returns:
+            Final response after redirects.
+
+        Raises:
+            OSError, EOFError, ValueError, asyncio.TimeoutError: On network
+                or protocol failures (see ``REQUEST_ERRORS``).
+        """
+        headers = headers or {}
+        key = (method.upper(), url, tuple(sorted(headers.items())))
+        future = self._requests.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._cached_request(method, url, headers))
+            self._requests[key] = future
+        return await asyncio.shield(future)
+
+    async def close(self) -> None:
+        """Close all idle connections."""
+        for pool in self._pools.values():
+            while pool.idle:
+                _reader, writer = pool.idle.pop()
+                writer.close()
+
+    async def _cached_request(
+        self, method: str, url: str, headers: Dict[str, str]
+    ) -> Response:
+        """Serve from cache, revalidate, or fetch."""
+        key = ResponseCache.key(method, url, headers) if self.cache else ""
+        entry = self.cache.get(key) if self.cache else None
+        if entry and ResponseCache.is_fresh(entry):
+            return ResponseCache.to_response(entry)
+
+        send_headers = dict(headers)
+        if entry:
+            if "etag" in entry["headers"]:
+                send_headers["If-None-Match"] = entry["headers"]["etag"]
+            if "last-modified" in entry["headers"]:
+                send_headers["If-Modified-Since"] = entry["headers"]["last-modified"]
+
+        target = entry["url"] if entry else url
+        response = await self._follow(method, target, send_headers)
+
+        if self.cache:
+            if entry and response.status == 304:
+                self.cache.refresh(key, entry)
+                return ResponseCache.to_response(entry)
+            # Server errors and throttling are transient; do not pin them
+            if response.status < 500 and response.status != 429:
+                self.cache.put(key, response)
+        return response
+
+    async def _follow(self, method: str, url: str, headers: Dict[str, str]) -> Response:
+        """Send a request and follow redirects."""
+        for _ in range(self.max_redirects + 1):
+            response = await self._send(method, url, headers)
+            location = response.headers.get("location")
+            if response.status not in REDIRECT_STATUSES or not location:
+                return response
+            url = urljoin(url, location)
+            if response.status == 303 and method != "HEAD":
+                method = "GET"
+        raise ValueError(f"Too many redirects for {url}")
+
+    async def _send(self, method: str, url: str, headers: Dict[str, str]) -> Response:
+        """Send one request over a pooled connection."""
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise ValueError(f"Unsupported URL: {url}")
+
+        secure = parts.scheme == "https"
+        port = parts.port or (443 if secure else 80)
+        host = parts.hostname
+        pool = self._pools.get((parts.scheme, host, port))
+        if pool is None:
+            pool = _HostPool(self.max_per_host, self.min_interval)
+            self._pools[(parts.scheme, host, port)] = pool
+
+        proxy = self._proxy(parts.scheme, host)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        host_header = parts.netloc.rsplit("@", 1)[-1]
+        request = [f"{method} {target} HTTP/1.1", f"Host: {host_header}"]
+        if proxy is not None and not secure:
+            # Plain HTTP goes to the proxy with the absolute URL as target
+            request[0] = f"{method} {parts.scheme}://{host_header}{target} HTTP/1.1"
+            request += _proxy_headers(proxy)
+        request += [f"User-Agent: {self.user_agent}", "Accept-Encoding: identity"]
+        request += [f"{name}: {value}" for name, value in headers.items()]
+        payload = ("\r\n".join(request) + "\r\n\r\n").encode("latin-1")
+
+        async with pool.semaphore:
+            await pool.wait_turn()
+            self.requests_sent += 1
+
+            # A pooled connection may have been closed by the server while
+            # idle; retry once on a fresh connection in that case
+            while True:
+                reused = bool(pool.idle)
+                if reused:
+                    connection = pool.idle.pop()
+                else:
+                    connection = await asyncio.wait_for(
+                        self._connect(host, port, secure, proxy), self.timeout
+                    )
+                try:
+                    status, response_headers, body, keep_alive = await asyncio.wait_for(
+                        self._exchange(connection, method, payload), self.timeout
+                    )
+                except REQUEST_ERRORS:
+                    connection[1].close()
+                    if reused:
+                        continue
+                    raise
+                break
+
+            if keep_alive:
+                pool.idle.append(connection)
+            else:
+                connection[1].close()
+        return Response(url, status, response_headers, body)
+
+    def _proxy(self, scheme: str, host: str) -> Optional[SplitResult]:
+        """Find the proxy to reach a host through, if any."""
+        proxies = self.proxies or {}
+        proxy = proxies.get(scheme)
+        if not proxy:
+            return None
+        if self._system_proxies:
+            bypass = urllib.request.proxy_bypass(host)
+        else:
+            # Undocumented, so missing from the typeshed stubs
+            bypass_environment = getattr(urllib.request, "proxy_bypass_environment")
+            bypass = bypass_environment(host, proxies)
+        if bypass:
+            return None
+        parts = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+        if not parts.hostname:
+            raise ValueError(f"Invalid proxy URL for {scheme}: {proxy}")
+        return parts
+
+    async def _connect(
+        self, host: str, port: int, secure: bool, proxy: Optional[SplitResult]
+    ) -> _Connection:
+        """Open a connection to a host, directly or through a proxy."""
+        if proxy is None:
+            return await asyncio.open_connection(
+                host, port, ssl=self._ssl() if secure else None
+            )
+        if not secure:
+            return await asyncio.open_connection(proxy.hostname, proxy.port or 80)
+
+        sock = await asyncio.to_thread(
+            _tunnel, proxy, host, port, self.user_agent, self.timeout
+        )
+        try:
+            return await asyncio.open_connection(
+                sock=sock, ssl=self._ssl(), server_hostname=host
+            )
+        except BaseException:
+            sock.close()
+            raise
+
+    async def _exchange(
+        self, connection: _Connection, method: str, payload: bytes
+    ) -> Tuple[int, Dict[str, str], bytes, bool]:
+        """Write a request and read the response."""
+        reader, writer = connection
+        writer.write(payload)
+        await writer.drain()
+
+        # Informational responses (100 Continue, 103 Early Hints) precede
+        # the final one
+        while True:
+            version, status, headers = await _read_head(reader)
+            if status == 101:
+                raise ValueError("Server switched protocols")
+            if status >= 200:
+                break
+
+        keep_alive = (
+            version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+        )
+        if method == "HEAD" or status in (204, 304):
+            body = b""
+        elif "chunked" in headers.get("transfer-encoding", "").lower():
+            body = await _read_chunked(reader, self.max_body_size)
+        elif "content-length" in headers:
+            length = int(headers["content-length"])
+            if length > self.max_body_size:
+                raise ValueError(
+                    f"Response body larger than {self.max_body_size} bytes"
+                )
+            body = await reader.readexactly(length)
+        else:
+            body = await _read_to_eof(reader, self.max_body_size)
+            keep_alive = False
+        return status, headers, body, keep_alive
+
+    def _ssl(self) -> ssl.SSLContext:
+        if self._ssl_context is None:
+            self._ssl_context = ssl.create_default_context()
+        return self._ssl_context
+
+
+async def _read_head(reader: asyncio.StreamReader) -> Tuple[str, int, Dict[str, str]]:
+    """Read a status line and headers."""
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("Connection closed by server")
+    version, status_text = status_line.decode("latin-1").split(" ", 2)[:2]
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return version, int(status_text), headers
+
+
+def _proxy_headers(proxy: SplitResult) -> List[str]:
+    """Build the authentication header for a proxy URL with credentials."""
+    if proxy.username is None:
+        return []
+    credentials = f"{unquote(proxy.username)}:{unquote(proxy.password or '')}"
+    token = base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+    return [f"Proxy-Authorization: Basic {token}"]
+
+
+def _tunnel(
+    proxy: SplitResult, host: str, port: int, user_agent: str, timeout: float
+) -> socket.socket:
+    """
+    Open a ``CONNECT`` tunnel to a host through an HTTP proxy.
+
+    Runs in a worker thread with a blocking socket; the caller then starts
+    TLS over the returned socket.
+
+    Raises:
+        OSError: If the proxy cannot be reached or refuses the tunnel.
+    """
+    sock = socket.create_connection((proxy.hostname, proxy.port or 80), timeout)
+    try:
+        request = [f"CONNECT {host}:{port} HTTP/1.1", f"Host: {host}:{port}"]
+        request += [f"User-Agent: {user_agent}", *_proxy_headers(proxy)]
+        sock.sendall(("\r\n".join(request) + "\r\n\r\n").encode("latin-1"))
+
+        # Read byte by byte so nothing after the proxy's reply is consumed
+        head = b""
+        while not head.endswith(b"\r\n\r\n"):
+            byte = sock.recv(1)
+            if not byte:
+                raise ConnectionResetError("Connection closed by proxy")
+            head += byte
+        status_line = head.split(b"\r\n", 1)[0].decode("latin-1")
+        status = status_line.split(" ", 2)[1] if " " in status_line else ""
+        if status != "200":
+            raise ConnectionRefusedError(f"Proxy refused tunnel: {status_line}")
+    except BaseException:
+        sock.close()
+        raise
+    sock.settimeout(None)
+    return sock
+
+
+async def _read_to_eof(reader: asyncio.StreamReader, limit: int) -> bytes:
+    """Read a body delimited by connection close, of at most ``limit`` bytes."""
+    body = bytearray()
+    while True:
+        data = await reader.read(64 * 1024)
+        if not data:
+            return bytes(body)
+        body += data
+        if len(body) > limit:
+            raise ValueError(f"Response body larger than {limit} bytes")
+
+
+async def _read_chunked(reader: asyncio.StreamReader, limit: int) -> bytes:
+    """Read a chunked transfer-encoded body of at most ``limit`` bytes."""
+    body = bytearray()
+    while True:
+        size = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+        if len(body) + size > limit:
+            raise ValueError(f"Response body larger than {limit} bytes")
+        if size == 0:
+            # Skip trailers up to the terminating blank line
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            return bytes(body)
+        body += await reader.readexactly(size)
+        await reader.readline()
@@ -0,0 +1,265 @@
+"""
+Run several release stages in one process.
+
+A release job used to run ``make all``, ``automate`` and the release script
+as separate processes, each loading the config (and the release scripts
+parsing it again with their own loaders). A pipeline loads the config once,
+builds one template environment and takes one snapshot of the git state, and
+hands them to each stage in turn.
+
+Stages are declared in the config::
+
+    pipeline:
+      - generate
+      - integrations
+      - changelog
+      - tag
+
+or as ``pipeline: {stages: [...]}``. Without a declaration only ``generate``
+runs, so a pipeline never tags or pushes unless asked to.
+"""
+
+import subprocess
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Union
+
+from jinja2 import Environment
+
+from .config import load_config_with_sources
+from .sinks import OutputSink
+from .template_loader import get_environment, template_search_path
+
+ConfigDict = Dict[str, Any]
+
+DEFAULT_STAGES = ("generate",)
+
+
+@dataclass(frozen=True)
+class ProjectSnapshot:
+    """Git state of the project, read once at the start of a pipeline."""
+
+    is_git: bool
+    tags: FrozenSet[str]
+    dirty_paths: FrozenSet[Path]
+
+
+@dataclass
+class PipelineContext:
+    """State shared by every stage of a pipeline run."""
+
+    config: ConfigDict
+    sources: List[Path]
+    env: Environment
+    snapshot: ProjectSnapshot
+    root: Path = Path(".")
+    sink: Optional[OutputSink] = None
+
+
+@dataclass
+class StageResult:
+    """Outcome of one pipeline stage."""
+
+    name: str
+    seconds: float
+    outputs: List[str] = field(default_factory=list)
+
+
+def take_snapshot(root: Path = Path(".")) -> ProjectSnapshot:
+    """
+    Read the tags and uncommitted paths of the project's git repository.
+
+    Args:
+        root: Project root directory.
+
+    Returns:
+        Snapshot of the repository, with absolute uncommitted paths; empty if
+        the root is not in a git work tree.
+    """
+    try:
+        git_root = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        tags = subprocess.run(
+            ["git", "tag"], cwd=root, capture_output=True, text=True, check=True
+        ).stdout.split()
+        status = subprocess.run(
+            ["git", "status", "--porcelain", "-z"],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return ProjectSnapshot(False, frozenset(), frozenset())
+
+    # Entries are "XY path" relative to the work tree; renames and copies are
+    # followed by their source path
+    dirty = set()
+    entries = iter(status.split("\0"))
+    for entry in entries:
+        if len(entry) > 3:
+            dirty.add(entry[3:])
+            if entry[0] in "RC":
+                dirty.add(next(entries, ""))
+    dirty.discard("")
+    dirty_paths = frozenset(Path(git_root, path) for path in dirty)
+    return ProjectSnapshot(True, frozenset(tags), dirty_paths)
+
+
+def pipeline_stages(config: ConfigDict) -> List[str]:
+    """
+    Get the stage names declared in a config.
+
+    Args:
+        config: Project configuration dictionary.
+
+    Returns:
+        Stage names in the order they run.
+
+    Raises:
+        ValueError: If a declared stage does not exist.
+    """
+    declared = config.get("pipeline") or list(DEFAULT_STAGES)
+    if isinstance(declared, dict):
+        declared = declared.get("stages") or list(DEFAULT_STAGES)
+
+    stages = [str(name) for name in declared]
+    unknown = [name for name in stages if name not in STAGES]
+    if unknown:
+        raise ValueError(
+            f"Unknown pipeline stage(s): {', '.join(unknown)} "
+            f"(available: {', '.join(STAGES)})"
+        )
+    return stages
+
+
+def run_pipeline(
+    config_path: str = "config.yaml",
+    stages: Optional[Sequence[str]] = None,
+    root: Union[str, Path] = ".",
+    sink: Optional[OutputSink] = None,
+    enrich: bool = False,
+) -> List[StageResult]:
+    """
+    Load a project once and run pipeline stages against it.
+
+    Args:
+        config_path: Path to the configuration file.
+        stages: Stage names to run instead of those declared in the config.
+        root: Project root directory.
+        sink: Destination for generated files and integration outputs instead
+              of the project root. The changelog and tag stages always act on
+              the repository itself.
+        enrich: Fill in contributors from ORCID and the DOI before any stage
+                runs, so that generated files and integration metadata such
+                as ``.zenodo.json`` use them.
+
+    Returns:
+        One result per stage, in the order they ran.
+
+    Raises:
+        ValueError: If a stage does not exist.
+        Exception: Whatever the first failing stage raised; later stages do
+                   not run.
+    """
+    config, sources = load_config_with_sources(config_path, root)
+    if enrich:
+        from .enrich import run_enrichment
+
+        config = run_enrichment([config])[0]
+    names = pipeline_stages({"pipeline": stages} if stages else config)
+
+    context = PipelineContext(
+        config=config,
+        sources=sources,
+        env=get_environment(template_search_path(config, root)),
+        snapshot=take_snapshot(Path(root)),
+        root=Path(root),
+        sink=sink,
+    )
+
+    results = []
+    for name in names:
+        start = time.perf_counter()
+        outputs = STAGES[name](context)
+        result = StageResult(name, time.perf_counter() - start, outputs)
+        print(f"✓ {name} ({result.seconds:.2f}s)")
+        results.append(result)
+    return results
+
+
+def stage_generate(context: PipelineContext) -> List[str]:
+    """Write the README, LICENSE, citation, badges and image variants."""
+    from .assets import build_assets
+    from .badges import badge_files, write_badges
+    from .generator import render_outputs, write_output
+
+    config = context.config
+    if context.sink is not None:
+        # A sink leaves the project untouched, so image variants are not rebuilt
+        outputs = {
+            **render_outputs(config, context.root, env=context.env),
+            **badge_files(config),
+        }
+        for filename, content in outputs.items():
+            write_output(filename, content, sink=context.sink)
+        return list(outputs)
+
+    try:
+        build_assets(config, context.root)
+    except ImportError as e:
+        print(f"⚠️  Skipping image variants: {e}")
+
+    outputs = render_outputs(config, context.root, env=context.env)
+    for filename, content in outputs.items():
+        write_output(filename, content, context.root)
+    return [*outputs, *write_badges(config, context.root)]
+
+
+def stage_integrations(context: PipelineContext) -> List[str]:
+    """Set up the applicable integrations (workflows, metadata files)."""
+    from .integration import setup_all_integrations
+
+    return setup_all_integrations(context.config, context.root, sink=context.sink)
+
+
+def stage_changelog(context: PipelineContext) -> List[str]:
+    """Add the current version's changelog entry to CHANGELOG.md."""
+    from .integration.release.changelog import update_changelog
+
+    update_changelog(config=context.config, root=context.root)
+    return ["CHANGELOG.md"]
+
+
+def stage_tag(context: PipelineContext) -> List[str]:
+    """Create and push the release tag for the configured version."""
+    from .integration.release.release import create_release
+
+    version = context.config.get("version")
+    if not version:
+        raise ValueError("No 'version' field found in the config")
+
+    # Check the snapshot rather than querying git again
+    dirty = {path.resolve() for path in context.snapshot.dirty_paths}
+    config_dirty = any(path.resolve() in dirty for path in context.sources)
+    tag = create_release(
+        version,
+        tags=context.snapshot.tags,
+        config_dirty=config_dirty,
+        root=context.root,
+    )
+    return [tag] if tag else []
+
+
+STAGES: Dict[str, Callable[[PipelineContext], List[str]]] = {
+    "generate": stage_generate,
+    "integrations": stage_integrations,
+    "changelog": stage_changelog,
+    "tag": stage_tag,
+}
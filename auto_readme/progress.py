@@ -0,0 +1,152 @@
+"""
+Rate-limited progress reporting for long batch runs.
+
+Printing a line per project becomes a bottleneck (and an unreadable log) at
+thousands of projects. ``ProgressReporter`` counts results as they arrive
+from worker threads and redraws at most once per interval: a single-line
+progress bar on a terminal, or one JSON object per interval otherwise, which
+CI logs and dashboards can parse.
+"""
+
+import json
+import sys
+import threading
+import time
+from typing import IO, Any, Optional
+
+# Seconds between updates for each output style
+BAR_INTERVAL = 0.1
+JSON_INTERVAL = 5.0
+
+BAR_WIDTH = 30
+
+
+class ProgressReporter:
+    """Thread-safe, rate-limited progress output."""
+
+    def __init__(
+        self,
+        total: int,
+        stream: Optional[IO[str]] = None,
+        style: str = "auto",
+        interval: Optional[float] = None,
+        label: str = "",
+    ) -> None:
+        """
+        Initialize the reporter.
+
+        Args:
+            total: Number of items expected.
+            stream: Where to write; defaults to standard error.
+            style: ``"bar"``, ``"json"``, ``"none"``, or ``"auto"`` for a bar
+                   on a terminal and JSON lines otherwise.
+            interval: Minimum seconds between updates; defaults to
+                      ``BAR_INTERVAL`` or ``JSON_INTERVAL``.
+            label: Text shown before the bar, or the ``label`` JSON field.
+
+        Raises:
+            ValueError: If the style is not recognised.
+        """
+        self.stream = stream or sys.stderr
+        if style == "auto":
+            isatty = getattr(self.stream, "isatty", None)
+            style = "bar" if isatty is not None and isatty() else "json"
+        if style not in ("bar", "json", "none"):
+            raise ValueError(f"Unknown progress style: {style}")
+
+        self.style = style
+        self.total = total
+        self.label = label
+        if interval is None:
+            interval = BAR_INTERVAL if style == "bar" else JSON_INTERVAL
+        self.interval: float = interval
+        self.done = 0
+        self.failed = 0
+        self.skipped = 0
+        self._start = time.monotonic()
+        self._last: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def update(self, ok: bool = True, count: int = 1) -> None:
+        """
+        Count finished items, redrawing if the interval has passed.
+
+        Args:
+            ok: Whether the items succeeded.
+            count: Number of items finished.
+        """
+        with self._lock:
+            self.done += count
+            if not ok:
+                self.failed += count
+            now = time.monotonic()
+            if self._last is None or now - self._last >= self.interval:
+                self._last = now
+                self._emit(now, final=False)
+
+    def skip(self, count: int) -> None:
+        """
+        Count items that were already finished, e.g. by a resumed run.
+
+        They count towards progress but not towards the rate.
+
+        Args:
+            count: Number of items skipped.
+        """
+        with self._lock:
+            self.done += count
+            self.skipped += count
+
+    def close(self) -> None:
+        """Write the final state."""
+        with self._lock:
+            self._emit(time.monotonic(), final=True)
+
+    def __enter__(self) -> "ProgressReporter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _emit(self, now: float, final: bool) -> None:
+        """Write the current state; the caller holds the lock."""
+        if self.style == "none":
+            return
+
+        elapsed = now - self._start
+        rate = (self.done - self.skipped) / elapsed if elapsed > 0 else 0.0
+        remaining = (self.total - self.done) / rate if rate else None
+
+        if self.style == "json":
+            record = {
+                "label": self.label,
+                "done": self.done,
+                "total": self.total,
+                "failed": self.failed,
+                "elapsed": round(elapsed, 1),
+                "rate": round(rate, 2),
+                "eta": round(remaining, 1) if remaining is not None else None,
+            }
+            self.stream.write(json.dumps(record) + "\n")
+        else:
+            filled = BAR_WIDTH * self.done // self.total if self.total else BAR_WIDTH
+            bar = "█" * filled + "░" * (BAR_WIDTH - filled)
+            eta = _duration(remaining) if remaining is not None else "?"
+            prefix = f"{self.label} " if self.label else ""
+            self.stream.write(
+                f"\r{prefix}{bar} {self.done}/{self.total} "
+                f"({self.failed} failed, {rate:.1f}/s, ETA {eta})\033[K"
+            )
+            if final:
+                self.stream.write("\n")
+        self.stream.flush()
+
+
+def _duration(seconds: float) -> str:
+    """Format a duration as ``1h02m``, ``3m05s`` or ``12s``."""
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds}s"
@@ -0,0 +1,273 @@
+"""
+Destinations for generated files.
+
+Everything the generator and integrations produce goes through an
+``OutputSink``. The default writes to the filesystem; the others let a render
+feed an archive, a test or another process without intermediate files:
+
+- ``FileSystemSink``: files under a root directory (the default)
+- ``MemorySink``: a ``{path: bytes}`` dict
+- ``TarSink`` / ``ZipSink``: a streamed archive, written to a file or a pipe
+- ``JsonLinesSink``: one ``{"path": ..., "content": ...}`` object per line
+
+``open_sink`` builds a sink from a command-line spec. Sinks are safe to share
+between the threads of a batch run.
+"""
+
+import base64
+import io
+import json
+import sys
+import tarfile
+import threading
+import zipfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import IO, Any, Dict, Optional, Union
+
+Content = Union[str, bytes]
+
+# Fixed archive timestamp, so identical renders produce identical archives
+ARCHIVE_MTIME = 315532800  # 1980-01-01, the earliest date zip can store
+
+
+def _to_bytes(content: Content) -> bytes:
+    """Encode text content as UTF-8."""
+    return content.encode("utf-8") if isinstance(content, str) else content
+
+
+class OutputSink(ABC):
+    """Somewhere generated files can be written."""
+
+    @abstractmethod
+    def write(self, path: str, content: Content) -> None:
+        """
+        Write one file.
+
+        Args:
+            path: File path relative to the project root, ``/``-separated.
+            content: Text (written as UTF-8) or bytes.
+        """
+
+    def scoped(self, prefix: str) -> "OutputSink":
+        """
+        Get a view of this sink that writes under a path prefix.
+
+        Args:
+            prefix: Directory prepended to every path, e.g. a project name.
+
+        Returns:
+            Sink sharing this sink's destination.
+        """
+        return _PrefixedSink(self, prefix)
+
+    def close(self) -> None:
+        """Flush and release the destination."""
+
+    def __enter__(self) -> "OutputSink":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class FileSystemSink(OutputSink):
+    """Write files under a directory, creating parent directories as needed."""
+
+    def __init__(self, root: Union[str, Path] = ".") -> None:
+        self.root = Path(root)
+
+    def write(self, path: str, content: Content) -> None:
+        file_path = self.root / path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(content, str):
+            file_path.write_text(content, encoding="utf-8")
+        else:
+            file_path.write_bytes(content)
+
+
+class MemorySink(OutputSink):
+    """Collect files in memory."""
+
+    def __init__(self) -> None:
+        self.files: Dict[str, bytes] = {}
+
+    def write(self, path: str, content: Content) -> None:
+        self.files[Path(path).as_posix()] = _to_bytes(content)
+
+    def text(self, path: str) -> str:
+        """Get a collected file decoded as UTF-8."""
+        return self.files[path].decode("utf-8")
+
+
+class TarSink(OutputSink):
+    """Stream files into a tar archive, optionally gzip-compressed."""
+
+    def __init__(
+        self, fileobj: IO[bytes], compression: str = "gz", close_fileobj: bool = False
+    ) -> None:
+        """
+        Initialize the sink.
+
+        Args:
+            fileobj: Binary stream to write to; need not be seekable.
+            compression: ``"gz"`` or ``""`` for an uncompressed archive.
+            close_fileobj: Close the stream when the sink is closed.
+
+        Raises:
+            ValueError: If the compression is not recognised.
+        """
+        self._fileobj = fileobj if close_fileobj else None
+        self._lock = threading.Lock()
+        if compression == "gz":
+            self._tar = tarfile.open(
+                fileobj=fileobj, mode="w|gz", format=tarfile.PAX_FORMAT
+            )
+        elif not compression:
+            self._tar = tarfile.open(
+                fileobj=fileobj, mode="w|", format=tarfile.PAX_FORMAT
+            )
+        else:
+            raise ValueError(f"Unknown tar compression: {compression}")
+
+    def write(self, path: str, content: Content) -> None:
+        data = _to_bytes(content)
+        info = tarfile.TarInfo(Path(path).as_posix())
+        info.size = len(data)
+        info.mtime = ARCHIVE_MTIME
+        info.mode = 0o644
+        with self._lock:
+            self._tar.addfile(info, io.BytesIO(data))
+
+    def close(self) -> None:
+        with self._lock:
+            self._tar.close()
+            if self._fileobj:
+                self._fileobj.close()
+
+
+class ZipSink(OutputSink):
+    """Stream files into a zip archive."""
+
+    def __init__(self, fileobj: IO[bytes], close_fileobj: bool = False) -> None:
+        """
+        Initialize the sink.
+
+        Args:
+            fileobj: Binary stream to write to; need not be seekable.
+            close_fileobj: Close the stream when the sink is closed.
+        """
+        self._fileobj = fileobj if close_fileobj else None
+        self._lock = threading.Lock()
+        self._zip = zipfile.ZipFile(fileobj, mode="w")
+
+    def write(self, path: str, content: Content) -> None:
+        info = zipfile.ZipInfo(Path(path).as_posix(), date_time=(1980, 1, 1, 0, 0, 0))
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.external_attr = 0o644 << 16
+        with self._lock:
+            self._zip.writestr(info, _to_bytes(content))
+
+    def close(self) -> None:
+        with self._lock:
+            self._zip.close()
+            if self._fileobj:
+                self._fileobj.close()
+
+
+class JsonLinesSink(OutputSink):
+    """
+    Write each file as a JSON object on its own line.
+
+    Text is emitted as ``content``; bytes that are not valid UTF-8 are emitted
+    base64-encoded as ``content_base64``.
+    """
+
+    def __init__(self, stream: Optional[IO[str]] = None) -> None:
+        """
+        Initialize the sink.
+
+        Args:
+            stream: Text stream to write to. Defaults to standard output.
+        """
+        self._stream = stream
+        self._lock = threading.Lock()
+
+    def write(self, path: str, content: Content) -> None:
+        record: Dict[str, str] = {"path": Path(path).as_posix()}
+        if isinstance(content, bytes):
+            try:
+                record["content"] = content.decode("utf-8")
+            except UnicodeDecodeError:
+                record["content_base64"] = base64.b64encode(content).decode("ascii")
+        else:
+            record["content"] = content
+
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        stream = self._stream or sys.stdout
+        with self._lock:
+            stream.write(line)
+            stream.flush()
+
+
+class _PrefixedSink(OutputSink):
+    """Write into another sink under a directory prefix."""
+
+    def __init__(self, sink: OutputSink, prefix: str) -> None:
+        self._sink = sink
+        self._prefix = prefix.strip("/")
+
+    def write(self, path: str, content: Content) -> None:
+        self._sink.write(f"{self._prefix}/{Path(path).as_posix()}", content)
+
+
+def writes_to_stdout(spec: Optional[str]) -> bool:
+    """Check whether an output spec streams to standard output."""
+    if not spec:
+        return False
+    return spec == "-" or spec.endswith(":-")
+
+
+def open_sink(spec: Optional[str] = None) -> OutputSink:
+    """
+    Build a sink from a command-line output spec.
+
+    Specs:
+        ``None`` or a directory: write files under that directory.
+        ``name.tar``, ``name.tar.gz``, ``name.tgz``, ``name.zip``: an archive.
+        ``tar:-``, ``tar.gz:-``, ``zip:-``: an archive streamed to stdout.
+        ``-`` or ``jsonl:-``: JSON Lines on stdout.
+
+    Args:
+        spec: Output spec.
+
+    Returns:
+        The sink; close it (or use it as a context manager) when done.
+
+    Raises:
+        ValueError: If an archive format is not recognised.
+        OSError: If an archive file cannot be created.
+    """
+    if not spec:
+        return FileSystemSink()
+    if spec in ("-", "jsonl:-"):
+        return JsonLinesSink(sys.stdout)
+
+    kind, _, target = spec.rpartition(":") if spec.endswith(":-") else ("", "", spec)
+    if not kind:
+        for suffix in (".tar.gz", ".tgz", ".tar", ".zip"):
+            if spec.endswith(suffix):
+                kind = {".tgz": "tar.gz"}.get(suffix, suffix[1:])
+                break
+    if not kind:
+        return FileSystemSink(spec)
+
+    if kind not in ("zip", "tar", "tar.gz"):
+        raise ValueError(f"Unknown output format: {kind}")
+
+    owned = target != "-"
+    stream = open(target, "wb") if owned else sys.stdout.buffer
+    if kind == "zip":
+        return ZipSink(stream, close_fileobj=owned)
+    compression = "gz" if kind == "tar.gz" else ""
+    return TarSink(stream, compression=compression, close_fileobj=owned)
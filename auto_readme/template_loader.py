@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Template resolution with project and organisation overrides.
+
+Templates are looked up through an ordered search path:
+
+1. ``templates/`` in the project directory,
+2. an organisation template directory (``template_dir`` in the config, or the
+   ``AUTO_README_TEMPLATE_DIR`` environment variable),
+3. the templates bundled with the package.
+
+Directory listings are cached per process and revalidated by directory
+modification time, so repeated lookups (including misses in override
+directories that do not exist) cost one ``stat`` per directory instead of a
+``stat`` and ``open`` per candidate file. Environments are cached per search
+path, which also keeps compiled templates alive across a batch render.
+
+``render_template`` renders through the user-level render cache (see
+:mod:`auto_readme.cache`), keyed by the digest of the template and everything
+it extends, includes or imports. Every environment also provides the
+``{% cache key %}`` fragment tag from :mod:`auto_readme.fragments`.
+"""
+
+import hashlib
+import os
+import re
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Union
+
+from jinja2 import BaseLoader, Environment, TemplateNotFound, meta
+
+from .cache import RenderCache, render_cache
+from .fragments import FragmentCacheExtension, clear_fragment_cache
+
+ConfigDict = Dict[str, Any]
+
+PACKAGE_TEMPLATE_DIR = Path(__file__).parent / "templates"
+PROJECT_TEMPLATE_DIR = "templates"
+ORG_TEMPLATE_ENV = "AUTO_README_TEMPLATE_DIR"
+
+# Directory -> (path whose mtime validates the entry, that mtime, file names)
+_LISTING_CACHE: Dict[Path, Tuple[Path, Optional[int], FrozenSet[str]]] = {}
+
+# (search path, async rendering) -> shared Environment
+_ENVIRONMENTS: Dict[Tuple[Tuple[Path, ...], bool], Environment] = {}
+_ENVIRONMENTS_LOCK = threading.Lock()
+
+# Environment -> template name -> (digest, up-to-date checks of its sources)
+_Digest = Tuple[Optional[str], List[Callable[[], bool]]]
+_DIGESTS: "weakref.WeakKeyDictionary[Environment, Dict[str, _Digest]]" = (
+    weakref.WeakKeyDictionary()
+)
+_DIGESTS_LOCK = threading.Lock()
+
+
+def template_search_path(
+    config: Optional[ConfigDict] = None, root: Union[str, Path] = "."
+) -> List[Path]:
+    """
+    Build the ordered template search path for a project.
+
+    Args:
+        config: Project configuration; ``template_dir`` names an organisation
+                template directory, resolved relative to the project root.
+        root: Project root directory.
+
+    Returns:
+        Directories to search, highest priority first.
+    """
+    root_path = Path(root)
+    search_path = [root_path / PROJECT_TEMPLATE_DIR]
+
+    org_dir = (config or {}).get("template_dir") or os.environ.get(ORG_TEMPLATE_ENV)
+    if org_dir:
+        search_path.append(root_path / org_dir)
+
+    search_path.append(PACKAGE_TEMPLATE_DIR)
+    return search_path
+
+
+def resolve_template(name: str, search_path: List[Path]) -> Optional[Path]:
+    """
+    Find the first directory in the search path that provides a template.
+
+    Args:
+        name: Template name, optionally with ``/``-separated subdirectories.
+        search_path: Directories to search, highest priority first.
+
+    Returns:
+        Path to the template, or None if no directory provides it.
+    """
+    *subdirs, filename = name.split("/")
+    for directory in search_path:
+        if filename in _list_directory(directory.joinpath(*subdirs)):
+            return directory.joinpath(*subdirs, filename)
+    return None
+
+
+def slugify(value: str) -> str:
+    """
+    Convert a title into a lowercase, hyphen-separated slug.
+
+    Args:
+        value: Text to convert.
+
+    Returns:
+        Slug containing only lowercase letters, digits and hyphens.
+    """
+    return re.sub(r"[^a-z0-9]+", "-", str(value).lower()).strip("-")
+
+
+def clear_template_cache() -> None:
+    """Forget cached directory listings, environments and fragments."""
+    _LISTING_CACHE.clear()
+    clear_fragment_cache()
+    with _ENVIRONMENTS_LOCK:
+        _ENVIRONMENTS.clear()
+    with _DIGESTS_LOCK:
+        _DIGESTS.clear()
+
+
+def get_environment(search_path: List[Path], enable_async: bool = False) -> Environment:
+    """
+    Get the shared Jinja environment for a search path.
+
+    Args:
+        search_path: Directories to search, highest priority first.
+        enable_async: Get an environment whose templates render with
+                      ``render_async``.
+
+    Returns:
+        Environment whose loader resolves templates through the search path.
+    """
+    key = (tuple(search_path), enable_async)
+    env = _ENVIRONMENTS.get(key)
+    if env is None:
+        with _ENVIRONMENTS_LOCK:
+            env = _ENVIRONMENTS.get(key)
+            if env is None:
+                env = Environment(
+                    loader=SearchPathLoader(search_path),
+                    extensions=[FragmentCacheExtension],
+                    enable_async=enable_async,
+                )
+                env.filters["slugify"] = slugify
+                _ENVIRONMENTS[key] = env
+    return env
+
+
+def template_digest(env: Environment, name: str) -> Optional[str]:
+    """
+    Hash a template's source together with the templates it references.
+
+    Templates named literally in ``extends``, ``include``, ``import`` and
+    ``from`` tags are followed, so changing a base template changes the
+    digest of every template built on it. Digests are cached per environment
+    until one of the sources changes.
+
+    Args:
+        env: Environment the template is loaded from.
+        name: Template name.
+
+    Returns:
+        Hex digest of the template sources, or None if any of them names a
+        template with an expression (``{% include var %}``), since the
+        templates it depends on are then not known before rendering.
+
+    Raises:
+        jinja2.TemplateNotFound: If the template cannot be found.
+        TypeError: If the environment has no loader.
+    """
+    loader = env.loader
+    if loader is None:
+        raise TypeError("no loader for this environment specified")
+
+    with _DIGESTS_LOCK:
+        cached = _DIGESTS.setdefault(env, {}).get(name)
+    if cached is not None and all(check() for check in cached[1]):
+        return cached[0]
+
+    digest = hashlib.sha256()
+    checks: List[Callable[[], bool]] = []
+    dynamic = False
+    pending, seen = [name], set()
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        source, filename, uptodate = loader.get_source(env, current)
+        digest.update(f"{current}\0{len(source)}\0".encode("utf-8"))
+        digest.update(source.encode("utf-8"))
+        if uptodate is not None:
+            checks.append(uptodate)
+        ast = env.parse(source, current, filename)
+        referenced = list(meta.find_referenced_templates(ast))
+        dynamic = dynamic or None in referenced
+        pending.extend(sorted(ref for ref in referenced if ref is not None))
+
+    result = None if dynamic else digest.hexdigest()
+    with _DIGESTS_LOCK:
+        _DIGESTS.setdefault(env, {})[name] = (result, checks)
+    return result
+
+
+def render_template(
+    env: Environment,
+    name: str,
+    context: Dict[str, Any],
+    cache: Optional[RenderCache] = None,
+) -> str:
+    """
+    Render a template, reusing an identical earlier render when cached.
+
+    Templates that include other templates by expression are always
+    rendered, since their digest does not cover what they include.
+
+    Args:
+        env: Environment to load the template from.
+        name: Template name.
+        context: Template variables; they form part of the cache key, so pass
+                 only what the template uses.
+        cache: Render cache to use; defaults to the user-level cache (None
+               when it is disabled).
+
+    Returns:
+        Rendered text.
+
+    Raises:
+        jinja2.TemplateNotFound: If the template cannot be found.
+    """
+    cache = cache or render_cache()
+    if cache is None:
+        return env.get_template(name).render(**context)
+
+    digest = template_digest(env, name)
+    if digest is None:
+        return env.get_template(name).render(**context)
+
+    key = cache.key(name, digest, context)
+    return cache.get_or_render(key, lambda: env.get_template(name).render(**context))
+
+
+class SearchPathLoader(BaseLoader):
+    """
+    Jinja loader that resolves templates through cached directory listings.
+
+    Unlike ``FileSystemLoader`` it never falls back silently: a template that
+    exists but fails to compile raises its real error, and a template that
+    exists nowhere on the search path raises ``TemplateNotFound`` listing the
+    directories that were searched.
+    """
+
+    def __init__(self, search_path: List[Path]) -> None:
+        """
+        Initialize the loader.
+
+        Args:
+            search_path: Directories to search, highest priority first.
+        """
+        self.search_path = list(search_path)
+
+    def get_source(
+        self, environment: Environment, template: str
+    ) -> Tuple[str, str, Callable[[], bool]]:
+        """
+        Load template source from the first matching directory.
+
+        Args:
+            environment: Environment requesting the template.
+            template: Template name.
+
+        Returns:
+            Tuple of source, filename and an up-to-date check.
+
+        Raises:
+            TemplateNotFound: If no directory on the search path has the template.
+        """
+        path = resolve_template(template, self.search_path)
+        if path is None:
+            searched = ", ".join(str(d) for d in self.search_path)
+            raise TemplateNotFound(f"{template} (searched: {searched})")
+
+        source = path.read_text(encoding="utf-8")
+        mtime = path.stat().st_mtime_ns
+
+        def uptodate() -> bool:
+            if resolve_template(template, self.search_path) != path:
+                return False
+            try:
+                return path.stat().st_mtime_ns == mtime
+            except OSError:
+                return False
+
+        return source, str(path), uptodate
+
+
+def _list_directory(directory: Path) -> FrozenSet[str]:
+    """
+    List the files in a directory, cached until its mtime changes.
+
+    A missing directory is cached as empty and revalidated against the mtime
+    of its parent (which changes when the directory is created), so repeated
+    misses never stat the missing location itself again.
+
+    Args:
+        directory: Directory to list.
+
+    Returns:
+        Names of the regular files in the directory.
+    """
+    cached = _LISTING_CACHE.get(directory)
+    if cached is not None:
+        probe, mtime, entries = cached
+        if _mtime(probe) == mtime:
+            return entries
+
+    mtime = _mtime(directory)
+    if mtime is not None:
+        entries = frozenset(e.name for e in os.scandir(directory) if e.is_file())
+        _LISTING_CACHE[directory] = (directory, mtime, entries)
+    else:
+        entries = frozenset()
+        _LISTING_CACHE[directory] = (
+            directory.parent,
+            _mtime(directory.parent),
+            entries,
+        )
+    return entries
+
+
+def _mtime(path: Path) -> Optional[int]:
+    """Return the modification time of a path in nanoseconds, or None."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
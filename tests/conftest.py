@@ -0,0 +1,13 @@
+"""
+Shared test configuration.
+"""
+
+import pytest
+
+from auto_readme.cache import RENDER_CACHE_ENV
+
+
+@pytest.fixture(autouse=True)
+def _no_render_cache(monkeypatch):
+    """Render from templates unless a test opts into the render cache."""
+    monkeypatch.setenv(RENDER_CACHE_ENV, "0")
@@ -0,0 +1,65 @@
+"""
+Local keep-alive HTTP server for testing network clients.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubServer:
+    """Keep-alive HTTP server that serves fixed routes and records requests."""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.requests = []
+        self.connections = set()
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.thread = threading.Thread(
+            target=self.server.serve_forever,
+            kwargs={"poll_interval": 0.01},
+            daemon=True,
+        )
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                self._respond(include_body=True)
+
+            def do_HEAD(self):
+                self._respond(include_body=False)
+
+            def _respond(self, include_body):
+                with stub.lock:
+                    stub.requests.append((self.command, self.path, dict(self.headers)))
+                    stub.connections.add(self.client_address)
+                status, headers, body = stub.routes.get(self.path, (404, {}, b""))
+                if status == 200 and "ETag" in headers:
+                    if self.headers.get("If-None-Match") == headers["ETag"]:
+                        status, body = 304, b""
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                if status != 304:
+                    self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if include_body and status != 304:
+                    self.wfile.write(body)
+
+        return Handler
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
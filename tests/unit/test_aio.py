@@ -0,0 +1,63 @@
+"""
+Tests for the asyncio API.
+"""
+
+import asyncio
+
+import pytest
+import yaml
+
+from auto_readme import aio
+from auto_readme.badges import badge_files
+from auto_readme.generator import render_outputs
+from auto_readme.sinks import MemorySink
+from tests.fixtures.configs import DATASET_CONFIG
+
+
+@pytest.fixture
+def projects(tmp_path):
+    roots = []
+    for index in range(4):
+        root = tmp_path / f"project-{index}"
+        (root / "config").mkdir(parents=True)
+        config = {**DATASET_CONFIG, "title": f"Project {index}"}
+        (root / "config" / "config.yaml").write_text(yaml.safe_dump(config))
+        roots.append(root)
+    return roots
+
+
+class TestAsyncRendering:
+    def test_render_all_matches_sync_render(self, tmp_path):
+        outputs = asyncio.run(aio.render_all(DATASET_CONFIG, tmp_path))
+
+        assert outputs == render_outputs(DATASET_CONFIG, tmp_path)
+
+    def test_render_projects_writes_without_printing(self, projects, capsys):
+        results = asyncio.run(
+            aio.render_projects(projects, concurrency=2, write=True, integrations=True)
+        )
+
+        assert [result.root for result in results] == projects
+        assert all(result.ok for result in results)
+        badges = list(badge_files({**DATASET_CONFIG, "title": "Project 1"}))
+        assert badges
+        assert results[1].written == ["README.md", "LICENSE", "citation.bib", *badges]
+        assert all((projects[1] / path).exists() for path in badges)
+        assert "Project 1" in (projects[1] / "README.md").read_text()
+        assert [i.name for i in results[0].integrations] == ["Zenodo"]
+        assert (projects[0] / ".zenodo.json").exists()
+        assert capsys.readouterr().out == ""
+
+    def test_failures_are_reported_per_project(self, projects, tmp_path):
+        sink = MemorySink()
+
+        results = asyncio.run(
+            aio.render_projects([tmp_path / "missing", projects[0]], sink=sink)
+        )
+
+        assert not results[0].ok
+        assert "Could not find config" in results[0].error
+        assert results[1].ok
+        assert "project-0/README.md" in sink.files
+        assert any(path.endswith(".svg") for path in sink.files)
+        assert not (projects[0] / "README.md").exists()
@@ -0,0 +1,98 @@
+"""
+Tests for the logo and banner image pipeline.
+"""
+
+import pytest
+
+from auto_readme.assets import ASSET_DIR, build_assets, readme_assets
+from auto_readme.generator import generate_readme
+from tests.fixtures.configs import DATASET_CONFIG
+
+Image = pytest.importorskip("PIL.Image")
+
+CONFIG = {
+    **DATASET_CONFIG,
+    "logo_path": "config/assets/logo.png",
+    "banner_path": "config/assets/banner.jpg",
+}
+
+
+def _write_images(root, logo_color="red"):
+    assets = root / "config" / "assets"
+    assets.mkdir(parents=True, exist_ok=True)
+    Image.new("RGBA", (600, 600), logo_color).save(assets / "logo.png")
+    Image.new("RGB", (3000, 1000), "blue").save(assets / "banner.jpg")
+
+
+def _sizes(manifest, key):
+    return [(v["width"], v["height"]) for v in manifest[key]["variants"]]
+
+
+class TestBuildAssets:
+    def test_variants_match_displayed_sizes(self, tmp_path):
+        _write_images(tmp_path)
+
+        manifest = build_assets(CONFIG, tmp_path)
+
+        assert _sizes(manifest, "logo") == [(150, 150), (300, 300)]
+        assert _sizes(manifest, "banner") == [(400, 133), (800, 267), (1600, 533)]
+        for entry in manifest.values():
+            for variant in entry["variants"]:
+                with Image.open(tmp_path / variant["path"]) as image:
+                    assert image.size == (variant["width"], variant["height"])
+
+    def test_small_sources_are_not_upscaled(self, tmp_path):
+        assets = tmp_path / "config" / "assets"
+        assets.mkdir(parents=True)
+        Image.new("RGB", (200, 100), "green").save(assets / "logo.png")
+
+        manifest = build_assets({"logo_path": "config/assets/logo.png"}, tmp_path)
+
+        assert _sizes(manifest, "logo") == [(200, 100)]
+
+    def test_unchanged_sources_are_not_reprocessed(self, tmp_path):
+        _write_images(tmp_path)
+        manifest = build_assets(CONFIG, tmp_path)
+        outputs = sorted((tmp_path / ASSET_DIR).iterdir())
+        mtimes = [path.stat().st_mtime_ns for path in outputs]
+
+        assert build_assets(CONFIG, tmp_path) == manifest
+        assert sorted((tmp_path / ASSET_DIR).iterdir()) == outputs
+        assert [path.stat().st_mtime_ns for path in outputs] == mtimes
+
+    def test_changed_source_replaces_its_variants(self, tmp_path):
+        _write_images(tmp_path)
+        before = build_assets(CONFIG, tmp_path)
+
+        _write_images(tmp_path, logo_color="green")
+        after = build_assets(CONFIG, tmp_path)
+
+        assert after["banner"] == before["banner"]
+        assert after["logo"]["sha256"] != before["logo"]["sha256"]
+        for variant in before["logo"]["variants"]:
+            assert not (tmp_path / variant["path"]).exists()
+
+
+class TestReadmeAssets:
+    def test_readme_uses_srcset_for_processed_images(self, tmp_path):
+        _write_images(tmp_path)
+        build_assets(CONFIG, tmp_path)
+
+        readme = generate_readme(CONFIG, tmp_path)
+        assets = readme_assets(CONFIG, tmp_path)
+
+        assert f'src="{assets["logo"]["src"]}"' in readme
+        assert "150w.png 1x" in assets["logo"]["srcset"]
+        assert "300w.png 2x" in assets["logo"]["srcset"]
+        assert assets["banner"]["src"].endswith("-800w.jpg")
+        assert f'srcset="{assets["banner"]["srcset"]}"' in readme
+
+    def test_stale_or_missing_variants_fall_back_to_source(self, tmp_path):
+        _write_images(tmp_path)
+        assert readme_assets(CONFIG, tmp_path) == {}
+
+        build_assets(CONFIG, tmp_path)
+        _write_images(tmp_path, logo_color="green")
+
+        assert set(readme_assets(CONFIG, tmp_path)) == {"banner"}
+        assert f'src="{CONFIG["logo_path"]}"' in generate_readme(CONFIG, tmp_path)
@@ -0,0 +1,61 @@
+"""
+Tests for local SVG badge rendering.
+"""
+
+import xml.etree.ElementTree as ET
+
+from auto_readme.badges import (
+    BADGE_DIR,
+    Badge,
+    badge_files,
+    render_badge,
+    text_width,
+    write_badges,
+)
+from auto_readme.generator import generate_readme
+from tests.fixtures.configs import DATASET_CONFIG
+
+
+class TestRenderBadge:
+    def test_width_follows_text_width(self):
+        assert text_width("iii") < text_width("MMM")
+        short = ET.fromstring(render_badge("release", "1.0"))
+        long = ET.fromstring(render_badge("release", "1.0.0-beta.12"))
+        assert int(short.get("width")) < int(long.get("width"))
+
+    def test_text_is_escaped(self):
+        svg = render_badge("a&b", '<"x">')
+
+        root = ET.fromstring(svg)
+        assert root.get("aria-label") == 'a&b: <"x">'
+
+    def test_path_is_content_addressed(self):
+        assert Badge("DOI", "10.1/a").path == Badge("DOI", "10.1/a").path
+        assert Badge("DOI", "10.1/a").path != Badge("DOI", "10.1/b").path
+        assert Badge("DOI", "10.1/a").path.startswith(f"{BADGE_DIR}/")
+
+
+class TestWriteBadges:
+    def test_unchanged_badges_are_not_rewritten(self, tmp_path):
+        written = write_badges(DATASET_CONFIG, tmp_path)
+        assert sorted(written) == sorted(badge_files(DATASET_CONFIG))
+        mtimes = {p: (tmp_path / p).stat().st_mtime_ns for p in written}
+
+        assert write_badges(DATASET_CONFIG, tmp_path) == []
+        assert {p: (tmp_path / p).stat().st_mtime_ns for p in written} == mtimes
+
+    def test_stale_badges_are_removed(self, tmp_path):
+        old = write_badges(DATASET_CONFIG, tmp_path)
+
+        changed = write_badges({**DATASET_CONFIG, "version": "9.9.9"}, tmp_path)
+
+        removed = [p for p in changed if p in old]
+        assert len(removed) == 1
+        assert not (tmp_path / removed[0]).exists()
+
+    def test_readme_references_local_badges(self):
+        readme = generate_readme(DATASET_CONFIG)
+
+        assert "img.shields.io" not in readme
+        for path in badge_files(DATASET_CONFIG):
+            assert f"({path})" in readme
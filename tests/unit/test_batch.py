@@ -0,0 +1,169 @@
+"""
+Tests for processing many projects concurrently without changing directory.
+"""
+
+import json
+import os
+import sys
+
+import pytest
+import yaml
+
+from auto_readme.batch import (
+    BatchJournal,
+    merge_manifests,
+    parse_shard,
+    run_batch,
+    select_shard,
+    shard_of,
+    sink_prefixes,
+    write_manifest,
+)
+from auto_readme.cli import main
+from tests.fixtures.configs import DATASET_CONFIG
+
+
+@pytest.fixture
+def projects(tmp_path):
+    roots = []
+    for index in range(8):
+        root = tmp_path / f"project-{index}"
+        (root / "config").mkdir(parents=True)
+        config = {**DATASET_CONFIG, "title": f"Project {index}"}
+        (root / "config" / "config.yaml").write_text(yaml.safe_dump(config))
+        roots.append(root)
+    return roots
+
+
+class TestBatch:
+    def test_generate_writes_into_each_root(self, projects, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        cwd = os.getcwd()
+
+        results = run_batch(projects, "generate", jobs=4)
+
+        assert [result.root for result in results] == projects
+        assert all(result.ok for result in results)
+        assert os.getcwd() == cwd
+        assert not (tmp_path / "README.md").exists()
+        for index, root in enumerate(projects):
+            assert f"Project {index}" in (root / "README.md").read_text()
+            assert (root / "citation.bib").exists()
+
+    def test_check_reports_stale_projects(self, projects):
+        run_batch(projects, "generate", jobs=4)
+        (projects[2] / "LICENSE").write_text("changed")
+
+        results = run_batch(projects, "check", jobs=4)
+
+        assert [result.ok for result in results].count(False) == 1
+        assert results[2].outputs == ["LICENSE"]
+
+    def test_integrations_write_relative_to_root(self, projects):
+        results = run_batch(projects, "integrations", jobs=4)
+
+        assert all(result.outputs == ["Zenodo"] for result in results)
+        for root in projects:
+            assert (root / ".zenodo.json").exists()
+
+    def test_failures_are_isolated(self, projects, tmp_path):
+        missing = tmp_path / "missing"
+
+        results = run_batch([missing, projects[0]], "generate")
+
+        assert not results[0].ok
+        assert "Could not find config" in results[0].error
+        assert results[1].ok
+
+    def test_unknown_action_is_rejected(self, projects):
+        with pytest.raises(ValueError, match="publish"):
+            run_batch(projects, "publish")
+
+    def test_streamed_output_is_not_mixed_with_messages(
+        self, projects, tmp_path, monkeypatch, capsys
+    ):
+        argv = ["auto-research-readme", "batch", "generate", *map(str, projects)]
+        argv += ["--output", "-", "--shard", "1/2", "--progress", "none"]
+        monkeypatch.setattr(sys, "argv", argv)
+        monkeypatch.chdir(tmp_path)
+
+        main()
+
+        out, err = capsys.readouterr()
+        records = [json.loads(line) for line in out.splitlines()]
+        assert records and all("path" in record for record in records)
+        assert "Shard 1/2" in err and "Wrote results" in err and "🎉" in err
+
+    def test_sink_prefixes_keep_same_named_projects_apart(self, tmp_path):
+        roots = [tmp_path / "a" / "docs", tmp_path / "b" / "docs"]
+
+        assert sink_prefixes(roots) == ["a/docs", "b/docs"]
+        assert sink_prefixes(roots[:1], base=tmp_path) == ["a/docs"]
+        with pytest.raises(ValueError, match="same output directory"):
+            sink_prefixes([roots[0], str(roots[0]) + "/"])
+
+
+class TestShards:
+    def test_shards_partition_projects(self):
+        roots = [f"projects/p{index}" for index in range(200)]
+
+        shards = [select_shard(roots, index, 8) for index in range(1, 9)]
+
+        assert sorted(root for shard in shards for root in shard) == sorted(roots)
+        assert all(shards)
+        assert shard_of("projects/p7", 8) == shard_of("./projects/p7/", 8)
+
+    def test_parse_shard(self):
+        assert parse_shard("3/8") == (3, 8)
+        for spec in ("0/8", "9/8", "3", "a/b"):
+            with pytest.raises(ValueError, match="Invalid shard"):
+                parse_shard(spec)
+
+    def test_merge_shard_manifests(self, projects, tmp_path):
+        (projects[0] / "config" / "config.yaml").unlink()
+        manifests = []
+        for index in (1, 2):
+            roots = select_shard(projects, index, 2)
+            manifest = tmp_path / f"shard-{index}.json"
+            results = run_batch(roots, "generate")
+            write_manifest(manifest, "generate", results, (index, 2))
+            manifests.append(manifest)
+
+        report = merge_manifests(manifests)
+
+        roots = [project["root"] for project in report["projects"]]
+        assert roots == [root.as_posix() for root in projects]
+        assert report["failed"] == 1 and report["missing_shards"] == []
+        assert merge_manifests(manifests[:1])["missing_shards"] == [2]
+        with pytest.raises(ValueError, match="twice"):
+            merge_manifests([manifests[0], manifests[0]])
+
+
+class TestJournal:
+    def test_resume_skips_finished_projects(self, projects, tmp_path):
+        journal_file = tmp_path / "batch.jsonl"
+        with BatchJournal(journal_file, "generate") as journal:
+            run_batch(projects[:3], "generate", on_result=journal.record)
+        with open(journal_file, "a") as f:
+            f.write('{"root": "torn')  # Killed mid-write
+
+        (projects[1] / "README.md").write_text("edited")
+        with BatchJournal(journal_file, "generate", resume=True) as journal:
+            done = journal.completed(projects)
+            check = BatchJournal(journal_file, "check", resume=True)
+            assert check.completed(projects) == []
+            check.close()
+
+        assert [result.root for result in done] == [projects[0], projects[2]]
+        assert all(result.ok and result.outputs for result in done)
+
+    def test_failures_are_not_finished(self, projects, tmp_path):
+        (projects[0] / "config" / "config.yaml").unlink()
+        journal_file = tmp_path / "batch.jsonl"
+        with BatchJournal(journal_file, "generate") as journal:
+            run_batch(projects[:2], "generate", on_result=journal.record)
+
+        with BatchJournal(journal_file, "generate", resume=True) as journal:
+            assert [r.root for r in journal.completed(projects)] == [projects[1]]
+        with BatchJournal(journal_file, "generate") as journal:
+            assert journal.completed(projects) == []
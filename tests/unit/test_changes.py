@@ -0,0 +1,94 @@
+"""
+Tests for selecting projects affected by changes since a git ref.
+"""
+
+import subprocess
+
+import pytest
+import yaml
+
+from auto_readme.changes import affected_projects, changed_paths
+from tests.fixtures.configs import DATASET_CONFIG
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def monorepo(tmp_path, monkeypatch):
+    (tmp_path / "shared").mkdir()
+    (tmp_path / "shared" / "base.yaml").write_text("maintainer: team@example.com\n")
+    (tmp_path / "org-templates").mkdir()
+    (tmp_path / "org-templates" / "readme.md.j2").write_text("{{ title }}\n")
+
+    roots = []
+    for name in ("alpha", "beta", "gamma"):
+        root = tmp_path / "projects" / name
+        (root / "config").mkdir(parents=True)
+        config = {**DATASET_CONFIG, "title": name}
+        if name != "gamma":
+            config["extends"] = "../../../shared/base.yaml"
+            config["template_dir"] = "../../org-templates"
+        (root / "config" / "config.yaml").write_text(yaml.safe_dump(config))
+        roots.append(root)
+
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+    monkeypatch.chdir(tmp_path)
+    return tmp_path, roots
+
+
+class TestChanges:
+    def test_project_change_selects_only_that_project(self, monorepo):
+        repo, roots = monorepo
+        config_file = roots[1] / "config" / "config.yaml"
+        config_file.write_text(config_file.read_text() + "tagline: new\n")
+
+        assert affected_projects(roots, "HEAD") == [roots[1]]
+
+    def test_shared_inputs_fan_out_to_dependents(self, monorepo):
+        repo, roots = monorepo
+        (repo / "shared" / "base.yaml").write_text("maintainer: new@example.com\n")
+        assert affected_projects(roots, "HEAD") == roots[:2]
+
+        _git(repo, "commit", "-q", "-am", "base")
+        (repo / "org-templates" / "readme.md.j2").write_text("{{ tagline }}\n")
+        assert affected_projects(roots, "HEAD~1") == roots[:2]
+
+    def test_unrelated_and_asset_changes(self, monorepo):
+        repo, roots = monorepo
+        (repo / "NOTES.md").write_text("notes\n")
+        _git(repo, "add", "NOTES.md")
+        assert affected_projects(roots, "HEAD") == []
+
+        (roots[2] / "config" / "assets").mkdir()
+        (roots[2] / "config" / "assets" / "logo.png").write_bytes(b"png")
+        _git(repo, "add", "-A")
+        assert affected_projects(roots, "HEAD") == [roots[2]]
+        assert changed_paths("HEAD") == {
+            repo.resolve() / "NOTES.md",
+            roots[2].resolve() / "config" / "assets" / "logo.png",
+        }
+
+    def test_moved_files_select_both_projects(self, monorepo):
+        repo, roots = monorepo
+        (roots[0] / "config" / "assets").mkdir()
+        (roots[0] / "config" / "assets" / "logo.png").write_bytes(b"png")
+        _git(repo, "add", "-A")
+        _git(repo, "commit", "-q", "-m", "logo")
+
+        _git(repo, "mv", "projects/alpha/config/assets", "projects/gamma/config/assets")
+
+        assert affected_projects(roots, "HEAD") == [roots[0], roots[2]]
+
+    def test_unknown_ref_is_an_error(self, monorepo):
+        _, roots = monorepo
+        with pytest.raises(RuntimeError, match="no-such-ref"):
+            affected_projects(roots, "no-such-ref")
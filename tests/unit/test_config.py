@@ -0,0 +1,219 @@
+"""
+Tests for layered configuration loading.
+"""
+
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from auto_readme import config as config_module
+from auto_readme.config import (
+    clear_config_cache,
+    deep_merge,
+    dump_config,
+    load_config,
+    load_config_with_sources,
+)
+
+ORG_BASE = """
+maintainer: "data@org.example"
+links:
+  website: "https://org.example"
+  github: "https://github.com/org"
+tags:
+  - "org"
+"""
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    """Isolate memoized configs between tests."""
+    clear_config_cache()
+    yield
+    clear_config_cache()
+
+
+class TestDeepMerge:
+    """Test deep-merge semantics."""
+
+    def test_nested_mappings_merge_and_lists_replace(self):
+        """Test that dicts merge recursively while lists are replaced."""
+        base = {"links": {"a": 1, "b": 2}, "tags": ["x"], "title": "Base"}
+        override = {"links": {"b": 3}, "tags": ["y"]}
+
+        merged = deep_merge(base, override)
+
+        assert merged == {"links": {"a": 1, "b": 3}, "tags": ["y"], "title": "Base"}
+        assert base["links"] == {"a": 1, "b": 2}
+
+
+class TestConfigInheritance:
+    """Test extends/include resolution."""
+
+    def test_extends_merges_base_under_project(self, tmp_path):
+        """Test that project keys override inherited base keys."""
+        (tmp_path / "org.yaml").write_text(ORG_BASE)
+        project = tmp_path / "project.yaml"
+        project.write_text(
+            'extends: org.yaml\ntitle: "Project"\nlinks:\n  github: "https://x"\n'
+        )
+
+        config = load_config(str(project))
+
+        assert config["title"] == "Project"
+        assert config["maintainer"] == "data@org.example"
+        assert config["links"] == {
+            "website": "https://org.example",
+            "github": "https://x",
+        }
+        assert "extends" not in config
+
+    def test_include_list_is_applied_in_order(self, tmp_path):
+        """Test that later includes override earlier ones."""
+        (tmp_path / "a.yaml").write_text("license: MIT\nversion: '1'\n")
+        (tmp_path / "b.yaml").write_text("version: '2'\n")
+        project = tmp_path / "project.yaml"
+        project.write_text("include: [a.yaml, b.yaml]\ntitle: P\n")
+
+        config, sources = load_config_with_sources(str(project))
+
+        assert config["version"] == "2"
+        assert config["license"] == "MIT"
+        assert [p.name for p in sources] == ["project.yaml", "a.yaml", "b.yaml"]
+
+    def test_shared_base_is_parsed_once(self, tmp_path):
+        """Test that a base shared by many projects is parsed a single time."""
+        (tmp_path / "org.yaml").write_text(ORG_BASE)
+        projects = []
+        for i in range(5):
+            project = tmp_path / f"p{i}.yaml"
+            project.write_text(f"extends: org.yaml\ntitle: P{i}\n")
+            projects.append(project)
+
+        with patch("yaml.safe_load", wraps=yaml.safe_load) as mock_load:
+            configs = [load_config(str(p)) for p in projects]
+
+        assert [c["title"] for c in configs] == [f"P{i}" for i in range(5)]
+        assert mock_load.call_count == 6
+
+    def test_parse_cache_is_bounded(self, tmp_path, monkeypatch):
+        """Test that only the most recently used parsed files are kept."""
+        monkeypatch.setattr(config_module, "PARSE_CACHE_SIZE", 3)
+        (tmp_path / "org.yaml").write_text(ORG_BASE)
+        for i in range(10):
+            project = tmp_path / f"p{i}.yaml"
+            project.write_text(f"extends: org.yaml\ntitle: P{i}\n")
+            load_config(str(project))
+
+        assert len(config_module._PARSE_CACHE) == 3
+
+    def test_returned_configs_are_independent(self, tmp_path):
+        """Test that mutating a loaded config does not affect the cache."""
+        (tmp_path / "org.yaml").write_text(ORG_BASE)
+        project = tmp_path / "project.yaml"
+        project.write_text("extends: org.yaml\n")
+
+        load_config(str(project))["tags"].append("mutated")
+
+        assert load_config(str(project))["tags"] == ["org"]
+
+    def test_circular_inheritance_raises(self, tmp_path):
+        """Test that inheritance cycles are reported."""
+        (tmp_path / "a.yaml").write_text("extends: b.yaml\n")
+        (tmp_path / "b.yaml").write_text("extends: a.yaml\n")
+
+        with pytest.raises(ValueError, match="Circular"):
+            load_config(str(tmp_path / "a.yaml"))
+
+    def test_missing_base_raises(self, tmp_path):
+        """Test that a missing base config is reported."""
+        project = tmp_path / "project.yaml"
+        project.write_text("extends: missing.yaml\n")
+
+        with pytest.raises(FileNotFoundError):
+            load_config(str(project))
+
+    def test_dump_config_round_trips(self):
+        """Test that the debugging dump is valid YAML."""
+        config = {"title": "Ünïcode", "tags": ["a"]}
+        assert yaml.safe_load(dump_config(config)) == config
+
+
+PYPROJECT = """
+[project]
+name = "fast-pkg"
+version = "0.3.0"
+description = "A fast package"
+keywords = ["speed"]
+authors = [{name = "Ada Lovelace", email = "ada@example.com"}]
+
+[project.urls]
+Repository = "https://github.com/org/fast-pkg"
+
+[tool.auto-research-readme]
+tagline = "Fast by default"
+published = "2025-02-01"
+"""
+
+
+class TestConfigFormats:
+    """Test JSON, TOML and pyproject.toml config sources."""
+
+    def test_json_config(self, tmp_path):
+        """Test loading a standalone JSON config."""
+        path = tmp_path / "config.json"
+        path.write_text('{"title": "JSON Project", "tags": ["a"]}')
+
+        assert load_config(str(path)) == {"title": "JSON Project", "tags": ["a"]}
+
+    def test_toml_config_extends_yaml_base(self, tmp_path):
+        """Test that TOML configs go through the same inheritance loader."""
+        (tmp_path / "org.yaml").write_text(ORG_BASE)
+        path = tmp_path / "config.toml"
+        path.write_text('extends = "org.yaml"\ntitle = "TOML Project"\n')
+
+        config = load_config(str(path))
+
+        assert config["title"] == "TOML Project"
+        assert config["maintainer"] == "data@org.example"
+
+    def test_pyproject_merges_project_metadata_and_tool_table(self, tmp_path):
+        """Test that [project] metadata fills fields the tool table omits."""
+        path = tmp_path / "pyproject.toml"
+        path.write_text(PYPROJECT)
+
+        config = load_config(str(path))
+
+        assert config["type"] == "python-package"
+        assert config["title"] == "fast-pkg"
+        assert config["version"] == "0.3.0"
+        assert config["tagline"] == "Fast by default"
+        assert config["tags"] == ["speed"]
+        assert config["contributors"] == [
+            {"name": "Ada Lovelace", "email": "ada@example.com"}
+        ]
+        assert config["maintainer"] == "ada@example.com"
+        assert config["github_link"] == "https://github.com/org/fast-pkg"
+
+    def test_default_search_finds_pyproject_with_tool_table(
+        self, tmp_path, monkeypatch
+    ):
+        """Test that pyproject.toml is found only when it configures the tool."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "x"\n')
+
+        with pytest.raises(FileNotFoundError):
+            load_config()
+
+        (tmp_path / "pyproject.toml").write_text(PYPROJECT)
+        assert load_config()["title"] == "fast-pkg"
+
+    def test_json_and_toml_do_not_parse_yaml(self, tmp_path):
+        """Test that non-YAML configs never touch the YAML parser."""
+        path = tmp_path / "config.json"
+        path.write_text('{"title": "JSON Project"}')
+
+        with patch("yaml.safe_load") as mock_load:
+            load_config(str(path))
+            mock_load.assert_not_called()
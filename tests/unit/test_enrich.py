@@ -0,0 +1,202 @@
+"""
+Tests for ORCID and DOI enrichment, run against a local stub server.
+"""
+
+import asyncio
+import functools
+import json
+import sys
+
+import pytest
+
+from auto_readme import enrich
+from auto_readme.cache import CACHE_DIR_ENV
+from auto_readme.cli import main
+from auto_readme.enrich import (
+    IdentifierCache,
+    MetadataResolver,
+    enrich_configs,
+    normalize_name,
+)
+from auto_readme.net import AsyncHTTPClient
+from tests.fixtures.stub_http import StubServer
+
+ORCID_A = "0000-0002-1825-0097"
+ORCID_B = "0000-0002-1694-233X"
+
+ORCID_RECORD = {
+    "person": {
+        "name": {
+            "given-names": {"value": "Josiah"},
+            "family-name": {"value": "Carberry"},
+            "credit-name": None,
+        }
+    },
+    "activities-summary": {
+        "employments": {
+            "affiliation-group": [
+                {
+                    "summaries": [
+                        {
+                            "employment-summary": {
+                                "organization": {"name": "Brown University"},
+                                "end-date": None,
+                            }
+                        }
+                    ]
+                }
+            ]
+        }
+    },
+}
+
+CSL_RECORD = {
+    "title": "A dataset",
+    "author": [
+        {
+            "given": "Ada",
+            "family": "Lovelace",
+            "ORCID": f"http://orcid.org/{ORCID_B}",
+            "affiliation": [{"name": "Analytical Society"}],
+        }
+    ],
+}
+
+
+def _json(data):
+    return (200, {"Content-Type": "application/json"}, json.dumps(data).encode())
+
+
+@pytest.fixture
+def server():
+    routes = {
+        f"/orcid/{ORCID_A}/record": _json(ORCID_RECORD),
+        f"/orcid/{ORCID_B}/record": _json({"person": {"name": None}}),
+        "/doi/10.5281/zenodo.1": _json(CSL_RECORD),
+    }
+    with StubServer(routes) as stub:
+        yield stub
+
+
+def _enrich(server, configs, cache):
+    async def main():
+        async with AsyncHTTPClient() as client:
+            resolver = MetadataResolver(
+                client,
+                cache,
+                orcid_api=f"{server.url}/orcid/",
+                doi_resolver=f"{server.url}/doi/",
+            )
+            return await enrich_configs(configs, resolver)
+
+    return asyncio.run(main())
+
+
+class TestEnrichment:
+    def test_fills_canonical_name_and_affiliation(self, server, tmp_path):
+        config = {"contributors": [{"name": "J. Carberry", "orcid": ORCID_A}]}
+
+        (enriched,) = _enrich(server, [config], IdentifierCache(tmp_path))
+
+        assert enriched["contributors"][0]["name"] == "Josiah Carberry"
+        assert enriched["contributors"][0]["affiliation"] == "Brown University"
+        assert config["contributors"][0]["name"] == "J. Carberry"
+
+    def test_doi_authors_supply_missing_orcid(self, server, tmp_path):
+        config = {
+            "doi": "10.5281/zenodo.1",
+            "contributors": [{"name": "Ada Lovelace", "affiliation": ""}],
+        }
+
+        (enriched,) = _enrich(server, [config], IdentifierCache(tmp_path))
+
+        person = enriched["contributors"][0]
+        assert person["orcid"] == ORCID_B
+        assert person["affiliation"] == "Analytical Society"
+        assert person["name"] == "Ada Lovelace"
+
+    def test_batch_resolves_each_identifier_once(self, server, tmp_path):
+        configs = [
+            {"contributors": [{"name": "A", "orcid": ORCID_A}]},
+            {"authors": [{"name": "B", "orcid": f"https://orcid.org/{ORCID_A}"}]},
+        ] * 25
+
+        _enrich(server, configs, IdentifierCache(tmp_path))
+        assert len(server.requests) == 1
+
+        # A later batch is served entirely from the on-disk cache
+        enriched = _enrich(server, configs, IdentifierCache(tmp_path))
+        assert len(server.requests) == 1
+        assert enriched[1]["authors"][0]["name"] == "Josiah Carberry"
+
+    def test_expired_entries_are_resolved_again(self, server, tmp_path):
+        configs = [{"contributors": [{"name": "A", "orcid": ORCID_A}]}]
+
+        _enrich(server, configs, IdentifierCache(tmp_path, ttl=0))
+        _enrich(server, configs, IdentifierCache(tmp_path, ttl=0))
+
+        assert len(server.requests) == 2
+
+    def test_doi_match_requires_full_name(self, server, tmp_path):
+        config = {
+            "doi": "10.5281/zenodo.1",
+            "contributors": [
+                {"name": "Byron Lovelace"},
+                {"name": "Lovelace, Ada, PhD"},
+            ],
+        }
+
+        (enriched,) = _enrich(server, [config], IdentifierCache(tmp_path))
+
+        assert "orcid" not in enriched["contributors"][0]
+        assert enriched["contributors"][1]["orcid"] == ORCID_B
+        assert enriched["contributors"][1]["name"] == "Lovelace, Ada, PhD"
+
+    def test_ambiguous_doi_match_is_skipped(self, server, tmp_path):
+        config = {
+            "doi": "10.5281/zenodo.1",
+            "contributors": [{"name": "Ada Lovelace"}, {"name": "Dr. Ada Lovelace"}],
+        }
+
+        (enriched,) = _enrich(server, [config], IdentifierCache(tmp_path))
+
+        assert all("orcid" not in person for person in enriched["contributors"])
+
+    def test_automate_writes_enriched_zenodo_metadata(
+        self, server, tmp_path, monkeypatch
+    ):
+        resolver = functools.partial(
+            MetadataResolver,
+            orcid_api=f"{server.url}/orcid/",
+            doi_resolver=f"{server.url}/doi/",
+        )
+        monkeypatch.setattr(enrich, "MetadataResolver", resolver)
+        monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / "cache"))
+        monkeypatch.chdir(tmp_path)
+        config = {
+            "title": "A dataset",
+            "doi": "10.5281/zenodo.1",
+            "contributors": [{"name": "Ada Lovelace"}],
+        }
+        (tmp_path / "config.yaml").write_text(json.dumps(config))
+        monkeypatch.setattr(
+            sys, "argv", ["auto-research-readme", "automate", "--enrich"]
+        )
+
+        main()
+
+        metadata = json.loads((tmp_path / ".zenodo.json").read_text())
+        assert metadata["creators"][0]["orcid"] == ORCID_B
+        assert metadata["creators"][0]["affiliation"] == "Analytical Society"
+
+
+class TestNormalizeName:
+    @pytest.mark.parametrize(
+        "name",
+        ["Ada Lovelace", "Lovelace, Ada", "Dr. Ada Lovelace, PhD", "ADA LOVELACE Jr."],
+    )
+    def test_equivalent_forms(self, name):
+        assert normalize_name(name) == "ada lovelace"
+
+    def test_accents_and_hyphens(self):
+        assert normalize_name("García-López, José") == "jose garcia lopez"
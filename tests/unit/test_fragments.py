@@ -0,0 +1,128 @@
+"""
+Tests for the ``{% cache %}`` template fragment tag.
+"""
+
+import asyncio
+import os
+
+import pytest
+from jinja2 import DictLoader, Environment
+
+from auto_readme.cache import RenderCache
+from auto_readme.fragments import FragmentCacheExtension, clear_fragment_cache
+from auto_readme.template_loader import clear_template_cache, get_environment
+
+TEMPLATE = "{% cache people %}[{{ render() }}{{ people | join(',') }}]{% endcache %}"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_fragments():
+    """Isolate the process fragment cache between tests."""
+    clear_fragment_cache()
+    yield
+    clear_fragment_cache()
+
+
+@pytest.fixture
+def renders():
+    calls = []
+    return calls, lambda: calls.append(1) or ""
+
+
+def _env(**templates):
+    env = Environment(loader=DictLoader(templates), extensions=[FragmentCacheExtension])
+    env.fragment_disk_cache = False
+    return env
+
+
+class TestFragmentCache:
+    def test_fragment_rendered_once_per_key(self, renders):
+        calls, render = renders
+        template = _env(t=TEMPLATE + " {{ title }}").get_template("t")
+
+        first = template.render(people=["a"], title="One", render=render)
+        second = template.render(people=["a"], title="Two", render=render)
+        third = template.render(people=["b"], title="Two", render=render)
+
+        assert (first, second, third) == ("[a] One", "[a] Two", "[b] Two")
+        assert len(calls) == 2
+
+    def test_editing_the_body_invalidates(self, renders):
+        calls, render = renders
+        env = _env(t=TEMPLATE, u=TEMPLATE.replace("[", "<"))
+
+        env.get_template("t").render(people=["a"], render=render)
+        output = env.get_template("u").render(people=["a"], render=render)
+
+        assert output == "<a]"
+        assert len(calls) == 2
+
+    def test_editing_an_included_template_invalidates(self, tmp_path):
+        (tmp_path / "row.j2").write_text("OLD {{ x }}")
+        (tmp_path / "t.j2").write_text(
+            '{% cache x %}{% include "row.j2" %}{% endcache %}'
+        )
+        env = get_environment([tmp_path])
+        env.fragment_disk_cache = RenderCache(tmp_path / "cache")
+        assert env.get_template("t.j2").render(x=1) == "OLD 1"
+
+        (tmp_path / "row.j2").write_text("NEW {{ x }}")
+        os.utime(tmp_path / "row.j2", ns=(1, 1))
+        clear_template_cache()
+        env = get_environment([tmp_path])
+        env.fragment_disk_cache = RenderCache(tmp_path / "cache")
+
+        assert env.get_template("t.j2").render(x=1) == "NEW 1"
+
+    def test_dynamic_include_is_not_cached(self, renders):
+        calls, render = renders
+        env = _env(
+            t="{% cache 1 %}{% include name %}{% endcache %}",
+            row="{{ render() }}row",
+        )
+
+        for _ in range(2):
+            assert env.get_template("t").render(name="row", render=render) == "row"
+        assert len(calls) == 2
+
+    def test_disk_cache_survives_the_process_cache(self, tmp_path, renders):
+        calls, render = renders
+        env = _env(t=TEMPLATE)
+        env.fragment_disk_cache = RenderCache(tmp_path)
+        env.get_template("t").render(people=["a"], render=render)
+
+        clear_fragment_cache()
+        output = env.get_template("t").render(people=["a"], render=render)
+
+        assert output == "[a]"
+        assert len(calls) == 1
+        assert env.fragment_disk_cache.stats.hits == 1
+
+    def test_async_rendering(self, renders):
+        calls, render = renders
+        env = Environment(
+            loader=DictLoader({"t": TEMPLATE}),
+            extensions=[FragmentCacheExtension],
+            enable_async=True,
+        )
+        env.fragment_disk_cache = False
+        template = env.get_template("t")
+
+        async def render_twice():
+            return [
+                await template.render_async(people=["a"], render=render)
+                for _ in range(2)
+            ]
+
+        assert asyncio.run(render_twice()) == ["[a]", "[a]"]
+        assert len(calls) == 1
+
+    def test_available_in_project_templates(self, tmp_path):
+        (tmp_path / "readme.md.j2").write_text(TEMPLATE)
+
+        env = get_environment([tmp_path])
+        output = env.get_template("readme.md.j2").render(
+            people=["x"], render=lambda: ""
+        )
+
+        assert output == "[x]"
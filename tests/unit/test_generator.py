@@ -6,9 +6,11 @@ from pathlib import Path
 from unittest.mock import mock_open, patch
 
 from auto_readme.generator import (
+    diff_output,
     generate_citation,
     generate_license,
     load_config,
+    output_is_current,
 )
 from tests.fixtures.configs import DATASET_CONFIG
 
@@ -62,3 +64,29 @@ class TestGenerateLicense:
         assert "MIT License" in result
         assert "Copyright (c)" in result
         assert "Permission is hereby granted" in result
+
+
+class TestOutputCheck:
+    """Test in-memory comparison of rendered outputs."""
+
+    def test_output_is_current_for_identical_file(self, tmp_path):
+        """Test that identical content is reported as up to date."""
+        (tmp_path / "LICENSE").write_text("MIT License", encoding="utf-8")
+        assert output_is_current("LICENSE", "MIT License", tmp_path) is True
+
+    def test_output_is_stale_for_missing_or_changed_file(self, tmp_path):
+        """Test that missing files and changed content are reported as stale."""
+        assert output_is_current("LICENSE", "MIT License", tmp_path) is False
+
+        (tmp_path / "LICENSE").write_text("MIT Licence", encoding="utf-8")
+        assert output_is_current("LICENSE", "MIT License", tmp_path) is False
+
+    def test_diff_output_shows_changed_lines(self, tmp_path):
+        """Test that diff_output produces a unified diff of the changes."""
+        (tmp_path / "README.md").write_text("# Title\nold\n", encoding="utf-8")
+        diff = diff_output("README.md", "# Title\nnew\n", tmp_path)
+
+        assert "--- a/README.md" in diff
+        assert "-old" in diff
+        assert "+new" in diff
+        assert diff_output("README.md", "# Title\nold\n", tmp_path) == ""
@@ -0,0 +1,103 @@
+"""
+Tests for the pre-commit hook entry point.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import yaml
+
+from auto_readme import hook
+from auto_readme.badges import badge_files
+from tests.fixtures.configs import DATASET_CONFIG
+
+
+def _init_project(root: Path) -> None:
+    """Create a minimal project with a config file."""
+    (root / "config").mkdir()
+    (root / "config" / "config.yaml").write_text(
+        yaml.safe_dump(DATASET_CONFIG), encoding="utf-8"
+    )
+
+
+class TestPreCommitHook:
+    """Test stamp-based change detection and regeneration."""
+
+    def test_regenerates_and_stages_without_stamp(self, tmp_path, monkeypatch):
+        """Test that a missing stamp triggers regeneration and staging."""
+        _init_project(tmp_path)
+        monkeypatch.chdir(tmp_path)
+
+        with patch("subprocess.run") as mock_run:
+            assert hook.main(["config/config.yaml"]) == 0
+
+        for filename in hook.OUTPUT_FILES:
+            assert (tmp_path / filename).exists()
+        staged = mock_run.call_args.args[0]
+        assert staged[:3] == ["git", "add", "--"]
+        assert set(staged[3:]) == {*hook.OUTPUT_FILES, *badge_files(DATASET_CONFIG)}
+
+        stamp = json.loads((tmp_path / hook.STAMP_FILE).read_text())
+        assert "config/config.yaml" in stamp["inputs"]
+
+    def test_skips_when_staged_files_are_irrelevant(self, tmp_path, monkeypatch):
+        """Test that unrelated staged files never trigger regeneration."""
+        _init_project(tmp_path)
+        monkeypatch.chdir(tmp_path)
+        hook.write_stamp({"config/config.yaml": "stale-digest"})
+
+        with patch.object(hook, "regenerate") as mock_regenerate:
+            assert hook.main(["src/model.py", "docs/notes.md"]) == 0
+            mock_regenerate.assert_not_called()
+
+    def test_skips_when_input_hashes_match_stamp(self, tmp_path, monkeypatch):
+        """Test that a staged but unchanged config does not regenerate."""
+        _init_project(tmp_path)
+        monkeypatch.chdir(tmp_path)
+        hook.write_stamp(hook.hash_inputs([Path("config/config.yaml")]))
+
+        with patch.object(hook, "regenerate") as mock_regenerate:
+            assert hook.main(["config/config.yaml"]) == 0
+            mock_regenerate.assert_not_called()
+
+    def test_fast_path_does_not_import_jinja_or_yaml(self, tmp_path):
+        """Test that the no-op path avoids importing heavy dependencies."""
+        _init_project(tmp_path)
+        (tmp_path / hook.STAMP_FILE).write_text(
+            json.dumps({"version": hook.__version__, "inputs": {"x": "y"}})
+        )
+        script = (
+            "import sys\n"
+            "from auto_readme.hook import main\n"
+            "assert main(['src/model.py']) == 0\n"
+            "print('jinja2' in sys.modules, 'yaml' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=tmp_path,
+            env={"PYTHONPATH": str(Path(__file__).resolve().parents[2])},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "False False"
+
+    def test_inherited_base_is_tracked_in_stamp(self, tmp_path, monkeypatch):
+        """Test that changes to an extended base config are detected."""
+        _init_project(tmp_path)
+        (tmp_path / "org.yaml").write_text('maintainer: "org@example.com"\n')
+        config_file = tmp_path / "config" / "config.yaml"
+        config_file.write_text("extends: ../org.yaml\n" + config_file.read_text())
+        monkeypatch.chdir(tmp_path)
+
+        with patch("subprocess.run"):
+            assert hook.main(["config/config.yaml"]) == 0
+        assert "org.yaml" in hook.read_stamp()
+
+        (tmp_path / "org.yaml").write_text('maintainer: "new@example.com"\n')
+        with patch.object(hook, "regenerate", return_value=([], [])) as mock_regen:
+            assert hook.main(["org.yaml"]) == 0
+            mock_regen.assert_called_once()
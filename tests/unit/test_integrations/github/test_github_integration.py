@@ -4,6 +4,8 @@ Tests for GitHub integration.
 
 from unittest.mock import MagicMock, patch
 
+import yaml
+
 from auto_readme.integration.platforms.github.integration import GitHubIntegration
 from tests.fixtures.configs import DATASET_CONFIG, MINIMAL_CONFIG
 
@@ -69,3 +71,48 @@ class TestGitHubIntegration:
         assert isinstance(requirements, list)
         assert len(requirements) > 0
         assert any("GitHub" in req for req in requirements)
+
+    def test_rendered_workflow_is_cached_and_check_only(self, tmp_path, monkeypatch):
+        """Test the generated workflow pins, caches and only verifies outputs."""
+        monkeypatch.chdir(tmp_path)
+        integration = GitHubIntegration()
+
+        integration.setup(DATASET_CONFIG)
+
+        content = (tmp_path / ".github/workflows/release.yml").read_text()
+        workflow = yaml.safe_load(content)
+        steps = workflow["jobs"]["release"]["steps"]
+        runs = "\n".join(step.get("run", "") for step in steps)
+
+        assert workflow["concurrency"]["cancel-in-progress"] is True
+        assert steps[1]["with"]["python-version"] == "3.11"
+        assert any(step.get("uses") == "actions/cache@v4" for step in steps)
+        assert "auto-research-readme make all --check" in runs
+        assert "make all\n" not in runs
+        assert "Dr. Test Author" in content
+
+    def test_monorepo_workflow_fans_out_changed_projects(self, tmp_path, monkeypatch):
+        """Test that monorepos get a changed-project matrix workflow."""
+        monkeypatch.chdir(tmp_path)
+        integration = GitHubIntegration()
+        config = {**DATASET_CONFIG, "monorepo": {"projects_dir": "data/projects"}}
+
+        result = integration.setup(config)
+
+        assert "monorepo" in result
+        workflow = yaml.safe_load(
+            (tmp_path / ".github/workflows/projects.yml").read_text()
+        )
+        changes = workflow["jobs"]["changes"]
+        project = workflow["jobs"]["project"]
+        detect = changes["steps"][-1]["run"]
+
+        assert "auto-research-readme changed data/projects/*/" in detect
+        assert '--since "$BASE_SHA" --json' in detect
+        assert "'data/projects/*/config/*'" in detect
+        assert "cut -d/ -f1-3" in detect
+        assert workflow[True]["pull_request"] is None  # "on:", no path filters
+        assert project["needs"] == "changes"
+        assert "fromJSON(needs.changes.outputs.projects)" in str(
+            project["strategy"]["matrix"]["project"]
+        )
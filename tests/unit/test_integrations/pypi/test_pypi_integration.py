@@ -4,6 +4,8 @@ Tests for PyPI integration.
 
 from unittest.mock import MagicMock, patch
 
+import yaml
+
 from auto_readme.integration.platforms.pypi.integration import PyPIIntegration
 from tests.fixtures.configs import DATASET_CONFIG, PYTHON_PACKAGE_CONFIG
 
@@ -53,3 +55,35 @@ class TestPyPIIntegration:
         assert isinstance(requirements, list)
         assert len(requirements) > 0
         assert any("PyPI" in req for req in requirements)
+
+    def test_rendered_workflow_builds_once_and_reuses_artifact(
+        self, tmp_path, monkeypatch
+    ):
+        """Test that the real template renders a build-once workflow."""
+        monkeypatch.chdir(tmp_path)
+        integration = PyPIIntegration()
+
+        integration.setup(PYTHON_PACKAGE_CONFIG)
+
+        workflow = yaml.safe_load(
+            (tmp_path / ".github/workflows/pypi-publish.yml").read_text()
+        )
+        jobs = workflow["jobs"]
+        builds = [
+            name
+            for name, job in jobs.items()
+            if any("python -m build" in s.get("run", "") for s in job["steps"])
+        ]
+
+        assert builds == ["release-build"]
+        for name in ("test", "provenance", "pypi-publish"):
+            assert "release-build" in jobs[name]["needs"]
+            downloads = [
+                step
+                for step in jobs[name]["steps"]
+                if "download-artifact" in step.get("uses", "")
+            ]
+            assert downloads[0]["with"]["name"].endswith("outputs.artifact }}")
+        publish = jobs["pypi-publish"]["steps"][-1]
+        assert publish["if"] == "steps.published.outputs.skip != 'true'"
+        assert "test-python-package" in str(jobs["pypi-publish"]["environment"])
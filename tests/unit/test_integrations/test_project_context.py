@@ -0,0 +1,67 @@
+"""
+Tests for the project context shared by integrations.
+"""
+
+from unittest.mock import patch
+
+from auto_readme.integration import INTEGRATIONS, ProjectContext, setup_all_integrations
+from auto_readme.integration.platforms.github.integration import GitHubIntegration
+from auto_readme.integration.platforms.zenodo.integration import ZenodoIntegration
+from tests.fixtures.configs import DATASET_CONFIG, PYTHON_PACKAGE_CONFIG
+
+
+class TestProjectContext:
+    """Test building and using project contexts."""
+
+    def test_context_records_git_root_and_workflows(self, tmp_path):
+        """Test that the git root is found from a nested project directory."""
+        (tmp_path / ".git").mkdir()
+        project_dir = tmp_path / "projects" / "a"
+        (project_dir / ".github" / "workflows").mkdir(parents=True)
+        (project_dir / ".github" / "workflows" / "release.yml").write_text("")
+
+        context = ProjectContext.from_config(DATASET_CONFIG, project_dir)
+
+        assert context.git_root == tmp_path
+        assert context.existing_workflows == {"release.yml"}
+
+    def test_identifiers_are_normalized_once(self, tmp_path):
+        """Test that DOIs and types are normalized when the context is built."""
+        config = {
+            **PYTHON_PACKAGE_CONFIG,
+            "type": " Python-Package ",
+            "doi": "https://doi.org/10.5281/ZENODO.42",
+        }
+
+        context = ProjectContext.from_config(config, tmp_path)
+
+        assert context.project_type == "python-package"
+        assert context.doi == "10.5281/zenodo.42"
+        assert context.zenodo_record_id == "42"
+        assert context.git_root is None
+
+    def test_applicability_checks_do_not_touch_the_filesystem(self, tmp_path):
+        """Test that integrations only read the prebuilt context."""
+        context = ProjectContext.from_config(DATASET_CONFIG, tmp_path)
+
+        with patch("pathlib.Path.exists", side_effect=AssertionError("stat")):
+            applicable = [
+                cls().name for cls in INTEGRATIONS if cls().is_applicable(context)
+            ]
+
+        assert applicable == ["Zenodo"]
+
+    def test_setup_writes_into_the_project_root(self, tmp_path):
+        """Test that integrations write relative to the context root."""
+        (tmp_path / ".git").mkdir()
+
+        with patch("builtins.print"):
+            applied = setup_all_integrations(DATASET_CONFIG, tmp_path)
+
+        assert applied == ["GitHub", "Zenodo"]
+        assert (tmp_path / ".github" / "workflows" / "release.yml").exists()
+        assert (tmp_path / ".zenodo.json").exists()
+
+        context = ProjectContext.from_config(DATASET_CONFIG, tmp_path)
+        assert GitHubIntegration().setup(context).startswith("Updated")
+        assert ZenodoIntegration().is_applicable(context)
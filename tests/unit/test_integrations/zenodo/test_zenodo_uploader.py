@@ -0,0 +1,185 @@
+"""
+Tests for the Zenodo upload engine, run against a local stub server.
+"""
+
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from auto_readme.integration.platforms.zenodo.uploader import (
+    ZenodoUploader,
+    file_md5,
+    zenodo_record_id,
+)
+
+
+class StubZenodo:
+    """Minimal in-memory implementation of the Zenodo deposit API."""
+
+    def __init__(self):
+        self.depositions = {}
+        self.buckets = {}
+        self.puts = []
+        self.fail_next_put = set()
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/api"
+        self.thread = threading.Thread(
+            target=self.server.serve_forever,
+            kwargs={"poll_interval": 0.01},
+            daemon=True,
+        )
+
+    def add_deposition(self, dep_id, files=None):
+        """Create a deposition whose bucket already holds some files."""
+        bucket = f"bucket-{dep_id}"
+        self.buckets[bucket] = dict(files or {})
+        self.depositions[dep_id] = bucket
+        return dep_id
+
+    def resource(self, dep_id):
+        bucket = self.depositions[dep_id]
+        return {
+            "id": dep_id,
+            "links": {"bucket": f"{self.url}/files/{bucket}"},
+            "files": [
+                {"filename": name, "checksum": hashlib.md5(data).hexdigest()}
+                for name, data in self.buckets[bucket].items()
+            ],
+        }
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def _send(self, status, payload):
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                dep_id = self.path.rstrip("/").split("/")[-1]
+                self._send(200, stub.resource(dep_id))
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                self.rfile.read(length)
+                parts = self.path.strip("/").split("/")
+                with stub.lock:
+                    if parts[-1] == "newversion":
+                        old = stub.depositions[parts[-3]]
+                        new_id = f"{parts[-3]}-v2"
+                        stub.add_deposition(new_id, stub.buckets[old])
+                        draft = f"{stub.url}/deposit/depositions/{new_id}"
+                        self._send(201, {"links": {"latest_draft": draft}})
+                        return
+                    new_id = str(len(stub.depositions) + 1)
+                    stub.add_deposition(new_id)
+                self._send(201, stub.resource(new_id))
+
+            def do_PUT(self):
+                assert self.headers["Authorization"] == "Bearer token"
+                length = int(self.headers["Content-Length"])
+                data = self.rfile.read(length)
+                _, _, bucket, name = self.path.strip("/").split("/")
+                with stub.lock:
+                    stub.puts.append(name)
+                    if name in stub.fail_next_put:
+                        stub.fail_next_put.discard(name)
+                        self._send(503, {"message": "try again"})
+                        return
+                    stub.buckets[bucket][name] = data
+                checksum = f"md5:{hashlib.md5(data).hexdigest()}"
+                self._send(201, {"key": name, "checksum": checksum})
+
+        return Handler
+
+
+@pytest.fixture
+def stub():
+    """Run a stub Zenodo server for the duration of a test."""
+    server = StubZenodo()
+    server.thread.start()
+    yield server
+    server.server.shutdown()
+    server.server.server_close()
+
+
+def _write_files(tmp_path, contents):
+    paths = []
+    for name, data in contents.items():
+        path = tmp_path / name
+        path.write_bytes(data)
+        paths.append(path)
+    return paths
+
+
+class TestZenodoUploader:
+    """Test deposition creation and file uploads."""
+
+    def test_uploads_files_in_chunks_concurrently(self, stub, tmp_path):
+        """Test that all files are uploaded and stored intact."""
+        contents = {f"part-{i}.bin": bytes([i]) * (1000 + i) for i in range(6)}
+        paths = _write_files(tmp_path, contents)
+        uploader = ZenodoUploader("token", stub.url, max_workers=3, chunk_size=64)
+
+        deposition = uploader.create_deposition()
+        results = uploader.upload_files(deposition, paths)
+
+        assert [r.status for r in results] == ["uploaded"] * 6
+        assert stub.buckets[f"bucket-{deposition['id']}"] == contents
+
+    def test_skips_files_with_matching_checksum(self, stub, tmp_path):
+        """Test that files already in the deposition are not re-uploaded."""
+        paths = _write_files(tmp_path, {"a.csv": b"same", "b.csv": b"changed"})
+        stub.add_deposition("7", {"a.csv": b"same", "b.csv": b"old"})
+        uploader = ZenodoUploader("token", stub.url)
+
+        results = uploader.upload_files(uploader.get_deposition("7"), paths)
+
+        assert [(r.filename, r.status) for r in results] == [
+            ("a.csv", "skipped"),
+            ("b.csv", "uploaded"),
+        ]
+        assert stub.puts == ["b.csv"]
+
+    def test_new_version_reuses_previous_files(self, stub, tmp_path):
+        """Test that a new version only uploads files that changed."""
+        paths = _write_files(tmp_path, {"data.zip": b"v1", "new.zip": b"new"})
+        stub.add_deposition("42", {"data.zip": b"v1"})
+        uploader = ZenodoUploader("token", stub.url)
+
+        draft = uploader.new_version("42")
+        results = uploader.upload_files(draft, paths)
+
+        assert draft["id"] == "42-v2"
+        assert [r.status for r in results] == ["skipped", "uploaded"]
+
+    def test_retries_failed_transfer(self, stub, tmp_path):
+        """Test that a server error is retried and the upload completes."""
+        (path,) = _write_files(tmp_path, {"big.bin": b"x" * 5000})
+        stub.add_deposition("9")
+        stub.fail_next_put.add("big.bin")
+        uploader = ZenodoUploader("token", stub.url, retry_delay=0)
+
+        (result,) = uploader.upload_files(uploader.get_deposition("9"), [path])
+
+        assert result.status == "uploaded"
+        assert result.checksum == file_md5(path)
+        assert stub.puts == ["big.bin", "big.bin"]
+
+    def test_zenodo_record_id_from_link_or_doi(self):
+        """Test record ID extraction from config fields."""
+        link = {"zenodo_link": "https://zenodo.org/records/55"}
+        assert zenodo_record_id(link) == "55"
+        assert zenodo_record_id({"doi": "10.5281/zenodo.123456"}) == "123456"
+        assert zenodo_record_id({"doi": "10.1000/xyz"}) is None
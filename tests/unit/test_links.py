@@ -0,0 +1,78 @@
+"""
+Tests for link and identifier checking.
+"""
+
+import asyncio
+
+from auto_readme.links import check_links, collect_links, orcid_checksum_valid
+from auto_readme.net import AsyncHTTPClient
+from tests.fixtures.stub_http import StubServer
+
+VALID_ORCID = "0000-0002-1825-0097"
+
+
+class TestCollectLinks:
+    def test_orcid_checksum(self):
+        assert orcid_checksum_valid(VALID_ORCID)
+        assert orcid_checksum_valid("0000-0002-1694-233X")
+        assert not orcid_checksum_valid("0000-0000-0000-0000")
+
+    def test_malformed_identifiers_fail_without_a_url(self):
+        config = {
+            "doi": "not-a-doi",
+            "contributors": [{"name": "A", "orcid": "0000-0000-0000-0000"}],
+        }
+
+        results = collect_links(config)
+
+        assert [(r.field, r.url, r.error) for r in results] == [
+            ("doi", None, "malformed DOI"),
+            ("contributors[0].orcid", None, "invalid ORCID iD checksum"),
+        ]
+
+    def test_identifiers_are_normalized_and_deduplicated(self):
+        config = {
+            "doi": "https://doi.org/10.5281/zenodo.123",
+            "contributors": [{"name": "A", "orcid": VALID_ORCID}],
+            "authors": [{"name": "A", "orcid": VALID_ORCID}],
+        }
+
+        urls = [r.url for r in collect_links(config)]
+
+        assert urls == [
+            "https://doi.org/10.5281/zenodo.123",
+            f"https://orcid.org/{VALID_ORCID}",
+        ]
+
+
+class TestCheckLinks:
+    def test_batch_requests_each_unique_url_once(self):
+        routes = {
+            "/repo": (200, {}, b""),
+            f"/orcid/{VALID_ORCID}": (200, {}, b""),
+        }
+        with StubServer(routes) as server:
+            configs = [
+                {
+                    "github_link": f"{server.url}/repo",
+                    "zenodo_link": f"{server.url}/gone",
+                    "contributors": [{"name": "A", "orcid": VALID_ORCID}],
+                }
+                for _ in range(50)
+            ]
+
+            async def main():
+                async with AsyncHTTPClient(max_per_host=2) as client:
+                    return await check_links(
+                        configs, client, orcid_resolver=f"{server.url}/orcid/"
+                    )
+
+            reports = asyncio.run(main())
+
+        assert len(reports) == 50
+        first = {r.field: r for r in reports[0]}
+        assert first["github_link"].ok
+        assert not first["zenodo_link"].ok
+        assert first["zenodo_link"].error == "HTTP 404"
+        assert first["contributors[0].orcid"].ok
+        assert len(server.requests) == 3
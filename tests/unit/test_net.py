@@ -0,0 +1,151 @@
+"""
+Tests for the asynchronous HTTP client, run against a local stub server.
+"""
+
+import asyncio
+
+import pytest
+
+from auto_readme.net import AsyncHTTPClient, ResponseCache
+from tests.fixtures.stub_http import StubServer
+
+
+@pytest.fixture
+def server():
+    routes = {
+        "/ok": (200, {}, b"hello"),
+        "/etag": (200, {"ETag": '"v1"'}, b"tagged"),
+        "/moved": (301, {"Location": "/ok"}, b""),
+        "http://example.test/ok": (200, {}, b"proxied"),
+    }
+    with StubServer(routes) as stub:
+        yield stub
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+class TestAsyncHTTPClient:
+    def test_identical_requests_are_sent_once(self, server):
+        async def main():
+            async with AsyncHTTPClient() as client:
+                responses = await asyncio.gather(
+                    *(client.request("GET", f"{server.url}/ok") for _ in range(20))
+                )
+                return responses, client.requests_sent
+
+        responses, sent = _run(main())
+
+        assert {r.body for r in responses} == {b"hello"}
+        assert sent == 1
+        assert len(server.requests) == 1
+
+    def test_connections_are_reused_per_host(self, server):
+        async def main():
+            async with AsyncHTTPClient(max_per_host=1) as client:
+                for path in ("/ok", "/etag", "/missing"):
+                    await client.request("GET", server.url + path)
+
+        _run(main())
+
+        assert len(server.requests) == 3
+        assert len(server.connections) == 1
+
+    def test_redirects_are_followed(self, server):
+        async def main():
+            async with AsyncHTTPClient() as client:
+                return await client.request("HEAD", f"{server.url}/moved")
+
+        response = _run(main())
+
+        assert response.status == 200
+        assert response.url == f"{server.url}/ok"
+
+    def test_fresh_cache_entries_avoid_requests(self, server, tmp_path):
+        cache = ResponseCache(tmp_path, ttl=60)
+
+        async def main():
+            async with AsyncHTTPClient(cache=cache) as client:
+                return await client.request("GET", f"{server.url}/ok")
+
+        _run(main())
+        response = _run(main())
+
+        assert response.from_cache
+        assert response.body == b"hello"
+        assert len(server.requests) == 1
+
+    def test_expired_entries_are_revalidated_with_etag(self, server, tmp_path):
+        cache = ResponseCache(tmp_path, ttl=0)
+
+        async def main():
+            async with AsyncHTTPClient(cache=cache) as client:
+                return await client.request("GET", f"{server.url}/etag")
+
+        _run(main())
+        response = _run(main())
+
+        assert response.status == 200
+        assert response.body == b"tagged"
+        assert server.requests[1][2]["If-None-Match"] == '"v1"'
+
+    def test_plain_http_goes_through_the_proxy(self, server):
+        async def main():
+            async with AsyncHTTPClient(proxies={"http": server.url}) as client:
+                return await client.request("GET", "http://example.test/ok")
+
+        response = _run(main())
+
+        assert response.body == b"proxied"
+        assert server.requests[0][1] == "http://example.test/ok"
+        assert server.requests[0][2]["Host"] == "example.test"
+
+    def test_no_proxy_hosts_are_reached_directly(self, server):
+        proxies = {"http": "http://127.0.0.1:9", "no": "localhost,127.0.0.1"}
+
+        async def main():
+            async with AsyncHTTPClient(proxies=proxies) as client:
+                return await client.request("GET", f"{server.url}/ok")
+
+        assert _run(main()).body == b"hello"
+
+    def test_informational_responses_are_skipped(self):
+        async def respond(reader, writer):
+            await reader.readuntil(b"\r\n\r\n")
+            writer.write(
+                b"HTTP/1.1 100 Continue\r\n\r\n"
+                b"HTTP/1.1 103 Early Hints\r\nLink: </style.css>\r\n\r\n"
+                b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok"
+            )
+            await writer.drain()
+            writer.close()
+
+        async def main():
+            server = await asyncio.start_server(respond, "127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            async with server, AsyncHTTPClient(proxies={}) as client:
+                return await client.request("GET", f"http://127.0.0.1:{port}/")
+
+        response = _run(main())
+
+        assert (response.status, response.body) == (200, b"ok")
+        assert "link" not in response.headers
+
+    def test_oversized_bodies_are_rejected(self, server):
+        async def main():
+            async with AsyncHTTPClient(max_body_size=4) as client:
+                return await client.request("GET", f"{server.url}/ok")
+
+        with pytest.raises(ValueError, match="larger than 4 bytes"):
+            _run(main())
+
+    def test_unwritable_cache_is_skipped(self, server, tmp_path):
+        blocker = tmp_path / "cache"
+        blocker.write_text("not a directory")
+
+        async def main():
+            async with AsyncHTTPClient(cache=ResponseCache(blocker)) as client:
+                return await client.request("GET", f"{server.url}/ok")
+
+        assert _run(main()).body == b"hello"
@@ -0,0 +1,91 @@
+"""
+Tests for running release stages in a single process.
+"""
+
+import subprocess
+
+import pytest
+import yaml
+
+from auto_readme import pipeline
+from tests.fixtures.configs import DATASET_CONFIG
+
+
+def _git(repo, *args):
+    return subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    remote = tmp_path / "remote.git"
+    _git(tmp_path, "init", "-q", "--bare", str(remote))
+
+    repo = tmp_path / "project"
+    (repo / "config").mkdir(parents=True)
+    config = {
+        **DATASET_CONFIG,
+        "changelog": {"1.0.0": ["First release"]},
+        "pipeline": ["generate", "changelog", "tag"],
+    }
+    (repo / "config" / "config.yaml").write_text(yaml.safe_dump(config))
+    _git(repo, "init", "-q")
+    _git(repo, "remote", "add", "origin", str(remote))
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "init")
+
+    monkeypatch.chdir(repo)
+    return repo, remote
+
+
+class TestPipeline:
+    def test_runs_declared_stages_with_one_config_load(self, project, monkeypatch):
+        repo, remote = project
+        loads = []
+        load = pipeline.load_config_with_sources
+        monkeypatch.setattr(
+            pipeline,
+            "load_config_with_sources",
+            lambda *args: loads.append(args) or load(*args),
+        )
+
+        results = pipeline.run_pipeline()
+
+        assert [result.name for result in results] == ["generate", "changelog", "tag"]
+        assert all(result.seconds >= 0 for result in results)
+        assert len(loads) == 1
+        assert (repo / "README.md").exists()
+        assert "- First release" in (repo / "CHANGELOG.md").read_text()
+        assert results[-1].outputs == ["v1.0.0"]
+        assert "v1.0.0" in _git(remote, "tag").split()
+
+    def test_stage_override_and_existing_tag(self, project):
+        repo, _ = project
+        _git(repo, "tag", "v1.0.0")
+
+        results = pipeline.run_pipeline(stages=["tag"])
+
+        assert [result.name for result in results] == ["tag"]
+        assert results[0].outputs == []
+        assert not (repo / "README.md").exists()
+
+    def test_uncommitted_config_blocks_tagging(self, project):
+        repo, remote = project
+        config_file = repo / "config" / "config.yaml"
+        config_file.write_text(config_file.read_text() + "tagline: changed\n")
+
+        with pytest.raises(RuntimeError, match="uncommitted"):
+            pipeline.run_pipeline(stages=["tag"])
+        assert _git(remote, "tag") == ""
+
+    def test_unknown_stage_is_rejected(self):
+        with pytest.raises(ValueError, match="publish"):
+            pipeline.pipeline_stages({"pipeline": {"stages": ["generate", "publish"]}})
+
+    def test_defaults_to_generate_only(self):
+        assert pipeline.pipeline_stages({}) == ["generate"]
@@ -0,0 +1,42 @@
+"""
+Tests for rate-limited progress reporting.
+"""
+
+import io
+import json
+
+import pytest
+
+from auto_readme.progress import ProgressReporter
+
+
+class _Terminal(io.StringIO):
+    def isatty(self):
+        return True
+
+
+class TestProgressReporter:
+    def test_json_lines_are_rate_limited(self):
+        stream = io.StringIO()
+        with ProgressReporter(100, stream, interval=60, label="check") as progress:
+            for index in range(100):
+                progress.update(ok=index % 10 != 0)
+
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert len(records) == 2  # First update and the final state
+        assert records[-1]["done"] == 100 and records[-1]["failed"] == 10
+        assert records[-1]["label"] == "check"
+
+    def test_bar_on_a_terminal(self):
+        stream = _Terminal()
+        with ProgressReporter(4, stream) as progress:
+            progress.skip(1)
+            progress.update()
+
+        output = stream.getvalue()
+        assert output.startswith("\r") and output.endswith("\n")
+        assert "2/4" in output and "█" * 15 + "░" in output
+
+    def test_unknown_style(self):
+        with pytest.raises(ValueError, match="sparkles"):
+            ProgressReporter(1, style="sparkles")
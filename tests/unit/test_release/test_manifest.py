@@ -0,0 +1,127 @@
+"""Tests for content-addressed release manifests and deltas."""
+
+import hashlib
+import subprocess
+
+import pytest
+
+from auto_readme.integration.release import manifest
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _release(repo, tag, files):
+    for name, content in files.items():
+        path = repo / name
+        if content is None:
+            path.unlink()
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-m", tag)
+    _git(repo, "tag", tag)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q")
+    _release(
+        repo,
+        "v1.0.0",
+        {"README.md": b"readme\n", "data/a.csv": b"1,2\n", "data/b.csv": b"3,4\n"},
+    )
+    _release(
+        repo,
+        "v1.1.0",
+        {"data/a.csv": b"1,2,3\n", "data/c.csv": b"3,4\n", "data/b.csv": None},
+    )
+    return repo
+
+
+class TestManifest:
+    def test_manifest_records_sha256_of_every_file(self, repo, tmp_path):
+        result = manifest.build_manifest("v1.0.0", repo, cache_dir=tmp_path / "c")
+
+        assert sorted(result["files"]) == ["README.md", "data/a.csv", "data/b.csv"]
+        entry = result["files"]["data/a.csv"]
+        assert entry["sha256"] == hashlib.sha256(b"1,2\n").hexdigest()
+        assert entry["size"] == 4
+
+    def test_manifest_is_cached_by_tree(self, repo, tmp_path, monkeypatch):
+        cache_dir = tmp_path / "c"
+        manifest.build_manifest("v1.0.0", repo, cache_dir=cache_dir)
+        monkeypatch.setattr(manifest, "tree_entries", pytest.fail)
+
+        result = manifest.build_manifest("v1.0.0", repo, cache_dir=cache_dir)
+
+        assert "README.md" in result["files"]
+
+    def test_previous_release_tag(self, repo):
+        assert manifest.previous_release_tag("v1.1.0", repo) == "v1.0.0"
+        assert manifest.previous_release_tag("v1.0.0", repo) is None
+
+    def test_delta_contains_only_new_blobs(self, repo, tmp_path):
+        previous = manifest.build_manifest("v1.0.0", repo, cache_dir=tmp_path / "c")
+        current = manifest.build_manifest(
+            "v1.1.0", repo, previous=previous, cache_dir=tmp_path / "c"
+        )
+
+        delta = manifest.compute_delta(current, previous)
+
+        assert delta["added"] == ["data/c.csv"]
+        assert delta["changed"] == ["data/a.csv"]
+        assert delta["removed"] == ["data/b.csv"]
+        # c.csv has the same content as the old b.csv, so only a.csv is new
+        assert delta["blobs"] == [hashlib.sha256(b"1,2,3\n").hexdigest()]
+
+    def test_full_delta_stages_every_blob(self, repo, tmp_path):
+        previous = manifest.build_manifest("v1.0.0", repo, cache_dir=tmp_path / "c")
+        current = manifest.build_manifest(
+            "v1.1.0", repo, previous=previous, cache_dir=tmp_path / "c"
+        )
+
+        delta = manifest.compute_delta(current, previous, full=True)
+
+        assert delta["changed"] == ["data/a.csv"]
+        assert delta["blobs"] == sorted(e["sha256"] for e in current["files"].values())
+
+    def test_store_exists_once_the_workflow_stages_deltas(self, repo):
+        assert not manifest.has_delta_store("v1.1.0", repo)
+
+        workflow = {".github/workflows/release.yml": b"run: release-delta\n"}
+        _release(repo, "v1.2.0", workflow)
+
+        assert manifest.has_delta_store("v1.2.0", repo)
+        assert not manifest.has_delta_store("v1.1.0", repo)
+
+    def test_any_version_reconstructs_from_accumulated_blobs(self, repo, tmp_path):
+        store = tmp_path / "store"
+        previous = None
+        manifests = {}
+        for tag in ("v1.0.0", "v1.1.0"):
+            current = manifest.build_manifest(
+                tag, repo, previous=previous, cache_dir=tmp_path / "c"
+            )
+            delta = manifest.compute_delta(current, previous)
+            manifest.stage_release(current, delta, store, repo)
+            manifests[tag] = previous = current
+
+        assert (store / "manifest-v1.0.0.json").exists()
+        assert (store / "delta-v1.1.0.json").exists()
+
+        manifest.reconstruct(manifests["v1.0.0"], store / "blobs", tmp_path / "old")
+        assert (tmp_path / "old" / "data" / "b.csv").read_bytes() == b"3,4\n"
+
+        manifest.reconstruct(manifests["v1.1.0"], store / "blobs", tmp_path / "new")
+        assert (tmp_path / "new" / "data" / "a.csv").read_bytes() == b"1,2,3\n"
+        assert not (tmp_path / "new" / "data" / "b.csv").exists()
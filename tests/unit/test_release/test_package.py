@@ -0,0 +1,122 @@
+"""Tests for the reproducible release archive builder."""
+
+import gzip
+import hashlib
+import os
+import subprocess
+import tarfile
+import threading
+import zipfile
+
+import pytest
+
+from auto_readme.integration.release import package
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = tmp_path / "repo"
+    (repo / "data").mkdir(parents=True)
+    (repo / "README.md").write_text("# Project\n")
+    (repo / "data" / "big.bin").write_bytes(os.urandom(300_000) * 4)
+    (repo / "run.sh").write_text("#!/bin/sh\n")
+    (repo / "run.sh").chmod(0o755)
+    os.symlink("README.md", repo / "link.md")
+    _git(repo, "init", "-q")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "init")
+    return repo
+
+
+class TestParallelGzipWriter:
+    def test_output_is_a_single_valid_gzip_member(self, tmp_path):
+        data = os.urandom(50_000) * 10
+        path = tmp_path / "out.gz"
+        with open(path, "wb") as f:
+            gz = package.ParallelGzipWriter(f, jobs=4, chunk_size=64 * 1024)
+            gz.write(data)
+            gz.close()
+
+        assert gzip.decompress(path.read_bytes()) == data
+
+    def test_output_does_not_depend_on_job_count(self, tmp_path):
+        data = os.urandom(20_000) * 20
+        outputs = []
+        for jobs in (1, 3):
+            path = tmp_path / f"out-{jobs}.gz"
+            with open(path, "wb") as f:
+                gz = package.ParallelGzipWriter(f, jobs=jobs, chunk_size=32 * 1024)
+                gz.write(data)
+                gz.close()
+            outputs.append(path.read_bytes())
+
+        assert outputs[0] == outputs[1]
+
+
+class TestBuildArchives:
+    def test_archives_contain_prefixed_sorted_entries(self, repo, tmp_path):
+        out = tmp_path / "dist"
+        package.build_archives("HEAD", out, "proj-1.0", repo)
+
+        with tarfile.open(out / "proj-1.0.tar.gz") as tar:
+            members = tar.getmembers()
+            names = [m.name for m in members]
+            assert names == sorted(names)
+            assert "proj-1.0/data/big.bin" in names
+            assert {m.mtime for m in members} == {members[0].mtime}
+            assert tar.getmember("proj-1.0/run.sh").mode == 0o755
+            assert tar.getmember("proj-1.0/link.md").linkname == "README.md"
+            readme = tar.extractfile("proj-1.0/README.md").read()
+            assert readme == b"# Project\n"
+
+        with zipfile.ZipFile(out / "proj-1.0.zip") as zf:
+            assert zf.testzip() is None
+            assert (
+                zf.read("proj-1.0/data/big.bin")
+                == (repo / "data" / "big.bin").read_bytes()
+            )
+
+    def test_rebuilds_are_byte_identical(self, repo, tmp_path):
+        first = package.build_archives("HEAD", tmp_path / "a", "p", repo, jobs=1)
+        second = package.build_archives("HEAD", tmp_path / "b", "p", repo, jobs=4)
+
+        assert first == second
+        sums = (tmp_path / "a" / package.CHECKSUM_FILE).read_text()
+        digest = hashlib.sha256((tmp_path / "a" / "p.zip").read_bytes()).hexdigest()
+        assert f"{digest}  p.zip\n" in sums
+
+    def test_zip_honours_compression_level(self, repo, tmp_path):
+        package.build_archives("HEAD", tmp_path / "fast", "p", repo, level=1)
+        package.build_archives("HEAD", tmp_path / "small", "p", repo, level=9)
+
+        for name in ("fast", "small"):
+            with zipfile.ZipFile(tmp_path / name / "p.zip") as zf:
+                assert zf.testzip() is None
+        fast = (tmp_path / "fast" / "p.zip").read_bytes()
+        assert fast != (tmp_path / "small" / "p.zip").read_bytes()
+
+    def test_failure_stops_compression_threads(self, repo, tmp_path, monkeypatch):
+        def fail(self, object_id):
+            yield b"partial"
+            raise KeyError(object_id)
+
+        monkeypatch.setattr(package.GitBlobReader, "stream", fail)
+        before = threading.active_count()
+
+        with pytest.raises(KeyError):
+            package.build_archives("HEAD", tmp_path, "p", repo, jobs=2)
+
+        assert threading.active_count() == before
+
+    def test_rejects_unknown_format(self, repo, tmp_path):
+        with pytest.raises(ValueError, match="rar"):
+            package.build_archives("HEAD", tmp_path, "p", repo, formats=["rar"])
@@ -0,0 +1,127 @@
+"""
+Tests for the user-level render cache.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from auto_readme.cache import CACHE_DIR_ENV, RENDER_CACHE_ENV, RenderCache
+from auto_readme.generator import generate_readme
+from auto_readme.template_loader import (
+    clear_template_cache,
+    get_environment,
+    render_template,
+    template_digest,
+)
+from tests.fixtures.configs import DATASET_CONFIG
+
+
+class TestRenderCache:
+    def test_round_trip_and_stats(self, tmp_path):
+        cache = RenderCache(tmp_path)
+        key = cache.key("LICENSE", "digest", {"year": "2025"})
+
+        assert cache.get(key) is None
+        cache.put(key, b"MIT License")
+
+        assert cache.get(key) == b"MIT License"
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+        assert cache.stats.hit_rate == 0.5
+
+    def test_key_depends_on_every_input(self):
+        base = RenderCache.key("a.j2", "digest", {"title": "A"})
+
+        assert base == RenderCache.key("a.j2", "digest", {"title": "A"})
+        assert base != RenderCache.key("a.j2", "other", {"title": "A"})
+        assert base != RenderCache.key("a.j2", "digest", {"title": "B"})
+        assert base != RenderCache.key("b.j2", "digest", {"title": "A"})
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = RenderCache(tmp_path, max_bytes=350)
+        keys = [cache.key("t", "d", index) for index in range(3)]
+        for age, key in enumerate(keys):
+            cache.put(key, b"x" * 100)
+            path = tmp_path / key[:2] / key
+            os.utime(path, ns=(age * 10**9, age * 10**9))
+        cache.get(keys[0])  # Recently used, so kept
+
+        cache.put(cache.key("t", "d", 3), b"x" * 100)
+
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[1]) is None
+        assert cache.stats.evictions >= 1
+        assert cache.size()[1] <= 350
+
+    def test_concurrent_writers_share_entries(self, tmp_path):
+        cache = RenderCache(tmp_path)
+        keys = [cache.key("t", "d", index % 4) for index in range(64)]
+
+        def render(key):
+            return cache.get_or_render(key, lambda: key.upper())
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(render, keys))
+
+        assert results == [key.upper() for key in keys]
+        assert cache.size()[0] == 4
+        assert not list(tmp_path.rglob("*.tmp"))
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path, monkeypatch):
+        cache = RenderCache(tmp_path)
+
+        def fail(*args):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "replace", fail)
+        cache.put(cache.key("t", "d", {}), b"data")
+
+        assert not list(tmp_path.rglob("*.tmp"))
+        assert cache.stats.writes == 0
+
+
+class TestCachedRendering:
+    def test_digest_follows_included_templates(self, tmp_path):
+        (tmp_path / "base.j2").write_text("base {{ title }}")
+        (tmp_path / "page.j2").write_text('{% include "base.j2" %}')
+        env = get_environment([tmp_path])
+        before = template_digest(env, "page.j2")
+
+        (tmp_path / "base.j2").write_text("changed {{ title }}")
+        os.utime(tmp_path / "base.j2", ns=(1, 1))
+        clear_template_cache()
+        env = get_environment([tmp_path])
+
+        assert template_digest(env, "page.j2") != before
+
+    def test_dynamic_include_bypasses_cache(self, tmp_path):
+        (tmp_path / "row.j2").write_text("OLD")
+        (tmp_path / "page.j2").write_text("{% include row %}")
+        cache = RenderCache(tmp_path / "cache")
+        env = get_environment([tmp_path])
+
+        assert template_digest(env, "page.j2") is None
+        render_template(env, "page.j2", {"row": "row.j2"}, cache=cache)
+        render_template(env, "page.j2", {"row": "row.j2"}, cache=cache)
+
+        assert (cache.stats.hits, cache.stats.misses) == (0, 0)
+
+    def test_second_render_is_a_hit(self, tmp_path):
+        (tmp_path / "t.j2").write_text("Hello {{ name }}")
+        cache = RenderCache(tmp_path / "cache")
+        env = get_environment([tmp_path])
+
+        first = render_template(env, "t.j2", {"name": "A"}, cache=cache)
+        second = render_template(env, "t.j2", {"name": "A"}, cache=cache)
+
+        assert first == second == "Hello A"
+        assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    def test_readme_uses_user_cache_dir(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path / "cache"))
+        monkeypatch.delenv(RENDER_CACHE_ENV)
+
+        first = generate_readme(DATASET_CONFIG, tmp_path)
+        second = generate_readme(DATASET_CONFIG, tmp_path)
+
+        assert first == second
+        assert list((tmp_path / "cache" / "renders").rglob("*"))
@@ -0,0 +1,110 @@
+"""
+Tests for output sinks.
+"""
+
+import io
+import json
+import tarfile
+import zipfile
+
+import yaml
+
+from auto_readme.batch import run_batch
+from auto_readme.generator import write_output
+from auto_readme.integration import setup_all_integrations
+from auto_readme.sinks import (
+    JsonLinesSink,
+    MemorySink,
+    TarSink,
+    ZipSink,
+    open_sink,
+    writes_to_stdout,
+)
+from tests.fixtures.configs import DATASET_CONFIG
+
+
+class _Pipe(io.RawIOBase):
+    """A write-only, unseekable stream, like a pipe to another process."""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        self.data += b
+        return len(b)
+
+
+class TestSinks:
+    def test_write_output_into_memory(self, tmp_path):
+        sink = MemorySink()
+
+        write_output("docs/README.md", "# Title\n", tmp_path, sink=sink)
+
+        assert sink.text("docs/README.md") == "# Title\n"
+        assert not (tmp_path / "docs").exists()
+
+    def test_archives_stream_to_unseekable_output(self):
+        tar_pipe, zip_pipe = _Pipe(), _Pipe()
+        for sink in (TarSink(tar_pipe), ZipSink(zip_pipe)):
+            with sink:
+                sink.write("a/README.md", "hello\n")
+                sink.write("logo.bin", b"\x89PNG")
+
+        with tarfile.open(fileobj=io.BytesIO(tar_pipe.data), mode="r:gz") as tar:
+            assert tar.getnames() == ["a/README.md", "logo.bin"]
+            assert tar.extractfile("a/README.md").read() == b"hello\n"
+        with zipfile.ZipFile(io.BytesIO(zip_pipe.data)) as archive:
+            assert archive.read("logo.bin") == b"\x89PNG"
+
+    def test_json_lines_encode_binary_content(self):
+        stream = io.StringIO()
+        sink = JsonLinesSink(stream)
+
+        sink.write("README.md", "text")
+        sink.write("logo.png", b"\x89PNG")
+
+        records = [json.loads(line) for line in stream.getvalue().splitlines()]
+        assert records[0] == {"path": "README.md", "content": "text"}
+        assert records[1] == {"path": "logo.png", "content_base64": "iVBORw=="}
+
+    def test_open_sink_specs(self, tmp_path):
+        assert writes_to_stdout("-") and writes_to_stdout("zip:-")
+        assert not writes_to_stdout(str(tmp_path / "out.zip"))
+
+        with open_sink(str(tmp_path / "out.tar.gz")) as sink:
+            sink.write("README.md", "x")
+        with tarfile.open(tmp_path / "out.tar.gz") as tar:
+            assert tar.getnames() == ["README.md"]
+
+
+class TestSinkConsumers:
+    def test_integrations_write_to_sink_only(self, tmp_path):
+        sink = MemorySink()
+
+        setup_all_integrations(DATASET_CONFIG, tmp_path, verbose=False, sink=sink)
+
+        assert ".zenodo.json" in sink.files
+        assert list(tmp_path.iterdir()) == []
+
+    def test_batch_renders_projects_into_one_archive(self, tmp_path):
+        roots = []
+        for name in ("alpha", "beta"):
+            root = tmp_path / name
+            (root / "config").mkdir(parents=True)
+            config = {**DATASET_CONFIG, "title": name}
+            (root / "config" / "config.yaml").write_text(yaml.safe_dump(config))
+            roots.append(root)
+
+        pipe = _Pipe()
+        with ZipSink(pipe) as sink:
+            results = run_batch(roots, "generate", sink=sink)
+
+        assert all(result.ok for result in results)
+        with zipfile.ZipFile(io.BytesIO(pipe.data)) as archive:
+            names = archive.namelist()
+            assert "alpha/README.md" in names and "beta/citation.bib" in names
+            assert "alpha" in archive.read("alpha/README.md").decode()
+        assert not (roots[0] / "README.md").exists()
@@ -0,0 +1,105 @@
+"""
+Tests for template resolution and caching.
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+from jinja2 import TemplateSyntaxError
+
+from auto_readme.generator import generate_readme
+from auto_readme.template_loader import (
+    PACKAGE_TEMPLATE_DIR,
+    clear_template_cache,
+    resolve_template,
+    template_search_path,
+)
+from tests.fixtures.configs import DATASET_CONFIG
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    """Isolate cached listings and environments between tests."""
+    clear_template_cache()
+    yield
+    clear_template_cache()
+
+
+class TestTemplateSearchPath:
+    """Test the ordered template search path."""
+
+    def test_search_path_order(self, tmp_path):
+        """Test that project, org and package directories are searched in order."""
+        config = {**DATASET_CONFIG, "template_dir": "org-templates"}
+
+        search_path = template_search_path(config, tmp_path)
+
+        assert search_path == [
+            tmp_path / "templates",
+            tmp_path / "org-templates",
+            PACKAGE_TEMPLATE_DIR,
+        ]
+
+    def test_falls_back_to_package_template(self, tmp_path):
+        """Test that the bundled template is used without overrides."""
+        search_path = template_search_path(DATASET_CONFIG, tmp_path)
+
+        assert resolve_template("readme.md.j2", search_path) == (
+            PACKAGE_TEMPLATE_DIR / "readme.md.j2"
+        )
+        assert resolve_template("missing.j2", search_path) is None
+
+    def test_project_override_wins_over_org_override(self, tmp_path):
+        """Test that a project template shadows org and package templates."""
+        (tmp_path / "org").mkdir()
+        (tmp_path / "org" / "readme.md.j2").write_text("org {{ title }}")
+        config = {**DATASET_CONFIG, "template_dir": "org"}
+
+        assert generate_readme(config, tmp_path) == "org Test Dataset"
+
+        (tmp_path / "templates").mkdir()
+        (tmp_path / "templates" / "readme.md.j2").write_text("project {{ title }}")
+        os.utime(tmp_path, ns=(0, 0))
+
+        assert generate_readme(config, tmp_path) == "project Test Dataset"
+
+    def test_template_errors_are_not_hidden(self, tmp_path):
+        """Test that a broken override raises instead of falling back."""
+        (tmp_path / "templates").mkdir()
+        (tmp_path / "templates" / "readme.md.j2").write_text("{% if %}")
+
+        with pytest.raises(TemplateSyntaxError):
+            generate_readme(DATASET_CONFIG, tmp_path)
+
+
+class TestListingCache:
+    """Test per-process caching of directory listings."""
+
+    def test_missing_override_location_is_not_restatted(self, tmp_path):
+        """Test that a missing override directory is only probed once."""
+        search_path = [tmp_path / "templates", PACKAGE_TEMPLATE_DIR]
+        resolve_template("readme.md.j2", search_path)
+
+        with patch("os.stat", wraps=os.stat) as mock_stat:
+            for _ in range(10):
+                resolve_template("readme.md.j2", search_path)
+
+        statted = {str(call.args[0]) for call in mock_stat.call_args_list}
+        assert str(tmp_path / "templates") not in statted
+
+    def test_new_override_invalidates_cached_miss(self, tmp_path):
+        """Test that creating an override directory is picked up."""
+        search_path = [tmp_path / "templates", PACKAGE_TEMPLATE_DIR]
+        assert resolve_template("readme.md.j2", search_path) == (
+            PACKAGE_TEMPLATE_DIR / "readme.md.j2"
+        )
+
+        (tmp_path / "templates").mkdir()
+        (tmp_path / "templates" / "readme.md.j2").write_text("override")
+        # Make the directory change visible even on coarse mtime filesystems
+        os.utime(tmp_path, ns=(0, 0))
+
+        assert resolve_template("readme.md.j2", search_path) == (
+            tmp_path / "templates" / "readme.md.j2"
+        )